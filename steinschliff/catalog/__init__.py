@@ -1,20 +1,33 @@
 """Домен каталога структур.
 
 Задача домена:
-- выбирать сервисы по фильтру (по ключу директории или по "видимому" имени из `_meta.yaml`)
-- фильтровать структуры по condition
+- загружать каталог один раз и лениво вычислять производные данные (`Catalog`)
+- выбирать сервисы по фильтру (по ключу директории, "видимому" имени из `_meta.yaml`,
+  glob-шаблону или стране, с исправлением опечаток) через индекс `ServiceIndex`
+- фильтровать структуры по condition (по заранее разложенным корзинам условий)
 
 CLI и генератор должны быть тонкими обвязками поверх этой логики.
 """
 
+from .catalog import Catalog, clear_catalog_cache, default_config, get_catalog
 from .selection import (
+    ServiceIndex,
+    bucket_services_by_condition,
     build_service_name_to_key,
     filter_services_by_condition,
+    resolve_service_key,
     select_services,
 )
 
 __all__ = [
+    "Catalog",
+    "ServiceIndex",
+    "bucket_services_by_condition",
     "build_service_name_to_key",
+    "clear_catalog_cache",
+    "default_config",
     "filter_services_by_condition",
+    "get_catalog",
+    "resolve_service_key",
     "select_services",
 ]
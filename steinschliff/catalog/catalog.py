@@ -0,0 +1,452 @@
+"""Каталог структур как сервисный объект.
+
+`Catalog` загружает YAML-структуры и `_meta.yaml` один раз и лениво вычисляет
+производные данные (плоский список, статистику условий, поисковый индекс, порядки
+сортировки). Каждое производное значение считается не больше одного раза на объект,
+а `get_catalog` хранит по одному каталогу на директорию в пределах процесса —
+CLI-команды, сборка и встраиваемые сервисы работают с одним и тем же экземпляром.
+
+README по-прежнему рендерит `ReadmeGenerator`: `Catalog.generator_for(config)` отдаёт
+генератор, уже связанный с данными каталога (без повторной загрузки).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, overload
+
+from steinschliff.config import GeneratorConfig, SortField
+from steinschliff.export.search_index import build_search_index
+from steinschliff.generator import ReadmeGenerator
+from steinschliff.io import read_service_metadata
+from steinschliff.matching import FuzzyMatcher
+from steinschliff.models import ServiceMetadata, StructureInfo
+from steinschliff.paths import project_root
+from steinschliff.pipeline.readme import (
+    DEFAULT_READ_CONCURRENCY,
+    aload_structures_from_yaml_files,
+    discover_yaml_files,
+)
+from steinschliff.profiling.trace import span
+from steinschliff.query import Predicate, QueryIndex
+from steinschliff.recommend import RecommendIndex
+from steinschliff.snow_conditions import get_registry
+from steinschliff.sorting import SortIndex, SortSpec
+
+from .selection import ServiceIndex, bucket_services_by_condition, filter_services_by_condition
+
+# Сколько разных выборок `Catalog.select` держать в кэше (по аналогии с кэшем ответов API).
+SELECTION_CACHE_SIZE = 512
+_EMPTY_SELECTION: Mapping[str, Sequence[StructureInfo]] = MappingProxyType({})
+
+
+def default_config(schliffs_dir: str | Path, *, sort_field: SortField = "name") -> GeneratorConfig:
+    """Конфигурация генератора с путями проекта по умолчанию.
+
+    Args:
+        schliffs_dir: Директория со шлифами (относительные пути — от корня проекта).
+        sort_field: Поле сортировки.
+
+    Returns:
+        Конфигурация с README/переводами в корне проекта.
+    """
+    project_dir = project_root()
+    return GeneratorConfig(
+        schliffs_dir=(project_dir / schliffs_dir).resolve(),
+        readme_file=(project_dir / "README_en.md").resolve(),
+        readme_ru_file=(project_dir / "README.md").resolve(),
+        sort_field=sort_field,
+        translations_dir=(project_dir / "translations").resolve(),
+    )
+
+
+class locked_cached_property[T]:
+    """`cached_property`, вычисляемое под блокировкой каталога.
+
+    Один `Catalog` разделяют потоки HTTP-сервера и пул `build`; `functools.cached_property`
+    не защищает от гонки, и тяжёлые индексы строились бы по нескольку раз. После первого
+    вычисления значение лежит в `__dict__` экземпляра и читается без блокировки.
+    """
+
+    def __init__(self, func: Callable[[Catalog], T]) -> None:
+        """Обернуть функцию-геттер."""
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Запомнить имя атрибута."""
+        self.attrname = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> locked_cached_property[T]: ...
+
+    @overload
+    def __get__(self, instance: Catalog, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: Catalog | None, owner: type | None = None) -> T | locked_cached_property[T]:
+        """Вернуть закэшированное значение или вычислить его (один раз)."""
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        with instance._derived_lock:
+            if self.attrname not in cache:
+                cache[self.attrname] = self.func(instance)
+            return cache[self.attrname]
+
+
+class Catalog:
+    """Загруженный каталог с ленивыми мемоизированными производными.
+
+    Загрузка и построение производных (индексы, сортировки) потокобезопасны: производные
+    строятся один раз под блокировкой и дальше только читаются.
+    """
+
+    def __init__(self, schliffs_dir: str | Path) -> None:
+        """Создать каталог (без загрузки).
+
+        Args:
+            schliffs_dir: Директория со шлифами (относительные пути — от корня проекта).
+        """
+        self.config = default_config(schliffs_dir)
+        self.schliffs_dir = self.config.schliffs_dir
+        self._loader: ReadmeGenerator | None = None
+        self._load_lock = threading.Lock()
+        # Реентерабельная: одни производные строятся из других (condition_counts → condition_buckets).
+        self._derived_lock = threading.RLock()
+        self._sorted: dict[str, dict[str, list[StructureInfo]]] = {}
+        self._selections: dict[tuple[tuple[str, ...], tuple[str, ...], str], Mapping[str, Sequence[StructureInfo]]] = {}
+
+    @classmethod
+    async def aload(cls, schliffs_dir: str | Path, *, concurrency: int = DEFAULT_READ_CONCURRENCY) -> Catalog:
+        """Загрузить каталог из asyncio-приложения, не блокируя event loop.
+
+        Файлы читаются конкурентно (не больше `concurrency` одновременно) и разбираются
+        по мере поступления; результат совпадает с синхронным `load()`.
+
+        Args:
+            schliffs_dir: Директория со шлифами (относительные пути — от корня проекта).
+            concurrency: Максимум одновременных чтений файлов.
+
+        Returns:
+            Загруженный каталог (новый объект, кэш `get_catalog` не затрагивается).
+        """
+        catalog = cls(schliffs_dir)
+        schliffs_path = Path(catalog.schliffs_dir)
+        yaml_files = await asyncio.to_thread(discover_yaml_files, schliffs_dir=schliffs_path)
+        with span("aload_structures", files=len(yaml_files)):
+            loaded = await aload_structures_from_yaml_files(
+                yaml_files=yaml_files, schliffs_dir=schliffs_path, concurrency=concurrency
+            )
+        loader = ReadmeGenerator(catalog.config)
+        loader.services = defaultdict(list, loaded.services)
+        loader.name_to_path = loaded.name_to_path
+        with span("load_service_metadata", services=len(loaded.services)):
+            loader.service_metadata = await asyncio.to_thread(
+                read_service_metadata, str(schliffs_path), list(loaded.services)
+            )
+        catalog._loader = loader
+        return catalog
+
+    @classmethod
+    def from_snapshot(cls, schliffs_dir: str | Path, snapshot: Mapping[str, Any]) -> Catalog:
+        """Восстановить загруженный каталог из снимка `Catalog.snapshot()` (без чтения YAML).
+
+        Args:
+            schliffs_dir: Директория со шлифами, к которой относится снимок.
+            snapshot: Снимок каталога.
+
+        Returns:
+            Загруженный каталог.
+        """
+        catalog = cls(schliffs_dir)
+        loader = ReadmeGenerator(catalog.config)
+        for service, items in snapshot["services"].items():
+            loader.services[service] = [StructureInfo.model_validate(item) for item in items]
+        loader.name_to_path = dict(snapshot["name_to_path"])
+        loader.service_metadata = {
+            key: ServiceMetadata.model_validate(meta) for key, meta in snapshot["service_metadata"].items()
+        }
+        catalog._loader = loader
+        return catalog
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-совместимый снимок загруженных данных (для передачи в другой процесс).
+
+        Returns:
+            Словарь с `services`, `service_metadata` и `name_to_path`.
+        """
+        return {
+            "services": {
+                service: [s.model_dump(mode="json") for s in items] for service, items in self.services.items()
+            },
+            "service_metadata": {key: meta.model_dump(mode="json") for key, meta in self.service_metadata.items()},
+            "name_to_path": dict(self.name_to_path),
+        }
+
+    def load(self) -> Catalog:
+        """Загрузить структуры и метаданные сервисов (повторный вызов ничего не делает).
+
+        Returns:
+            Этот же каталог — для цепочек `get_catalog(...).load()`.
+        """
+        self._ensure_loaded()
+        return self
+
+    def _ensure_loaded(self) -> ReadmeGenerator:
+        loader = self._loader
+        if loader is not None:
+            return loader
+        with self._load_lock:
+            if self._loader is None:
+                loader = ReadmeGenerator(self.config)
+                loader.load_structures()
+                loader.load_service_metadata()
+                self._loader = loader
+            return self._loader
+
+    @property
+    def loaded(self) -> bool:
+        """Загружен ли каталог."""
+        return self._loader is not None
+
+    @property
+    def services(self) -> dict[str, list[StructureInfo]]:
+        """Структуры по сервисам (`service_key -> list[StructureInfo]`)."""
+        return self._ensure_loaded().services
+
+    @property
+    def service_metadata(self) -> dict[str, ServiceMetadata]:
+        """Метаданные сервисов (`service_key -> ServiceMetadata`)."""
+        return self._ensure_loaded().service_metadata
+
+    @property
+    def name_to_path(self) -> dict[str, str]:
+        """Маппинг имени структуры в путь к YAML-файлу."""
+        return self._ensure_loaded().name_to_path
+
+    @locked_cached_property
+    def structures(self) -> tuple[StructureInfo, ...]:
+        """Все структуры плоским кортежем (в порядке сервисов)."""
+        return tuple(s for items in self.services.values() for s in items)
+
+    @locked_cached_property
+    def conditions(self) -> dict[str, dict[str, Any]]:
+        """Справочник условий снега: ключ → данные из `snow_conditions/*.yaml`."""
+        registry = get_registry()
+        return {key: dict(registry.info.get(key) or {}) for key in registry.keys}
+
+    @locked_cached_property
+    def condition_buckets(self) -> Mapping[str, Mapping[str, tuple[StructureInfo, ...]]]:
+        """Структуры, разложенные по ключу условия: `condition -> (service -> структуры)`."""
+        return bucket_services_by_condition(self.services)
+
+    @locked_cached_property
+    def condition_counts(self) -> Counter[str]:
+        """Количество структур по каноническому ключу условия (без пустых условий)."""
+        return Counter(
+            {key: sum(len(items) for items in bucket.values()) for key, bucket in self.condition_buckets.items()}
+        )
+
+    @locked_cached_property
+    def service_index(self) -> ServiceIndex:
+        """Индекс сервисов: имена, страны, нечёткий поиск (см. `ServiceIndex`)."""
+        return ServiceIndex(services=self.services, service_metadata=self.service_metadata)
+
+    @property
+    def service_name_to_key(self) -> Mapping[str, str]:
+        """Маппинг “видимое имя сервиса” (lower) → ключ сервиса."""
+        return self.service_index.name_to_key
+
+    @property
+    def service_matcher(self) -> FuzzyMatcher:
+        """Нечёткий индекс имён сервисов (опечатки в `--service`, автодополнение)."""
+        return self.service_index.matcher
+
+    @locked_cached_property
+    def search_index(self) -> dict[str, Any]:
+        """Поисковый индекс (см. `steinschliff.export.search_index`)."""
+        return build_search_index(self.services)
+
+    @locked_cached_property
+    def recommend_index(self) -> RecommendIndex:
+        """Колоночный индекс для подбора структур (см. `steinschliff.recommend`)."""
+        return RecommendIndex(self.services)
+
+    @locked_cached_property
+    def query_index(self) -> QueryIndex:
+        """Индекс для многокритериальных запросов (см. `steinschliff.query`)."""
+        return QueryIndex(self.services, service_index=self.service_index)
+
+    def query(self, query: str | Sequence[Predicate]) -> Mapping[str, list[StructureInfo]]:
+        """Выполнить запрос на языке `steinschliff.query` (например, `condition:blue temp:-5`).
+
+        Args:
+            query: Текст запроса или готовые предикаты.
+
+        Returns:
+            Read-only маппинг выбранных сервисов и структур в порядке каталога.
+
+        Raises:
+            ValueError: Если запрос некорректен или значение не распознано.
+        """
+        return self.query_index.select(query)
+
+    @locked_cached_property
+    def sort_index(self) -> SortIndex:
+        """Порядки сортировки структур (см. `steinschliff.sorting`), общие для всех потребителей."""
+        return SortIndex(self.structures)
+
+    def sort_key(self, sort_field: SortSpec) -> Callable[[StructureInfo], Any]:
+        """Функция ключа сортировки структур по полю (по готовому порядку `sort_index`)."""
+        return self.sort_index.key(sort_field)
+
+    def sorted_services(self, sort_field: str) -> dict[str, list[StructureInfo]]:
+        """Структуры по сервисам, отсортированные по полю (вычисляется один раз на поле).
+
+        Args:
+            sort_field: Поле сортировки (`name`, `rating`, `country`, `temperature`); допускаются
+                несколько полей и `-` для обратного порядка (см. `steinschliff.sorting`).
+
+        Returns:
+            Новый словарь с отсортированными копиями списков.
+        """
+        cached = self._sorted.get(sort_field)
+        if cached is None:
+            with self._derived_lock:
+                cached = self._sorted.get(sort_field)
+                if cached is None:
+                    cached = self.sort_index.sort_services(self.services, sort_field)
+                    self._sorted[sort_field] = cached
+        return cached
+
+    def select(
+        self,
+        *,
+        services: Mapping[str, Sequence[StructureInfo]] | None = None,
+        service: str | Iterable[str] | None = None,
+        country: str | Iterable[str] | None = None,
+        condition: str | None = None,
+    ) -> Mapping[str, Sequence[StructureInfo]]:
+        """Выбрать сервисы (по именам, шаблонам, странам) и/или отфильтровать по условию.
+
+        Результат — read-only view без копирования списков структур. Выборки по всему
+        каталогу кэшируются по параметрам, поэтому повторный вызов (например, из сервера)
+        не пересчитывает фильтр.
+
+        Args:
+            services: Исходные сервисы (по умолчанию — весь каталог).
+            service: Ключ директории, видимое имя (допускается опечатка) или glob-шаблон;
+                можно передать несколько — выборка объединяется. Каждое имя должно
+                выбирать хотя бы один сервис из `services`.
+            country: Страна(ы) из `_meta.yaml` или glob-шаблон; пересекается с `service`.
+            condition: Канонический ключ условия.
+
+        Returns:
+            Read-only маппинг выбранных сервисов в порядке каталога.
+
+        Raises:
+            ValueError: Если сервис или страна не найдены (сервис — в том числе среди `services`).
+        """
+        names = _as_tuple(service)
+        countries = _as_tuple(country)
+        cache_key = (names, countries, (condition or "").strip().lower())
+        if services is None:
+            cached = self._selections.get(cache_key)
+            if cached is not None:
+                return cached
+
+        base = self.services if services is None else services
+        keys: set[str] | None = None
+        if names:
+            keys = set(self.service_index.resolve_many(names))
+            if services is not None:
+                self._check_in_subset(names, services)
+        if countries:
+            by_country = set(self.service_index.by_country(countries))
+            keys = by_country if keys is None else keys & by_country
+
+        selected: Mapping[str, Sequence[StructureInfo]] = base
+        if keys is not None:
+            selected = {key: items for key, items in base.items() if key in keys}
+        if cache_key[2]:
+            selected = self._filter_by_condition(selected, cache_key[2])
+
+        view = selected if isinstance(selected, MappingProxyType) else MappingProxyType(dict(selected))
+        if services is None:
+            if len(self._selections) >= SELECTION_CACHE_SIZE:
+                self._selections.clear()
+            self._selections[cache_key] = view
+        return view
+
+    def _check_in_subset(self, names: tuple[str, ...], services: Mapping[str, Sequence[StructureInfo]]) -> None:
+        """Проверить, что каждое имя (шаблон) выбирает хотя бы один сервис из `services`."""
+        for name in names:
+            if not any(key in services for key in self.service_index.resolve_many((name,))):
+                msg = f"Сервис '{name}' не найден"
+                raise ValueError(msg)
+
+    def _filter_by_condition(
+        self, selected: Mapping[str, Sequence[StructureInfo]], condition_key: str
+    ) -> Mapping[str, Sequence[StructureInfo]]:
+        """Отфильтровать выборку по условию через готовые корзины, если это списки каталога."""
+        bucket = self.condition_buckets.get(condition_key, _EMPTY_SELECTION)
+        if selected is self.services:
+            return bucket
+        if all(items is self.services.get(key) for key, items in selected.items()):
+            return {key: bucket[key] for key in selected if key in bucket}
+        return filter_services_by_condition(services=selected, condition_key=condition_key)
+
+    def generator_for(self, config: GeneratorConfig) -> ReadmeGenerator:
+        """Создать `ReadmeGenerator`, связанный с данными каталога (без повторной загрузки).
+
+        Args:
+            config: Конфигурация генератора (пути README, сортировка, переводы).
+
+        Returns:
+            Генератор с уже заполненными `services`, `name_to_path` и `service_metadata`.
+        """
+        loader = self._ensure_loaded()
+        generator = ReadmeGenerator(config)
+        generator.services = loader.services
+        generator.name_to_path = loader.name_to_path
+        generator.service_metadata = loader.service_metadata
+        generator.sort_index = self.sort_index
+        return generator
+
+
+def _as_tuple(value: str | Iterable[str] | None) -> tuple[str, ...]:
+    values = [value] if isinstance(value, str) else list(value or [])
+    return tuple(v.strip() for v in values if v and v.strip())
+
+
+_catalogs: dict[Path, Catalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(schliffs_dir: str | Path = "schliffs") -> Catalog:
+    """Получить каталог для директории (один экземпляр на директорию в пределах процесса).
+
+    Args:
+        schliffs_dir: Директория со шлифами (относительные пути — от корня проекта).
+
+    Returns:
+        Каталог (ещё не загруженный, если обращение первое).
+    """
+    key = (project_root() / schliffs_dir).resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = Catalog(key)
+        return catalog
+
+
+def clear_catalog_cache() -> None:
+    """Забыть все каталоги процесса (например, после изменения YAML на диске)."""
+    with _catalogs_lock:
+        _catalogs.clear()
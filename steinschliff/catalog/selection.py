@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import fnmatch
+from collections.abc import Iterable, Mapping, Sequence
+from types import MappingProxyType
 
+from steinschliff.matching import FuzzyMatcher, normalize_text
 from steinschliff.models import ServiceMetadata, StructureInfo
 
 
@@ -36,6 +39,164 @@ def build_service_name_to_key(
     return mapping
 
 
+def resolve_service_key(service_filter: str, name_to_key: Mapping[str, str], matcher: FuzzyMatcher) -> str:
+    """Найти ключ сервиса по имени: точно, затем с исправлением опечатки.
+
+    Args:
+        service_filter: Ключ директории или видимое имя (возможно, с опечаткой).
+        name_to_key: Маппинг из `build_service_name_to_key`.
+        matcher: Нечёткий индекс по тому же маппингу.
+
+    Returns:
+        Ключ сервиса.
+
+    Raises:
+        ValueError: Если сервис не найден или опечатка неоднозначна (в сообщении — подсказки).
+    """
+    resolved_key = name_to_key.get(service_filter.strip().lower())
+    if resolved_key is not None:
+        return resolved_key
+    match = matcher.match(service_filter)
+    if match.value is not None:
+        return match.value
+    msg = f"Сервис '{service_filter}' не найден"
+    if match.suggestions:
+        msg += f". Возможно: {', '.join(match.suggestions)}"
+    raise ValueError(msg)
+
+
+# Страны в `_meta.yaml` записаны то по-русски, то по-английски — ищем по обоим написаниям.
+COUNTRY_ALIASES: tuple[frozenset[str], ...] = (
+    frozenset({"россия", "russia"}),
+    frozenset({"австрия", "austria"}),
+    frozenset({"германия", "germany"}),
+    frozenset({"норвегия", "norway"}),
+    frozenset({"франция", "france"}),
+    frozenset({"финляндия", "finland"}),
+    frozenset({"швеция", "sweden"}),
+    frozenset({"италия", "italy"}),
+    frozenset({"швейцария", "switzerland"}),
+)
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(ch in pattern for ch in "*?[")
+
+
+class ServiceIndex:
+    """Индекс сервисов каталога: имена, страны, нечёткий поиск (строится один раз на каталог).
+
+    Attributes:
+        keys: Ключи сервисов в порядке каталога.
+        name_to_key: Маппинг из `build_service_name_to_key` (только чтение).
+        matcher: Нечёткий индекс имён сервисов.
+        countries: Нормализованная страна → ключи сервисов (только чтение).
+    """
+
+    def __init__(
+        self,
+        *,
+        services: Mapping[str, list[StructureInfo]],
+        service_metadata: Mapping[str, ServiceMetadata],
+    ) -> None:
+        """Построить индекс.
+
+        Args:
+            services: Маппинг `service_key -> list[StructureInfo]`.
+            service_metadata: Маппинг `service_key -> ServiceMetadata`.
+        """
+        self.keys: tuple[str, ...] = tuple(services)
+        self.name_to_key: Mapping[str, str] = MappingProxyType(
+            build_service_name_to_key(services=services, service_metadata=service_metadata)
+        )
+        self.matcher = FuzzyMatcher(self.name_to_key)
+
+        countries: dict[str, list[str]] = {}
+        for key in self.keys:
+            meta = service_metadata.get(key)
+            country = normalize_text(meta.country or "") if meta else ""
+            if country:
+                countries.setdefault(country, []).append(key)
+        self.countries: Mapping[str, tuple[str, ...]] = MappingProxyType(
+            {country: tuple(keys) for country, keys in countries.items()}
+        )
+        country_aliases = {country: country for country in countries}
+        for group in COUNTRY_ALIASES:
+            for country in group & countries.keys():
+                country_aliases.update(dict.fromkeys(group - countries.keys(), country))
+        self._country_matcher = FuzzyMatcher(country_aliases)
+
+    def _ordered(self, keys: Iterable[str]) -> tuple[str, ...]:
+        found = set(keys)
+        return tuple(key for key in self.keys if key in found)
+
+    def resolve(self, name: str) -> str:
+        """Ключ сервиса по имени (с исправлением опечатки, см. `resolve_service_key`)."""
+        return resolve_service_key(name, self.name_to_key, self.matcher)
+
+    def resolve_many(self, names: Iterable[str]) -> tuple[str, ...]:
+        """Ключи сервисов по именам и glob-шаблонам (`fisch*`, `*sport`).
+
+        Args:
+            names: Ключи директорий, видимые имена или шаблоны (без учёта регистра).
+
+        Returns:
+            Ключи без повторов в порядке каталога.
+
+        Raises:
+            ValueError: Если имя не найдено или шаблон ничего не выбрал.
+        """
+        keys: list[str] = []
+        for name in names:
+            if not name.strip():
+                continue
+            if not _is_glob(name):
+                keys.append(self.resolve(name))
+                continue
+            pattern = name.strip().lower()
+            matched = [key for alias, key in self.name_to_key.items() if fnmatch.fnmatchcase(alias, pattern)]
+            if not matched:
+                msg = f"Шаблону '{name}' не соответствует ни один сервис"
+                raise ValueError(msg)
+            keys.extend(matched)
+        return self._ordered(keys)
+
+    def by_country(self, countries: Iterable[str]) -> tuple[str, ...]:
+        """Ключи сервисов из указанных стран (названия как в `_meta.yaml`, допускаются шаблоны).
+
+        Args:
+            countries: Страны (по-русски или по-английски, допускается опечатка) или glob-шаблоны.
+
+        Returns:
+            Ключи без повторов в порядке каталога.
+
+        Raises:
+            ValueError: Если страна не найдена (в сообщении — подсказки).
+        """
+        keys: list[str] = []
+        for country in countries:
+            if not country.strip():
+                continue
+            if _is_glob(country):
+                pattern = normalize_text(country)
+                matched = [c for c in self.countries if fnmatch.fnmatchcase(c, pattern)]
+            else:
+                match = self._country_matcher.match(country)
+                if match.value is None:
+                    msg = f"Страна '{country}' не найдена"
+                    if match.suggestions:
+                        msg += f". Возможно: {', '.join(match.suggestions)}"
+                    msg += f". Известные: {', '.join(sorted(self.countries))}"
+                    raise ValueError(msg)
+                matched = [match.value]
+            if not matched:
+                msg = f"Шаблону '{country}' не соответствует ни одна страна"
+                raise ValueError(msg)
+            for value in matched:
+                keys.extend(self.countries[value])
+        return self._ordered(keys)
+
+
 def select_services(
     *,
     services: Mapping[str, list[StructureInfo]],
@@ -47,13 +208,18 @@ def select_services(
     Args:
         services: Все сервисы.
         service_metadata: Метаданные сервисов (для поиска по “видимому имени”).
-        service_filter: Значение фильтра (ключ директории или `meta.name`). `None`/пусто → вернуть все.
+        service_filter: Значение фильтра (ключ директории или `meta.name`, допускается опечатка).
+            `None`/пусто → вернуть все.
 
     Returns:
         Новый словарь с выбранными сервисами.
 
     Raises:
         ValueError: Если `service_filter` задан, но сервис не найден.
+
+    Note:
+        Маппинг имён строится на каждый вызов; для повторных выборок используйте
+        `Catalog.select` (индекс сервисов строится один раз на каталог).
     """
     selected_services: dict[str, list[StructureInfo]] = dict(services)
     if not service_filter:
@@ -64,19 +230,49 @@ def select_services(
         return selected_services
 
     name_to_key = build_service_name_to_key(services=services, service_metadata=service_metadata)
-    resolved_key = name_to_key.get(lookup)
-    if resolved_key is None or resolved_key not in selected_services:
+    resolved_key = resolve_service_key(service_filter, name_to_key, FuzzyMatcher(name_to_key))
+    # Сервис может быть описан в `_meta.yaml`, но не иметь ни одной загруженной структуры.
+    if resolved_key not in selected_services:
         msg = f"Сервис '{service_filter}' не найден"
         raise ValueError(msg)
 
     return {resolved_key: selected_services[resolved_key]}
 
 
+def bucket_services_by_condition(
+    services: Mapping[str, Sequence[StructureInfo]],
+) -> Mapping[str, Mapping[str, tuple[StructureInfo, ...]]]:
+    """Разложить структуры по каноническому ключу условия.
+
+    `condition` нормализуется один раз на структуру; порядок сервисов и структур внутри
+    корзины — как в `services`. Структуры без условия в корзины не попадают.
+
+    Args:
+        services: Сервисы и структуры.
+
+    Returns:
+        Read-only маппинг `condition_key -> (service_key -> кортеж структур)`: корзины
+        разделяются между потоками и выборками, поэтому изменить их нельзя.
+    """
+    buckets: dict[str, dict[str, list[StructureInfo]]] = {}
+    for service_key, structures in services.items():
+        for s in structures:
+            key = (s.condition or "").strip().lower()
+            if key:
+                buckets.setdefault(key, {}).setdefault(service_key, []).append(s)
+    return MappingProxyType(
+        {
+            key: MappingProxyType({service_key: tuple(items) for service_key, items in by_service.items()})
+            for key, by_service in buckets.items()
+        }
+    )
+
+
 def filter_services_by_condition(
     *,
-    services: Mapping[str, list[StructureInfo]],
+    services: Mapping[str, Sequence[StructureInfo]],
     condition_key: str,
-) -> dict[str, list[StructureInfo]]:
+) -> dict[str, Sequence[StructureInfo]]:
     """Отфильтровать структуры по `condition_key` (канонический key).
 
     Args:
@@ -85,12 +281,16 @@ def filter_services_by_condition(
 
     Returns:
         Новый словарь сервисов, где оставлены только структуры с подходящим `condition`.
+
+    Note:
+        Нормализует `condition` каждой структуры на каждый вызов; для каталога используйте
+        `Catalog.select(condition=...)` — он берёт готовую корзину (`Catalog.condition_buckets`).
     """
     key = (condition_key or "").strip().lower()
     if not key:
         return dict(services)
 
-    filtered: dict[str, list[StructureInfo]] = {}
+    filtered: dict[str, Sequence[StructureInfo]] = {}
     for service_key, structures in services.items():
         filtered_structures = [s for s in structures if s.condition and s.condition.strip().lower() == key]
         if filtered_structures:
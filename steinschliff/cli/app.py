@@ -7,12 +7,24 @@ from typing import Literal
 import typer
 from rich.traceback import install as rich_traceback_install
 
+from steinschliff.profiling import DEFAULT_SAMPLE_RATE_HZ
+
+from .commands.bench_serve import register as register_bench_serve
+from .commands.build import register as register_build
 from .commands.conditions import register as register_conditions
+from .commands.daemon import register as register_daemon
 from .commands.export_csv import register as register_export_csv
 from .commands.export_json import register as register_export_json
+from .commands.export_sqlite import register as register_export_sqlite
 from .commands.generate import register as register_generate
 from .commands.list_cmd import register as register_list
+from .commands.plan import register as register_plan
+from .commands.query import register as register_query
+from .commands.recommend import register as register_recommend
+from .commands.serve import register as register_serve
 from .common import run_generate, version_callback
+from .error_handler import handle_user_errors
+from .profiling import install_cpu_profiler, install_memory_profiler, install_stack_sampler, install_tracer
 
 rich_traceback_install(show_locals=True)
 
@@ -20,6 +32,7 @@ app = typer.Typer(help="Инструменты генерации README и эк
 
 
 @app.callback(invoke_without_command=True)
+@handle_user_errors
 def main(
     ctx: typer.Context,
     schliffs_dir: str = typer.Option(
@@ -68,6 +81,44 @@ def main(
         help="Только извлечь сообщения для перевода (зарезервировано)",
         rich_help_panel="Отладка",
     ),
+    profile: str | None = typer.Option(
+        None,
+        "--profile",
+        metavar="PATH",
+        help="Профилировать команду через cProfile: сохранить pstats в PATH и показать топ функций steinschliff",
+        show_default=False,
+        rich_help_panel="Отладка",
+    ),
+    sample: str | None = typer.Option(
+        None,
+        "--sample",
+        metavar="PATH",
+        help="Сэмплирующий профайлер: сохранить collapsed stacks (для flamegraph) в PATH",
+        show_default=False,
+        rich_help_panel="Отладка",
+    ),
+    sample_rate: int = typer.Option(
+        DEFAULT_SAMPLE_RATE_HZ,
+        "--sample-rate",
+        metavar="HZ",
+        min=1,
+        help="Частота сэмплирования для --sample (сэмплов в секунду процессорного времени)",
+        rich_help_panel="Отладка",
+    ),
+    trace: str | None = typer.Option(
+        None,
+        "--trace",
+        metavar="PATH",
+        help="Записать span-трассу pipeline в Chrome trace-event JSON (chrome://tracing, Perfetto)",
+        show_default=False,
+        rich_help_panel="Отладка",
+    ),
+    memprofile: bool = typer.Option(
+        False,
+        "--memprofile",
+        help="Профиль памяти (tracemalloc): пик и прирост по стадиям pipeline, топ аллокаций по модулям steinschliff",
+        rich_help_panel="Отладка",
+    ),
     _version: bool = typer.Option(
         None,
         "--version",
@@ -79,6 +130,15 @@ def main(
 ) -> None:
     """Если команда не указана — сгенерирует README и экспортирует JSON."""
     _ = extract_messages  # зарезервировано
+    if profile:
+        install_cpu_profiler(ctx, profile)
+    if sample:
+        install_stack_sampler(ctx, sample, sample_rate)
+    if trace:
+        install_tracer(ctx, trace)
+    if memprofile:
+        install_memory_profiler(ctx)
+
     if ctx.invoked_subcommand is not None:
         return
 
@@ -98,4 +158,12 @@ register_generate(app)
 register_export_json(app)
 register_list(app)
 register_export_csv(app)
+register_export_sqlite(app)
 register_conditions(app)
+register_build(app)
+register_serve(app)
+register_daemon(app)
+register_bench_serve(app)
+register_recommend(app)
+register_plan(app)
+register_query(app)
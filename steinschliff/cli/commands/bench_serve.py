@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Literal
+
+import typer
+from rich.table import Table
+
+from steinschliff.catalog import Catalog
+from steinschliff.cli.common import console
+from steinschliff.cli.error_handler import handle_user_errors
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.logging import setup_logging
+from steinschliff.server import CatalogHTTPServer
+from steinschliff.server.bench import build_query_mix, fetch_records, run_load, synthetic_snapshot
+
+
+def register(app: typer.Typer) -> None:
+    @app.command("bench-serve")
+    @handle_user_errors
+    def cmd_bench_serve(
+        qps: float = typer.Option(200.0, min=1.0, help="Частота запросов в секунду"),
+        duration: float = typer.Option(10.0, min=0.1, help="Длительность прогона, секунды"),
+        concurrency: int = typer.Option(16, min=1, help="Количество клиентских потоков"),
+        services: int = typer.Option(20, min=1, help="Сервисов в синтетическом каталоге"),
+        per_service: int = typer.Option(50, min=1, help="Структур на сервис в синтетическом каталоге"),
+        seed: int = typer.Option(0, help="Зерно для синтетического каталога и смеси запросов"),
+        url: str | None = typer.Option(
+            None,
+            help="Нагружать уже запущенный сервер (например, `steinschliff serve`) вместо локального",
+            show_default=False,
+        ),
+        gzip: bool = typer.Option(True, help="Запрашивать gzip (Accept-Encoding)"),
+        out: str = typer.Option("bench-serve.json", "--out", "-o", help="Файл с результатом в JSON"),
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
+            "WARNING", help="Уровень логирования", case_sensitive=False
+        ),
+    ) -> None:
+        """Нагрузочный прогон JSON API: пропускная способность и p50/p95/p99 задержки."""
+        setup_logging(level=getattr(logging, log_level))
+
+        server: CatalogHTTPServer | None = None
+        catalog_info: dict[str, object] = {}
+        if url is None:
+            snapshot = synthetic_snapshot(services=services, per_service=per_service, seed=seed)
+            server = CatalogHTTPServer(("127.0.0.1", 0), Catalog.from_snapshot("synthetic", snapshot))
+            threading.Thread(target=server.serve_forever, name="bench-server", daemon=True).start()
+            host, port = server.server_address[:2]
+            url = f"http://{host!s}:{port}"
+            catalog_info = {"synthetic": True, "services": services, "per_service": per_service, "seed": seed}
+
+        try:
+            try:
+                records = fetch_records(url)
+            except OSError as err:
+                msg = f"Сервер {url} недоступен: {err}"
+                raise SteinschliffUserError(msg) from err
+            except ValueError as err:
+                raise SteinschliffUserError(str(err)) from err
+            paths = build_query_mix(records, seed=seed)
+            console.print(f"[dim]Нагрузка: {qps:g} qps × {duration:g} с, {concurrency} потоков → {url}[/]")
+            result = run_load(url, paths, qps=qps, duration=duration, concurrency=concurrency, accept_gzip=gzip)
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+        result.catalog = catalog_info or {"synthetic": False, "structures": len(records)}
+
+        out_path = Path(out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(result.to_dict(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+        table = Table(title="bench-serve", header_style="bold cyan", border_style="blue")
+        table.add_column("Метрика")
+        table.add_column("Значение", justify="right", style="yellow")
+        table.add_row("Запросов", str(result.requests))
+        table.add_row("Ошибок", str(result.errors))
+        table.add_row("Пропускная способность", f"{result.throughput_qps:g} qps")
+        for name in ("p50", "p95", "p99", "max"):
+            table.add_row(f"Задержка {name}", f"{result.latency_ms[name]:.2f} мс")
+        table.add_row("Результат", str(out_path))
+        console.print(table)
+        if result.errors:
+            raise typer.Exit(code=1)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Literal
+
+import typer
+from rich.table import Table
+
+from steinschliff.catalog import get_catalog
+from steinschliff.cli.common import console, prepare_config
+from steinschliff.cli.error_handler import handle_user_errors
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.pipeline.build import BuildOutputs, parse_targets, run_build
+
+
+def register(app: typer.Typer) -> None:
+    @app.command("build")
+    @handle_user_errors
+    def cmd_build(
+        targets: str = typer.Option(
+            "readme,json", "--targets", "-t", help="Цели через запятую: readme, json, csv, sqlite (или all)"
+        ),
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+        output: str = typer.Option("README_en.md", help="Выходной README на английском"),
+        output_ru: str = typer.Option("README.md", help="Выходной README на русском"),
+        json_out: str = typer.Option("webapp/src/data/structures.json", help="Путь для JSON"),
+        csv_out: str = typer.Option("structures.csv", help="Путь для CSV"),
+        sqlite_out: str = typer.Option("catalog.db", help="Путь для SQLite-базы"),
+        sort: Literal["name", "rating", "country", "temperature"] = typer.Option(
+            "name", help="Поле сортировки", case_sensitive=False
+        ),
+        translations_dir: str = typer.Option("translations", help="Директория переводов"),
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
+            "INFO", help="Уровень логирования", case_sensitive=False
+        ),
+    ) -> None:
+        """Загрузить каталог один раз и собрать несколько артефактов параллельно."""
+        try:
+            selected = parse_targets(targets)
+        except ValueError as e:
+            raise SteinschliffUserError(str(e)) from e
+
+        logger, config = prepare_config(
+            schliffs_dir=schliffs_dir,
+            output=output,
+            output_ru=output_ru,
+            sort=sort,
+            translations_dir=translations_dir,
+            log_level=log_level,
+            create_translations=False,
+        )
+        try:
+            generator = get_catalog(config.schliffs_dir).generator_for(config)
+            results = run_build(
+                generator,
+                selected,
+                outputs=BuildOutputs(json_path=Path(json_out), csv_path=Path(csv_out), sqlite_path=Path(sqlite_out)),
+            )
+        except Exception as err:
+            logger.exception("Ошибка при сборке")
+            raise typer.Exit(code=1) from err
+
+        table = Table(title="Сборка завершена", header_style="bold cyan", border_style="green")
+        table.add_column("Цель")
+        table.add_column("Файлы", style="cyan")
+        table.add_column("Время", justify="right", style="yellow")
+        for result in results:
+            table.add_row(result.target, "\n".join(str(p) for p in result.outputs), f"{result.seconds:.2f} с")
+        console.print(table)
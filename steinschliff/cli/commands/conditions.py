@@ -6,12 +6,8 @@ from typing import Literal
 import typer
 from rich.table import Table
 
-from steinschliff.cli.common import PROJECT_ROOT, console
-from steinschliff.config import GeneratorConfig
+from steinschliff.cli.common import compute_conditions_stats, console, load_catalog
 from steinschliff.formatters import format_temperature_range
-from steinschliff.generator import ReadmeGenerator
-from steinschliff.logging import setup_logging
-from steinschliff.snow_conditions import get_condition_info, get_valid_keys
 
 
 def register(app: typer.Typer) -> None:
@@ -31,42 +27,11 @@ def register(app: typer.Typer) -> None:
         ),
     ) -> None:
         """Показать статистику по условиям снега (snow conditions)."""
-        setup_logging(level=getattr(logging, log_level))
         logger = logging.getLogger("steinschliff")
 
-        project_dir = PROJECT_ROOT
-        schliffs_abs = (project_dir / schliffs_dir).resolve()
-
-        config = GeneratorConfig(
-            schliffs_dir=schliffs_abs,
-            readme_file=(project_dir / "README_en.md").resolve(),
-            readme_ru_file=(project_dir / "README.md").resolve(),
-            sort_field="name",
-            translations_dir=(project_dir / "translations").resolve(),
-        )
-
         try:
-            generator = ReadmeGenerator(config)
-            generator.load_structures()
-
-            condition_counts: dict[str, int] = {}
-            total_structures = 0
-
-            for service_structures in generator.services.values():
-                for structure in service_structures:
-                    total_structures += 1
-                    if structure.condition:
-                        key = structure.condition.strip().lower()
-                        condition_counts[key] = condition_counts.get(key, 0) + 1
-
-            conditions_info: dict[str, dict[str, object]] = {}
-            for key in get_valid_keys():
-                info = get_condition_info(key) or {}
-                conditions_info[key] = {
-                    "name_ru": info.get("name_ru", key),
-                    "color": info.get("color", ""),
-                    "temperature": info.get("temperature"),
-                }
+            catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level)
+            total_structures, condition_counts, conditions_info = compute_conditions_stats(catalog)
 
             # Маппинг цветов на emoji (как было в исходном CLI)
             color_emoji = {
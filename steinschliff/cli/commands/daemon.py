@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
+
+import typer
+
+from steinschliff.catalog import get_catalog
+from steinschliff.cli.common import LogLevel
+from steinschliff.cli.error_handler import handle_user_errors
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.logging import setup_logging
+from steinschliff.server import CatalogReloader, DaemonServer, daemon_socket_path, snapshot_tree
+from steinschliff.server.daemon import check_socket_dir, daemon_supported, request
+from steinschliff.server.reload import DEFAULT_RELOAD_INTERVAL
+from steinschliff.ui.rich import print_kv_panel
+
+START_TIMEOUT = 30.0
+
+
+def _require_support() -> None:
+    if not daemon_supported():
+        msg = "Демон требует Unix domain sockets — на этой платформе он недоступен"
+        raise SteinschliffUserError(msg)
+
+
+def _ping(socket_path: Path) -> dict[str, object] | None:
+    try:
+        return request(socket_path, "ping", timeout=0.5)
+    except (OSError, ValueError):
+        return None
+
+
+def _run_foreground(schliffs_dir: str, reload: bool, log_level: LogLevel) -> None:
+    logger = logging.getLogger("steinschliff")
+    setup_logging(level=getattr(logging, log_level))
+    # Демон всегда читает YAML сам, а не берёт снимок у другого демона.
+    catalog = get_catalog(schliffs_dir)
+    # Снимок файлов — до загрузки: правка во время загрузки сделает каталог демона устаревшим
+    # для клиентов, а не незаметно потерянной.
+    tree = snapshot_tree(catalog.schliffs_dir)
+    catalog.load()
+    socket_path = daemon_socket_path(catalog.schliffs_dir)
+    try:
+        server = DaemonServer(socket_path, catalog, tree=tree)
+    except OSError as err:
+        raise SteinschliffUserError(str(err)) from err
+
+    reloader = CatalogReloader(catalog.schliffs_dir, server.swap_catalog, snapshot=tree) if reload else None
+    if reloader is not None:
+        reloader.start()
+    logger.info("Демон слушает %s (%d структур)", socket_path, len(catalog.structures))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Остановка демона")
+    finally:
+        if reloader is not None:
+            reloader.stop()
+        server.server_close()
+
+
+def _spawn(schliffs_dir: str, reload: bool) -> dict[str, object]:
+    socket_path = daemon_socket_path(get_catalog(schliffs_dir).schliffs_dir)
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    try:
+        check_socket_dir(socket_path.parent)
+    except OSError as err:
+        raise SteinschliffUserError(str(err)) from err
+    log_path = socket_path.with_suffix(".log")
+    command = [sys.executable, "-m", "steinschliff", "daemon", "start", "--foreground"]
+    command += ["--schliffs-dir", schliffs_dir, "--reload" if reload else "--no-reload", "--log-level", "INFO"]
+    with log_path.open("ab") as log:
+        process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True)
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = _ping(socket_path)
+        if status is not None:
+            return status
+        if process.poll() is not None:
+            break
+        time.sleep(0.1)
+    msg = f"Демон не запустился, подробности в {log_path}"
+    raise SteinschliffUserError(msg)
+
+
+def register(app: typer.Typer) -> None:
+    daemon_app = typer.Typer(help="Фоновый демон с загруженным каталогом для быстрых CLI-команд.")
+    app.add_typer(daemon_app, name="daemon")
+
+    @daemon_app.command("start")
+    @handle_user_errors
+    def cmd_daemon_start(
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+        foreground: bool = typer.Option(False, help="Работать в текущем процессе (не уходить в фон)"),
+        reload: bool = typer.Option(
+            True, help=f"Перезагружать каталог при изменении YAML (проверка каждые {DEFAULT_RELOAD_INTERVAL:g} с)"
+        ),
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
+            "INFO", help="Уровень логирования (для --foreground)", case_sensitive=False
+        ),
+    ) -> None:
+        """Запустить демон: `list`, `export-csv`, `conditions` и др. будут брать каталог из его памяти."""
+        _require_support()
+        if foreground:
+            _run_foreground(schliffs_dir, reload, log_level)
+            return
+
+        socket_path = daemon_socket_path(get_catalog(schliffs_dir).schliffs_dir)
+        status = _ping(socket_path)
+        title = "Демон уже запущен" if status is not None else "Демон запущен"
+        if status is None:
+            status = _spawn(schliffs_dir, reload)
+        print_kv_panel(title, [("PID", str(status["pid"])), ("Сокет", str(socket_path))])
+
+    @daemon_app.command("status")
+    @handle_user_errors
+    def cmd_daemon_status(
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+    ) -> None:
+        """Показать состояние демона."""
+        _require_support()
+        socket_path = daemon_socket_path(get_catalog(schliffs_dir).schliffs_dir)
+        status = _ping(socket_path)
+        if status is None:
+            print_kv_panel("Демон не запущен", [("Сокет", str(socket_path))], border_style="yellow")
+            raise typer.Exit(code=1)
+
+        def _time(value: object) -> str:
+            return datetime.fromtimestamp(float(str(value))).strftime("%Y-%m-%d %H:%M:%S")
+
+        print_kv_panel(
+            "Демон запущен",
+            [
+                ("PID", str(status["pid"])),
+                ("Сокет", str(socket_path)),
+                ("Шлифы", str(status["schliffs_dir"])),
+                ("Структур", str(status["structures"])),
+                ("Запущен", _time(status["started_at"])),
+                ("Каталог загружен", _time(status["loaded_at"])),
+            ],
+        )
+
+    @daemon_app.command("stop")
+    @handle_user_errors
+    def cmd_daemon_stop(
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+    ) -> None:
+        """Остановить демон."""
+        _require_support()
+        socket_path = daemon_socket_path(get_catalog(schliffs_dir).schliffs_dir)
+        try:
+            request(socket_path, "shutdown")
+        except (OSError, ValueError):
+            print_kv_panel("Демон не запущен", [("Сокет", str(socket_path))], border_style="yellow")
+            return
+        print_kv_panel("Демон остановлен", [("Сокет", str(socket_path))])
@@ -1,28 +1,28 @@
 from __future__ import annotations
 
-import io
 import logging
 import sys
 from pathlib import Path
 from typing import Literal
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
-import steinschliff.utils as utils_module
-from steinschliff.catalog import filter_services_by_condition, select_services
-from steinschliff.cli.common import PROJECT_ROOT, console, normalize_condition_filter, restore_stdout
+from steinschliff.cli.common import (
+    complete_condition,
+    console,
+    load_catalog,
+    maybe_silence_rich_output,
+    resolve_condition_filter,
+    tolerate_broken_pipe,
+)
 from steinschliff.cli.error_handler import handle_user_errors
-from steinschliff.config import GeneratorConfig
 from steinschliff.exceptions import SteinschliffUserError
-from steinschliff.export.csv import export_structures_csv_string
-from steinschliff.generator import ReadmeGenerator
-from steinschliff.logging import setup_logging
-from steinschliff.snow_conditions import get_valid_keys
+from steinschliff.export.csv import write_structures_csv
+from steinschliff.profiling.trace import span
 
 
-def register(app: typer.Typer) -> None:  # noqa: C901
+def register(app: typer.Typer) -> None:
     @app.command("export-csv")
     @handle_user_errors
     def cmd_export_csv(
@@ -30,11 +30,17 @@ def register(app: typer.Typer) -> None:  # noqa: C901
         sort: Literal["name", "rating", "country", "temperature"] = typer.Option(
             "temperature", help="Поле сортировки", case_sensitive=False
         ),
-        service: str | None = typer.Option(
+        service: list[str] | None = typer.Option(
             None,
             "-s",
             "--service",
-            help="Фильтр по производителю/сервису (например: Ramsau)",
+            help="Фильтр по производителю/сервису (например: Ramsau); можно повторять и задавать шаблоны (fisch*)",
+            show_default=False,
+        ),
+        country: list[str] | None = typer.Option(
+            None,
+            "--country",
+            help="Фильтр по стране производителя из _meta.yaml (например: Austria); можно повторять",
             show_default=False,
         ),
         condition: str | None = typer.Option(
@@ -43,6 +49,7 @@ def register(app: typer.Typer) -> None:  # noqa: C901
             "--condition",
             help="Фильтр по условиям снега (green, red, blue, violet, orange, yellow, pink, brown)",
             show_default=False,
+            autocompletion=complete_condition,
         ),
         output: str | None = typer.Option(
             None,
@@ -65,71 +72,31 @@ def register(app: typer.Typer) -> None:  # noqa: C901
         if output is None:
             quiet = True
 
-        setup_logging(level=getattr(logging, log_level))
         logger = logging.getLogger("steinschliff")
 
-        project_dir = PROJECT_ROOT
-        schliffs_abs = (project_dir / schliffs_dir).resolve()
-
-        config = GeneratorConfig(
-            schliffs_dir=schliffs_abs,
-            readme_file=(project_dir / "README_en.md").resolve(),
-            readme_ru_file=(project_dir / "README.md").resolve(),
-            sort_field=sort,
-            translations_dir=(project_dir / "translations").resolve(),
-        )
         try:
-            generator = ReadmeGenerator(config)
-
             # В quiet-режиме подавляем rich/progress вывод при загрузке
-            original_stdout: object | None = None
-            if quiet:
-                utils_module.console = Console(file=io.StringIO(), quiet=True)
-                original_stdout = sys.stdout
-                sys.stdout = io.StringIO()
+            maybe_silence_rich_output(quiet)
+            catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level, quiet=quiet)
 
+            normalized_condition = resolve_condition_filter(condition) if condition else None
             try:
-                generator.load_structures()
-                generator.load_service_metadata()
-            finally:
-                restore_stdout(original_stdout)
-
-            try:
-                selected_services = select_services(
-                    services=generator.services,
-                    service_metadata=generator.service_metadata,
-                    service_filter=service,
-                )
+                selected_services = catalog.select(service=service, country=country, condition=normalized_condition)
             except ValueError as e:
                 raise SteinschliffUserError(str(e)) from e
 
-            if condition:
-                normalized_condition = normalize_condition_filter(condition)
-                valid = set(get_valid_keys())
-                if not normalized_condition or normalized_condition not in valid:
-                    allowed = ", ".join(sorted(valid))
-                    msg = f"Неизвестное условие '{condition}'. Допустимые: {allowed}"
-                    raise SteinschliffUserError(msg)
-
-                selected_services = filter_services_by_condition(
-                    services=selected_services,
-                    condition_key=normalized_condition,
-                )
-                if not selected_services:
-                    console.print(Panel.fit(f"Не найдено структур с условием '{condition}'", border_style="yellow"))
-                    raise typer.Exit(code=0)
-
-            csv_content = export_structures_csv_string(
-                services=selected_services,
-                sort_key=generator._get_structure_sort_key,
-            )
+            if normalized_condition and not selected_services:
+                console.print(Panel.fit(f"Не найдено структур с условием '{condition}'", border_style="yellow"))
+                raise typer.Exit(code=0)
 
             if output:
                 output_path = Path(output)
-                output_path.write_text(csv_content, encoding="utf-8")
+                with span("export_csv", category="export"), output_path.open("w", encoding="utf-8", newline="") as f:
+                    write_structures_csv(services=selected_services, sink=f, sort_key=catalog.sort_key(sort))
                 console.print(Panel.fit(f"CSV экспортирован в [cyan]{output}[/cyan]", border_style="green"))
             else:
-                sys.stdout.write(csv_content)
+                with span("export_csv", category="export"), tolerate_broken_pipe():
+                    write_structures_csv(services=selected_services, sink=sys.stdout, sort_key=catalog.sort_key(sort))
 
         except typer.Exit:
             raise
@@ -1,18 +1,132 @@
 from __future__ import annotations
 
+import json
 import logging
+import sys
+from pathlib import Path
 from typing import Literal
 
 import typer
 from rich.panel import Panel
 from rich.table import Table
 
-from steinschliff.cli.common import PROJECT_ROOT, console
+from steinschliff.cli.common import console, load_catalog, tolerate_broken_pipe
 from steinschliff.cli.error_handler import handle_user_errors
-from steinschliff.config import GeneratorConfig
-from steinschliff.export.json import export_structures_json
-from steinschliff.generator import ReadmeGenerator
-from steinschliff.logging import setup_logging
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.export.artifacts import DEFAULT_GZIP_LEVEL, Artifact, publish_artifact
+from steinschliff.export.compact import encode_compact, export_structures_compact
+from steinschliff.export.json import (
+    export_structures_json,
+    export_structures_ndjson,
+    iter_structure_records,
+    json_dump_kwargs,
+    write_structures_ndjson,
+)
+from steinschliff.export.search_index import export_search_index
+from steinschliff.export.shards import MANIFEST_NAME, ShardBy, export_structures_sharded
+from steinschliff.models import StructureInfo
+from steinschliff.profiling.trace import span
+
+STDOUT_PATH = "-"
+
+ExportFormat = Literal["json", "ndjson", "compact"]
+
+
+def _write_stdout(services: dict[str, list[StructureInfo]], *, fmt: ExportFormat, minify: bool) -> None:
+    if fmt == "ndjson":
+        write_structures_ndjson(services=services, stream=sys.stdout)
+    elif fmt == "compact":
+        doc = encode_compact(list(iter_structure_records(services)))
+        json.dump(doc, sys.stdout, **json_dump_kwargs(minify=True))
+        sys.stdout.write("\n")
+    else:
+        json.dump(list(iter_structure_records(services)), sys.stdout, **json_dump_kwargs(minify=minify))
+        sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def _describe_artifact(artifact: Artifact) -> str:
+    files = ", ".join(f for f in (artifact.file, artifact.gzip_file) if f)
+    if artifact.unchanged:
+        return f"[dim]{files} (без изменений)[/]"
+    return f"[cyan]{files}[/]"
+
+
+def _write_file(services: dict[str, list[StructureInfo]], *, out_path: str, fmt: ExportFormat, minify: bool) -> None:
+    if fmt == "ndjson":
+        export_structures_ndjson(services=services, out_path=out_path)
+    elif fmt == "compact":
+        export_structures_compact(services=services, out_path=out_path)
+    else:
+        export_structures_json(services=services, out_path=out_path, minify=minify)
+
+
+def _check_option_conflicts(
+    *, to_stdout: bool, shard_by: str | None, fmt: ExportFormat, with_index: bool, publish: bool
+) -> None:
+    if to_stdout and shard_by:
+        msg = "--shard-by пишет набор файлов и несовместим с выводом в stdout (--out -)"
+        raise SteinschliffUserError(msg)
+    if with_index and (to_stdout or shard_by):
+        msg = "--index ссылается на позиции записей в одном файле и несовместим с --out - и --shard-by"
+        raise SteinschliffUserError(msg)
+    if publish and (to_stdout or shard_by):
+        msg = "--fingerprint и --gzip применяются только к выгрузке в один файл"
+        raise SteinschliffUserError(msg)
+    if fmt == "compact" and shard_by:
+        msg = "--shard-by поддерживает только форматы json и ndjson"
+        raise SteinschliffUserError(msg)
+
+
+def _export_shards(
+    services: dict[str, list[StructureInfo]], *, out_path: str, shard_by: ShardBy, fmt: ExportFormat, minify: bool
+) -> None:
+    shard_dir = Path(out_path).with_suffix("") / shard_by
+    with span("export_json_shards", category="export", shard_by=shard_by):
+        manifest = export_structures_sharded(
+            services=services,
+            out_dir=shard_dir,
+            shard_by=shard_by,
+            fmt="ndjson" if fmt == "ndjson" else "json",
+            minify=minify,
+        )
+    summary = Table.grid(padding=(0, 1))
+    summary.add_row("[bold]Шардов[/]:", str(len(manifest["shards"])))
+    summary.add_row("[bold]Структур[/]:", str(manifest["total"]))
+    summary.add_row("[bold]Манифест[/]:", f"[cyan]{shard_dir / MANIFEST_NAME}[/]")
+    console.print(Panel.fit(summary, title="JSON экспортирован по шардам", border_style="blue"))
+
+
+def _export_single_file(
+    services: dict[str, list[StructureInfo]],
+    *,
+    out_path: str,
+    fmt: ExportFormat,
+    minify: bool,
+    with_index: bool,
+    fingerprint: bool,
+    precompress: bool,
+) -> None:
+    with span("export_json", category="export", format=fmt):
+        _write_file(services, out_path=out_path, fmt=fmt, minify=minify)
+
+    summary = Table.grid(padding=(0, 1))
+    summary.add_row(f"[bold]{fmt.upper()}[/]:", f"[cyan]{out_path}[/]")
+    published = [Path(out_path)]
+    if with_index:
+        index_path = Path(out_path).with_suffix(".index.json")
+        with span("export_search_index", category="export"):
+            export_search_index(services=services, out_path=index_path, minify=minify)
+        summary.add_row("[bold]Индекс[/]:", f"[cyan]{index_path}[/]")
+        published.append(index_path)
+    if fingerprint or precompress:
+        with span("publish_artifacts", category="export"):
+            for path in published:
+                artifact = publish_artifact(
+                    path, fingerprint=fingerprint, gzip_level=DEFAULT_GZIP_LEVEL if precompress else None
+                )
+                summary.add_row(f"[bold]{artifact.name}[/]:", _describe_artifact(artifact))
+    console.print(Panel.fit(summary, title="JSON экспортирован", border_style="blue"))
 
 
 def register(app: typer.Typer) -> None:
@@ -21,36 +135,85 @@ def register(app: typer.Typer) -> None:
     def cmd_export_json(
         schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
         sort: Literal["name", "rating", "country", "temperature"] = typer.Option(
-            "name", help="Поле сортировки", case_sensitive=False
+            "name", help="Поле сортировки структур внутри сервиса", case_sensitive=False
+        ),
+        out_path: str = typer.Option(
+            "webapp/src/data/structures.json",
+            "--out-path",
+            "--out",
+            help="Путь для JSON ('-' — stdout)",
+        ),
+        fmt: Literal["json", "ndjson", "compact"] = typer.Option(
+            "json",
+            "--format",
+            help=(
+                "Формат: json (один массив), ndjson (одна структура на строку, потоково) "
+                "или compact (словарь строк и ссылки-индексы)"
+            ),
+            case_sensitive=False,
+        ),
+        minify: bool = typer.Option(False, "--minify", help="JSON без отступов и пробелов (compact — всегда)"),
+        shard_by: Literal["service", "country", "condition"] | None = typer.Option(
+            None,
+            "--shard-by",
+            help="Разбить выгрузку на шарды (service, country, condition) с manifest.json рядом с --out",
+            case_sensitive=False,
+            show_default=False,
+        ),
+        with_index: bool = typer.Option(
+            False,
+            "--index",
+            help="Дополнительно записать поисковый индекс (<out>.index.json): posting-списки, фасеты, температуры",
+        ),
+        fingerprint: bool = typer.Option(
+            False,
+            "--fingerprint",
+            help="Опубликовать копию с хешем в имени (structures.<hash>.json) и обновить latest.json",
+        ),
+        precompress: bool = typer.Option(
+            False, "--gzip", help="Положить рядом предсжатую копию .gz (пропускается, если содержимое не менялось)"
         ),
-        out_path: str = typer.Option("webapp/src/data/structures.json", help="Путь для JSON"),
         log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
             "INFO", help="Уровень логирования", case_sensitive=False
         ),
     ) -> None:
         """Только экспорт JSON-данных для веб-приложения."""
-        setup_logging(level=getattr(logging, log_level))
-        logger = logging.getLogger("steinschliff")
+        to_stdout = out_path == STDOUT_PATH
+        _check_option_conflicts(
+            to_stdout=to_stdout,
+            shard_by=shard_by,
+            fmt=fmt,
+            with_index=with_index,
+            publish=fingerprint or precompress,
+        )
 
-        project_dir = PROJECT_ROOT
-        schliffs_abs = (project_dir / schliffs_dir).resolve()
+        logger = logging.getLogger("steinschliff")
 
-        cfg = GeneratorConfig(
-            schliffs_dir=schliffs_abs,
-            readme_file=(project_dir / "README_en.md").resolve(),
-            readme_ru_file=(project_dir / "README.md").resolve(),
-            sort_field=sort,
-            translations_dir=(project_dir / "translations").resolve(),
-        )
         try:
-            generator = ReadmeGenerator(cfg)
-            generator.load_structures()
-            generator.load_service_metadata()
-            export_structures_json(services=generator.services, out_path=out_path)
-
-            summary = Table.grid(padding=(0, 1))
-            summary.add_row("[bold]JSON[/]:", f"[cyan]{out_path}[/]")
-            console.print(Panel.fit(summary, title="JSON экспортирован", border_style="blue"))
+            # При выводе в stdout лог и прогресс загрузки не должны попадать в данные.
+            catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level, quiet=to_stdout)
+            services = catalog.sorted_services(sort)
+
+            if to_stdout:
+                with span("export_json", category="export", format=fmt), tolerate_broken_pipe():
+                    _write_stdout(services, fmt=fmt, minify=minify)
+                return
+
+            if shard_by:
+                _export_shards(services, out_path=out_path, shard_by=shard_by, fmt=fmt, minify=minify)
+                return
+
+            _export_single_file(
+                services,
+                out_path=out_path,
+                fmt=fmt,
+                minify=minify,
+                with_index=with_index,
+                fingerprint=fingerprint,
+                precompress=precompress,
+            )
+        except typer.Exit:
+            raise
         except Exception as err:
             logger.exception("Ошибка при экспорте JSON")
             raise typer.Exit(code=1) from err
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import logging
+from typing import Literal
+
+import typer
+from rich.table import Table
+
+from steinschliff.cli.common import console, load_catalog
+from steinschliff.cli.error_handler import handle_user_errors
+from steinschliff.export.sqlite import export_catalog_sqlite
+from steinschliff.profiling.trace import span
+
+
+def register(app: typer.Typer) -> None:
+    @app.command("export-sqlite")
+    @handle_user_errors
+    def cmd_export_sqlite(
+        db_path: str = typer.Argument("catalog.db", help="Путь к SQLite-базе (перезаписывается)"),
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
+            "WARNING", help="Уровень логирования", case_sensitive=False
+        ),
+    ) -> None:
+        """Экспортировать каталог в SQLite (нормализованные таблицы, индексы, FTS5)."""
+        logger = logging.getLogger("steinschliff")
+        try:
+            catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level)
+            with span("export_sqlite", category="export"):
+                stats = export_catalog_sqlite(
+                    services=catalog.services,
+                    service_metadata=catalog.service_metadata,
+                    out_path=db_path,
+                )
+        except Exception as err:
+            logger.exception("Ошибка при экспорте SQLite")
+            raise typer.Exit(code=1) from err
+
+        table = Table(title=f"SQLite: {stats.path}", header_style="bold cyan", border_style="blue")
+        table.add_column("Таблица")
+        table.add_column("Строк", justify="right", style="yellow")
+        for name, count in stats.rows.items():
+            table.add_row(name, str(count))
+        table.add_row("structures_fts", "FTS5" if stats.fts else "[dim]недоступен[/]")
+        console.print(table)
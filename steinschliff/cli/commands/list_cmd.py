@@ -6,14 +6,10 @@ from typing import Literal
 import typer
 from rich.panel import Panel
 
-from steinschliff.catalog import filter_services_by_condition, select_services
-from steinschliff.cli.common import PROJECT_ROOT, console, normalize_condition_filter, render_table
+from steinschliff.catalog import default_config
+from steinschliff.cli.common import complete_condition, console, load_catalog, render_table, resolve_condition_filter
 from steinschliff.cli.error_handler import handle_user_errors
-from steinschliff.config import GeneratorConfig
 from steinschliff.exceptions import SteinschliffUserError
-from steinschliff.generator import ReadmeGenerator
-from steinschliff.logging import setup_logging
-from steinschliff.snow_conditions import get_valid_keys
 
 
 def register(app: typer.Typer) -> None:
@@ -24,11 +20,17 @@ def register(app: typer.Typer) -> None:
         sort: Literal["name", "rating", "country", "temperature"] = typer.Option(
             "temperature", help="Поле сортировки", case_sensitive=False
         ),
-        service: str | None = typer.Option(
+        service: list[str] | None = typer.Option(
             None,
             "-s",
             "--service",
-            help="Фильтр по производителю/сервису (например: Ramsau)",
+            help="Фильтр по производителю/сервису (например: Ramsau); можно повторять и задавать шаблоны (fisch*)",
+            show_default=False,
+        ),
+        country: list[str] | None = typer.Option(
+            None,
+            "--country",
+            help="Фильтр по стране производителя из _meta.yaml (например: Austria); можно повторять",
             show_default=False,
         ),
         condition: str | None = typer.Option(
@@ -40,61 +42,34 @@ def register(app: typer.Typer) -> None:
                 "brown или локализованные названия)"
             ),
             show_default=False,
+            autocompletion=complete_condition,
         ),
         log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
             "INFO", help="Уровень логирования", case_sensitive=False
         ),
     ) -> None:
-        """Показать таблицу шлифов. Можно отфильтровать по конкретному производителю и условиям снега."""
-        setup_logging(level=getattr(logging, log_level))
+        """Показать таблицу шлифов. Можно отфильтровать по производителям, стране и условиям снега."""
         logger = logging.getLogger("steinschliff")
 
-        project_dir = PROJECT_ROOT
-        schliffs_abs = (project_dir / schliffs_dir).resolve()
-
-        config = GeneratorConfig(
-            schliffs_dir=schliffs_abs,
-            readme_file=(project_dir / "README_en.md").resolve(),
-            readme_ru_file=(project_dir / "README.md").resolve(),
-            sort_field=sort,
-            translations_dir=(project_dir / "translations").resolve(),
-        )
         try:
-            generator = ReadmeGenerator(config)
-            generator.load_structures()
-            generator.load_service_metadata()
+            catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level)
+            generator = catalog.generator_for(default_config(schliffs_dir, sort_field=sort))
 
+            normalized_condition = resolve_condition_filter(condition) if condition else None
             try:
-                selected_services = select_services(
-                    services=generator.services,
-                    service_metadata=generator.service_metadata,
-                    service_filter=service,
-                )
+                selected_services = catalog.select(service=service, country=country, condition=normalized_condition)
             except ValueError as e:
                 raise SteinschliffUserError(str(e)) from e
 
-            normalized_condition = None
-            if condition:
-                normalized_condition = normalize_condition_filter(condition)
-                valid = set(get_valid_keys())
-                if not normalized_condition or normalized_condition not in valid:
-                    allowed = ", ".join(sorted(valid))
-                    msg = f"Неизвестное условие '{condition}'. Допустимые: {allowed}"
-                    raise SteinschliffUserError(msg)
-
-                selected_services = filter_services_by_condition(
-                    services=selected_services,
-                    condition_key=normalized_condition,
-                )
-                if not selected_services:
-                    console.print(Panel.fit(f"Не найдено структур с условием '{condition}'", border_style="yellow"))
-                    raise typer.Exit(code=0)
+            if normalized_condition and not selected_services:
+                console.print(Panel.fit(f"Не найдено структур с условием '{condition}'", border_style="yellow"))
+                raise typer.Exit(code=0)
 
             table = render_table(
                 generator=generator,
                 selected_services=selected_services,
-                filter_service=service,
-                filter_condition=normalized_condition if condition else None,
+                filter_service=", ".join([*(service or []), *(country or [])]) or None,
+                filter_condition=normalized_condition,
             )
             console.print(table)
         except Exception as err:
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Literal
+
+import typer
+from rich.table import Table
+
+from steinschliff.catalog import Catalog
+from steinschliff.cli.common import console, load_catalog
+from steinschliff.cli.error_handler import handle_user_errors
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.recommend import ForecastPlan, plan_forecast, read_forecast_csv, slot_windows
+
+MAX_WINDOWS_SHOWN = 6
+
+
+def _service_name(catalog: Catalog, service_key: str) -> str:
+    service_meta = catalog.service_metadata.get(service_key)
+    return service_meta.name if service_meta and service_meta.name else service_key
+
+
+def _format_windows(windows: list[tuple[str, str]]) -> str:
+    text = ", ".join(start if start == end else f"{start} – {end}" for start, end in windows[:MAX_WINDOWS_SHOWN])
+    if len(windows) > MAX_WINDOWS_SHOWN:
+        text += f" … ещё {len(windows) - MAX_WINDOWS_SHOWN}"
+    return text
+
+
+def _plan_to_dict(plan: ForecastPlan) -> dict[str, Any]:
+    def structure(service: str, name: object) -> dict[str, Any]:
+        return {"service": service, "name": str(name)}
+
+    return {
+        "slots": [
+            {
+                "timestamp": slot.timestamp,
+                "air": slot.query.air,
+                "snow": slot.query.snow,
+                "humidity": slot.query.humidity,
+                "snow_age": slot.query.snow_age,
+                "top": [{**structure(p.service, p.structure.name), "score": p.score} for p in picks],
+            }
+            for slot, picks in zip(plan.slots, plan.top, strict=True)
+        ],
+        "cover": [
+            {
+                **structure(c.service, c.structure.name),
+                "slots": len(c.slots),
+                "windows": [list(w) for w in slot_windows(plan.slots, c.slots)],
+            }
+            for c in plan.cover
+        ],
+    }
+
+
+def register(app: typer.Typer) -> None:
+    @app.command("plan")
+    @handle_user_errors
+    def cmd_plan(
+        forecast: str = typer.Argument(..., help="CSV прогноза: timestamp, air[, snow, humidity, snow_age]"),
+        top: int = typer.Option(3, "--top", "-n", min=1, help="Сколько лучших структур показать для каждого слота"),
+        service: list[str] | None = typer.Option(
+            None,
+            "-s",
+            "--service",
+            help="Фильтр по производителю/сервису (например: Ramsau); можно повторять и задавать шаблоны (fisch*)",
+            show_default=False,
+        ),
+        country: list[str] | None = typer.Option(
+            None,
+            "--country",
+            help="Фильтр по стране производителя из _meta.yaml (например: Austria); можно повторять",
+            show_default=False,
+        ),
+        out: str | None = typer.Option(
+            None, "--out", "-o", help="Сохранить полный план (все слоты) в JSON", show_default=False
+        ),
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
+            "WARNING", help="Уровень логирования", case_sensitive=False
+        ),
+    ) -> None:
+        """Спланировать шлифы по почасовому прогнозу: лучшие структуры по слотам и минимальный набор."""
+        try:
+            slots = read_forecast_csv(forecast)
+        except (OSError, ValueError) as e:
+            msg = f"Не удалось прочитать прогноз {forecast}: {e}"
+            raise SteinschliffUserError(msg) from e
+        if not slots:
+            msg = f"В прогнозе {forecast} нет строк"
+            raise SteinschliffUserError(msg)
+
+        catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level)
+        try:
+            selected = catalog.select(service=service, country=country)
+        except ValueError as e:
+            raise SteinschliffUserError(str(e)) from e
+
+        started = time.perf_counter()
+        plan = plan_forecast(catalog.recommend_index, slots, top=top, services=set(selected))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        # Соседние слоты с одинаковыми лучшими структурами сворачиваем в одно окно.
+        slot_table = Table(
+            title=f"🗓 Лучшие структуры по прогнозу ({len(slots)} слотов)",
+            header_style="bold cyan",
+            border_style="blue",
+        )
+        slot_table.add_column("Время")
+        slot_table.add_column("Воздух / снег", style="yellow")
+        slot_table.add_column("Структуры")
+        group_start = 0
+        for i in range(1, len(slots) + 1):
+            picks = plan.top[group_start]
+            if i < len(slots) and [p.position for p in plan.top[i]] == [p.position for p in picks]:
+                continue
+            group = slots[group_start:i]
+            airs = [slot.query.air for slot in group]
+            snows = [slot.query.snow for slot in group if slot.query.snow is not None]
+            temps = f"{min(airs):+g}…{max(airs):+g} °C" if min(airs) != max(airs) else f"{airs[0]:+g} °C"
+            if snows:
+                temps += (
+                    f" / {min(snows):+g}…{max(snows):+g} °C" if min(snows) != max(snows) else f" / {snows[0]:+g} °C"
+                )
+            slot_table.add_row(
+                _format_windows([(group[0].timestamp, group[-1].timestamp)]),
+                temps,
+                ", ".join(f"{p.structure.name} ({_service_name(catalog, p.service)}) {p.score:.2f}" for p in picks),
+            )
+            group_start = i
+        console.print(slot_table)
+
+        cover_table = Table(
+            title="🎯 Минимальный набор структур на всё окно",
+            caption=f"{len(slots)} слотов × {len(catalog.recommend_index)} структур за {elapsed_ms:.1f} мс",
+            header_style="bold cyan",
+            border_style="blue",
+        )
+        cover_table.add_column("Структура", style="bold")
+        cover_table.add_column("Сервис")
+        cover_table.add_column("Слотов", justify="right", style="bold green")
+        cover_table.add_column("Окна")
+        for pick in plan.cover:
+            cover_table.add_row(
+                str(pick.structure.name),
+                _service_name(catalog, pick.service),
+                str(len(pick.slots)),
+                _format_windows(slot_windows(plan.slots, pick.slots)),
+            )
+        console.print(cover_table)
+
+        if out:
+            out_path = Path(out)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(json.dumps(_plan_to_dict(plan), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            console.print(f"[green]План сохранён:[/] {out_path}")
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import time
+from typing import Literal
+
+import typer
+from rich.panel import Panel
+from rich.table import Table
+
+from steinschliff.catalog import default_config
+from steinschliff.cli.common import console, load_catalog, render_table
+from steinschliff.cli.error_handler import handle_user_errors
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.query import parse_query
+
+ACCESS_LABELS = {"postings": "posting-список", "scan": "проход по каталогу", "filter": "проверка кандидатов"}
+
+
+def register(app: typer.Typer) -> None:
+    @app.command("query")
+    @handle_user_errors
+    def cmd_query(
+        expression: str = typer.Argument(
+            ...,
+            help="Запрос, например: 'service:fisch* condition:blue temp:-5 tag:classic' (см. docs/commands.md)",
+        ),
+        explain: bool = typer.Option(False, "--explain", help="Показать план запроса и оценки селективности"),
+        sort: Literal["name", "rating", "country", "temperature"] = typer.Option(
+            "temperature", help="Поле сортировки", case_sensitive=False
+        ),
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
+            "WARNING", help="Уровень логирования", case_sensitive=False
+        ),
+    ) -> None:
+        """Найти структуры по нескольким условиям: сервис, страна, условие, температура, теги, тип снега, текст."""
+        catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level)
+        index = catalog.query_index
+        try:
+            steps = index.plan(parse_query(expression))
+        except ValueError as e:
+            raise SteinschliffUserError(str(e)) from e
+
+        started = time.perf_counter()
+        positions = index.execute(steps)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if explain:
+            plan_table = Table(
+                title="🧭 План запроса",
+                caption=f"{len(positions)} из {len(index)} структур за {elapsed_ms:.2f} мс",
+                header_style="bold cyan",
+                border_style="blue",
+            )
+            plan_table.add_column("#", justify="right")
+            plan_table.add_column("Предикат", style="bold")
+            plan_table.add_column("Оценка", justify="right", style="yellow")
+            plan_table.add_column("Доступ")
+            for i, step in enumerate(steps, start=1):
+                plan_table.add_row(str(i), str(step.predicate), str(step.estimate), ACCESS_LABELS[step.access])
+            console.print(plan_table)
+
+        if not positions:
+            console.print(Panel.fit(f"Не найдено структур по запросу '{expression}'", border_style="yellow"))
+            raise typer.Exit(code=0)
+
+        generator = catalog.generator_for(default_config(schliffs_dir, sort_field=sort))
+        table = render_table(
+            generator=generator, selected_services=index.group(positions), title=f"Таблица шлифов: {expression}"
+        )
+        console.print(table)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+from typing import Literal
+
+import typer
+from rich.panel import Panel
+from rich.table import Table
+
+from steinschliff.cli.common import console, load_catalog
+from steinschliff.cli.error_handler import handle_user_errors
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.formatters import format_temperature_range
+from steinschliff.recommend import RecommendQuery, recommend
+
+
+def register(app: typer.Typer) -> None:
+    @app.command("recommend")
+    @handle_user_errors
+    def cmd_recommend(
+        air: float = typer.Option(..., "--air", help="Температура воздуха, °C"),
+        snow: float | None = typer.Option(None, "--snow", help="Температура снега, °C", show_default=False),
+        humidity: Literal["very_dry", "dry", "wet", "saturated"] | None = typer.Option(
+            None, "--humidity", help="Влажность снега", case_sensitive=False, show_default=False
+        ),
+        snow_age: Literal["new", "old", "transformed"] | None = typer.Option(
+            None, "--snow-age", help="Возраст снега", case_sensitive=False, show_default=False
+        ),
+        top: int = typer.Option(3, "--top", "-n", min=1, help="Сколько структур показать в каждом сервисе"),
+        service: list[str] | None = typer.Option(
+            None,
+            "-s",
+            "--service",
+            help="Фильтр по производителю/сервису (например: Ramsau); можно повторять и задавать шаблоны (fisch*)",
+            show_default=False,
+        ),
+        country: list[str] | None = typer.Option(
+            None,
+            "--country",
+            help="Фильтр по стране производителя из _meta.yaml (например: Austria); можно повторять",
+            show_default=False,
+        ),
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
+            "WARNING", help="Уровень логирования", case_sensitive=False
+        ),
+    ) -> None:
+        """Подобрать структуры под погоду: лучшие по баллу в каждом сервисе."""
+        catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level)
+        try:
+            selected = catalog.select(service=service, country=country)
+        except ValueError as e:
+            raise SteinschliffUserError(str(e)) from e
+
+        query = RecommendQuery(air=air, snow=snow, humidity=humidity, snow_age=snow_age)
+        started = time.perf_counter()
+        results = recommend(catalog.recommend_index, query, per_service=top, services=selected)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if not results:
+            console.print(Panel.fit("Не найдено структур для выбранных сервисов", border_style="yellow"))
+            raise typer.Exit(code=0)
+
+        conditions = [f"воздух {air:+g} °C"]
+        if snow is not None:
+            conditions.append(f"снег {snow:+g} °C")
+        conditions += [value for value in (humidity, snow_age) if value]
+        table = Table(
+            title=f"🎿 Подбор структур: {', '.join(conditions)}",
+            caption=f"{sum(len(items) for items in selected.values())} структур оценено за {elapsed_ms:.1f} мс",
+            header_style="bold cyan",
+            border_style="blue",
+        )
+        table.add_column("Сервис", style="bold")
+        table.add_column("Структура")
+        table.add_column("Балл", justify="right", style="bold green")
+        table.add_column("Температура", style="yellow")
+        table.add_column("Условие")
+        table.add_column("Тип снега")
+
+        for service_key, items in results.items():
+            service_meta = catalog.service_metadata.get(service_key)
+            service_name = service_meta.name if service_meta and service_meta.name else service_key
+            for i, rec in enumerate(items):
+                structure = rec.structure
+                table.add_row(
+                    service_name if i == 0 else "",
+                    str(structure.name),
+                    f"{rec.score:.2f}",
+                    format_temperature_range(structure.temperature),
+                    structure.condition or "",
+                    structure.snow_type or "",
+                    end_section=i == len(items) - 1,
+                )
+        console.print(table)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+from typing import Literal
+
+import typer
+
+from steinschliff.cli.common import load_catalog
+from steinschliff.cli.error_handler import handle_user_errors
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.server import CatalogHTTPServer, CatalogReloader
+from steinschliff.server.api import ENDPOINTS
+from steinschliff.server.reload import DEFAULT_RELOAD_INTERVAL
+from steinschliff.ui.rich import print_kv_panel
+
+
+def register(app: typer.Typer) -> None:
+    @app.command("serve")
+    @handle_user_errors
+    def cmd_serve(
+        host: str = typer.Option("127.0.0.1", help="Адрес для прослушивания"),
+        port: int = typer.Option(8765, min=0, max=65535, help="Порт (0 — выбрать свободный)"),
+        schliffs_dir: str = typer.Option("schliffs", help="Директория с YAML-файлами"),
+        reload: bool = typer.Option(True, help="Перезагружать каталог при изменении YAML-файлов"),
+        reload_interval: float = typer.Option(
+            DEFAULT_RELOAD_INTERVAL, min=0.1, help="Период проверки файлов для --reload, секунды"
+        ),
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = typer.Option(
+            "INFO", help="Уровень логирования", case_sensitive=False
+        ),
+    ) -> None:
+        """Запустить локальный HTTP JSON API над каталогом (каталог держится в памяти)."""
+        logger = logging.getLogger("steinschliff")
+        catalog = load_catalog(schliffs_dir=schliffs_dir, log_level=log_level)
+        try:
+            server = CatalogHTTPServer((host, port), catalog)
+        except OSError as err:
+            msg = f"Не удалось открыть {host}:{port}: {err.strerror or err}"
+            raise SteinschliffUserError(msg) from err
+
+        reloader = (
+            CatalogReloader(
+                catalog.schliffs_dir, lambda loaded, _tree: server.swap_catalog(loaded), interval=reload_interval
+            )
+            if reload
+            else None
+        )
+        bound_host, bound_port = server.server_address[:2]
+        base_url = f"http://{bound_host!s}:{bound_port}"
+        print_kv_panel(
+            "Steinschliff API",
+            [
+                ("URL", base_url),
+                ("Структур", str(len(catalog.structures))),
+                ("Эндпоинты", ", ".join(ENDPOINTS)),
+                ("Перезагрузка", f"каждые {reload_interval:g} с" if reload else "выключена"),
+            ],
+        )
+
+        if reloader is not None:
+            reloader.start()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Остановка сервера")
+        finally:
+            if reloader is not None:
+                reloader.stop()
+            server.server_close()
@@ -7,8 +7,11 @@ from __future__ import annotations
 
 import io
 import logging
+import os
 import sys
 from collections import Counter
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as pkg_version
 from typing import Literal
@@ -19,14 +22,18 @@ from rich.panel import Panel
 from rich.table import Table
 
 import steinschliff.utils as utils_module
+from steinschliff.catalog import Catalog, get_catalog
 from steinschliff.config import GeneratorConfig
+from steinschliff.exceptions import SteinschliffUserError
 from steinschliff.export.json import export_structures_json
 from steinschliff.formatters import format_list_for_display, format_temperature_range
 from steinschliff.generator import ReadmeGenerator
 from steinschliff.logging import setup_logging
 from steinschliff.models import StructureInfo
 from steinschliff.paths import project_root
-from steinschliff.snow_conditions import get_condition_info, get_name_ru, get_valid_keys, normalize_condition_input
+from steinschliff.profiling.trace import span
+from steinschliff.server.daemon import fetch_catalog
+from steinschliff.snow_conditions import get_name_ru, get_registry, normalize_condition_input
 from steinschliff.ui.rich import print_kv_panel
 
 console = Console()
@@ -89,30 +96,6 @@ def prepare_config(
     return logger, config
 
 
-def build_generator(
-    *,
-    schliffs_dir: str,
-    output: str,
-    output_ru: str,
-    sort: SortField,
-    translations_dir: str,
-    log_level: LogLevel,
-    create_translations: bool,
-) -> tuple[logging.Logger, ReadmeGenerator, GeneratorConfig]:
-    """Собирает конфиг и возвращает (logger, generator, config)."""
-    logger, config = prepare_config(
-        schliffs_dir=schliffs_dir,
-        output=output,
-        output_ru=output_ru,
-        sort=sort,
-        translations_dir=translations_dir,
-        log_level=log_level,
-        create_translations=create_translations,
-    )
-    generator = ReadmeGenerator(config)
-    return logger, generator, config
-
-
 def run_generate(
     *,
     schliffs_dir: str,
@@ -124,7 +107,7 @@ def run_generate(
     create_translations: bool,
 ) -> None:
     """Общий раннер генерации README и экспорта JSON."""
-    logger, generator, config = build_generator(
+    logger, config = prepare_config(
         schliffs_dir=schliffs_dir,
         output=output,
         output_ru=output_ru,
@@ -134,8 +117,11 @@ def run_generate(
         create_translations=create_translations,
     )
     try:
-        generator.run()
-        export_structures_json(services=generator.services, out_path="webapp/src/data/structures.json")
+        with span("ReadmeGenerator.run"):
+            generator = get_catalog(config.schliffs_dir).generator_for(config)
+            generator.generate()
+        with span("export_json", category="export"):
+            export_structures_json(services=generator.services, out_path="webapp/src/data/structures.json")
 
         summary = Table.grid(padding=(0, 1))
         summary.add_row("[bold]README EN[/]:", f"[cyan]{config.readme_file}[/]")
@@ -166,7 +152,7 @@ def format_condition(condition: str | None) -> str:
 def build_table_title(
     *,
     generator: ReadmeGenerator,
-    selected_services: dict[str, list[StructureInfo]],
+    selected_services: Mapping[str, Sequence[StructureInfo]],
     filter_service: str | None = None,
     filter_condition: str | None = None,
 ) -> str:
@@ -174,17 +160,13 @@ def build_table_title(
     title_parts = ["Таблица шлифов"]
 
     if filter_service:
-        service_name = None
+        service_names = []
         for service_key in selected_services:
             service_meta = generator.service_metadata.get(service_key)
             if service_meta and service_meta.name:
-                service_name = service_meta.name
-                break
-
-        if not service_name:
-            service_name = filter_service.capitalize()
+                service_names.append(service_meta.name)
 
-        title_parts.append(service_name)
+        title_parts.append(", ".join(service_names) or filter_service.capitalize())
 
     if filter_condition:
         condition_name = format_condition(filter_condition)
@@ -197,7 +179,7 @@ def build_table_title(
 def render_table(
     *,
     generator: ReadmeGenerator,
-    selected_services: dict[str, list[StructureInfo]],
+    selected_services: Mapping[str, Sequence[StructureInfo]],
     title: str | None = None,
     filter_service: str | None = None,
     filter_condition: str | None = None,
@@ -219,8 +201,9 @@ def render_table(
     table.add_column("Температура", style="yellow")
     table.add_column("Похожие", style="green")
 
+    sort_index = generator.sort_index
     for service_key, items in selected_services.items():
-        sorted_items = sorted(items, key=generator._get_structure_sort_key)
+        sorted_items = sort_index.sort(items, generator.sort_field)
         service_meta = generator.service_metadata.get(service_key)
         visible_service = (service_meta.name or service_key) if (service_meta and service_meta.name) else service_key
         for s in sorted_items:
@@ -232,75 +215,73 @@ def render_table(
     return table
 
 
-def normalize_condition_filter(condition_input: str) -> str:
-    """Нормализует condition для фильтрации (ключи/цвета/синонимы из snow_conditions)."""
-    return normalize_condition_input(condition_input)
+def resolve_condition_filter(condition_input: str) -> str:
+    """Канонический ключ условия для `--condition` (с исправлением опечаток).
 
+    Args:
+        condition_input: Ключ, название, синоним или русское название цвета.
 
-def load_generator_for_reporting(
-    *,
-    schliffs_dir: str,
-    sort: SortField,
-    log_level: LogLevel,
-) -> ReadmeGenerator:
-    """Упрощённый билдер генератора для read-only команд (list/export-csv/conditions)."""
-    setup_logging(level=getattr(logging, log_level))
-    project_dir = PROJECT_ROOT
-    schliffs_abs = (project_dir / schliffs_dir).resolve()
+    Returns:
+        Канонический ключ условия.
 
-    config = GeneratorConfig(
-        schliffs_dir=schliffs_abs,
-        readme_file=(project_dir / "README_en.md").resolve(),
-        readme_ru_file=(project_dir / "README.md").resolve(),
-        sort_field=sort,
-        translations_dir=(project_dir / "translations").resolve(),
-    )
-    generator = ReadmeGenerator(config)
-    generator.load_structures()
-    generator.load_service_metadata()
-    return generator
+    Raises:
+        SteinschliffUserError: Если условие не распознано (в сообщении — подсказки).
+    """
+    registry = get_registry()
+    match = registry.match(condition_input)
+    if match.value is None or match.value not in registry.key_set:
+        msg = f"Неизвестное условие '{condition_input}'."
+        if match.suggestions:
+            msg += f" Возможно: {', '.join(match.suggestions)}."
+        msg += f" Допустимые: {', '.join(registry.keys)}"
+        raise SteinschliffUserError(msg)
+    if not match.exact:
+        logging.getLogger("steinschliff").info("Условие '%s' распознано как '%s'", condition_input, match.value)
+    return match.value
 
 
-def compute_conditions_stats(
-    *,
-    schliffs_dir: str,
-    log_level: LogLevel,
-) -> tuple[int, Counter[str], dict[str, dict[str, object]]]:
-    """Собирает статистику по snow conditions из YAML + справочника snow_conditions."""
-    setup_logging(level=getattr(logging, log_level))
-    project_dir = PROJECT_ROOT
-    schliffs_abs = (project_dir / schliffs_dir).resolve()
+def complete_condition(incomplete: str) -> list[str]:
+    """Автодополнение `--condition`: ключи условий по префиксу ключа, названия или синонима."""
+    return get_registry().matcher.complete(incomplete)
 
-    config = GeneratorConfig(
-        schliffs_dir=schliffs_abs,
-        readme_file=(project_dir / "README_en.md").resolve(),
-        readme_ru_file=(project_dir / "README.md").resolve(),
-        sort_field="name",
-        translations_dir=(project_dir / "translations").resolve(),
-    )
 
-    generator = ReadmeGenerator(config)
-    generator.load_structures()
+def load_catalog(*, schliffs_dir: str, log_level: LogLevel, quiet: bool = False) -> Catalog:
+    """Настроить логирование и загрузить каталог процесса (см. `get_catalog`).
+
+    Если для этой директории запущен `steinschliff daemon` и его каталог загружен из
+    текущих YAML-файлов, каталог берётся из памяти демона (без разбора YAML); иначе
+    загружается в процессе.
 
-    condition_counts: Counter[str] = Counter()
-    total_structures = 0
+    Args:
+        schliffs_dir: Директория со шлифами.
+        log_level: Уровень логирования.
+        quiet: Подавить вывод логов и прогресса загрузки в stdout (для вывода данных в stdout).
+
+    Returns:
+        Загруженный каталог.
+    """
+    _, original_stdout = maybe_silence_progress_output(quiet)
+    try:
+        setup_logging(level=getattr(logging, log_level))
+        catalog = get_catalog(schliffs_dir)
+        if catalog.loaded:
+            return catalog
+        return fetch_catalog(catalog.schliffs_dir) or catalog.load()
+    finally:
+        restore_stdout(original_stdout)
 
-    for service_structures in generator.services.values():
-        for structure in service_structures:
-            total_structures += 1
-            if structure.condition:
-                condition_counts[structure.condition.strip().lower()] += 1
 
+def compute_conditions_stats(catalog: Catalog) -> tuple[int, Counter[str], dict[str, dict[str, object]]]:
+    """Собирает статистику по snow conditions из каталога + справочника snow_conditions."""
     conditions_info: dict[str, dict[str, object]] = {}
-    for key in get_valid_keys():
-        info = get_condition_info(key) or {}
+    for key, info in catalog.conditions.items():
         conditions_info[key] = {
             "name_ru": info.get("name_ru", key),
             "color": info.get("color", ""),
             "temperature": info.get("temperature"),
         }
 
-    return total_structures, condition_counts, conditions_info
+    return len(catalog.structures), catalog.condition_counts, conditions_info
 
 
 def maybe_silence_rich_output(quiet: bool) -> None:
@@ -324,3 +305,18 @@ def maybe_silence_progress_output(quiet: bool) -> tuple[io.StringIO | None, obje
 def restore_stdout(original_stdout: object | None) -> None:
     if original_stdout is not None:
         sys.stdout = original_stdout  # type: ignore[assignment]
+
+
+@contextmanager
+def tolerate_broken_pipe() -> Iterator[None]:
+    """Молча завершить команду, если читатель stdout закрыл канал (`... | head`).
+
+    Остаток вывода перенаправляется в `/dev/null`, чтобы интерпретатор не падал
+    на финальном flush stdout.
+    """
+    try:
+        yield
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        raise typer.Exit(code=0) from None
@@ -0,0 +1,171 @@
+"""Подключение профайлеров к CLI.
+
+Глобальные опции профилирования обрабатываются в callback приложения: профайлер
+запускается до подкоманды, а останавливается при закрытии контекста Click — то есть
+после завершения подкоманды (в том числе через `typer.Exit` или исключение).
+
+Отчёты печатаются в stderr, чтобы не смешиваться с выводом команд в stdout
+(например, `export-csv` без `--output`).
+"""
+
+from __future__ import annotations
+
+import sys
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from steinschliff.profiling import CommandProfiler, MemoryProfiler, StackSampler
+from steinschliff.profiling.trace import span, start_tracing, stop_tracing
+
+err_console = Console(stderr=True)
+
+_COMMAND_SPAN_META_KEY = "steinschliff.command_span"
+
+
+def _enter_command_span(ctx: typer.Context) -> None:
+    """Обернуть всю команду в корневой span `cli:<подкоманда>` (один раз на вызов CLI)."""
+    if ctx.meta.get(_COMMAND_SPAN_META_KEY):
+        return
+    ctx.meta[_COMMAND_SPAN_META_KEY] = True
+    ctx.with_resource(span(f"cli:{ctx.invoked_subcommand or 'generate'}", category="cli"))
+
+
+def install_cpu_profiler(ctx: typer.Context, out_path: str) -> None:
+    """Запустить cProfile для текущего вызова CLI.
+
+    Args:
+        ctx: Контекст корневой команды (callback приложения).
+        out_path: Путь для pstats-дампа.
+    """
+    profiler = CommandProfiler(out_path)
+
+    def _finish() -> None:
+        profiler.stop()
+        profiler.report(sys.stderr)
+        err_console.print(Panel.fit(f"pstats сохранён в [cyan]{profiler.out_path}[/cyan]", border_style="magenta"))
+
+    ctx.call_on_close(_finish)
+    profiler.start()
+
+
+def install_stack_sampler(ctx: typer.Context, out_path: str, rate_hz: int) -> None:
+    """Запустить сэмплирующий профайлер (collapsed stacks для flamegraph).
+
+    Args:
+        ctx: Контекст корневой команды (callback приложения).
+        out_path: Путь для collapsed stacks.
+        rate_hz: Частота сэмплирования.
+    """
+    sampler = StackSampler(out_path, rate_hz=rate_hz)
+
+    def _finish() -> None:
+        sampler.stop()
+        err_console.print(
+            Panel.fit(
+                f"Сэмплов: [bold]{sampler.samples}[/bold] ({rate_hz} Гц), "
+                f"накладные расходы: [bold]{sampler.overhead:.2%}[/bold]\n"
+                f"collapsed stacks сохранены в [cyan]{sampler.out_path}[/cyan]",
+                title="Сэмплирующий профайлер",
+                border_style="magenta",
+            )
+        )
+
+    ctx.call_on_close(_finish)
+    sampler.start()
+
+
+def install_tracer(ctx: typer.Context, out_path: str) -> None:
+    """Включить span-трассировку и сохранить её в Chrome trace-event JSON.
+
+    Вся команда оборачивается в корневой span `cli:<подкоманда>`.
+
+    Args:
+        ctx: Контекст корневой команды (callback приложения).
+        out_path: Путь для trace JSON.
+    """
+    start_tracing()
+
+    def _finish() -> None:
+        recorder = stop_tracing()
+        if recorder is None:
+            return
+        written = recorder.write(out_path)
+        err_console.print(
+            Panel.fit(
+                f"Событий: [bold]{len(recorder.events)}[/bold]\ntrace сохранён в [cyan]{written}[/cyan] "
+                "(chrome://tracing, ui.perfetto.dev)",
+                title="Трассировка",
+                border_style="magenta",
+            )
+        )
+
+    # Ресурсы контекста закрываются в обратном порядке: сначала span команды, затем запись трассы.
+    ctx.call_on_close(_finish)
+    _enter_command_span(ctx)
+
+
+def _format_bytes(value: int) -> str:
+    sign = "-" if value < 0 else ""
+    size = float(abs(value))
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GiB"
+
+
+def _print_memory_report(profiler: MemoryProfiler) -> None:
+    stages = Table(title="Память по стадиям", header_style="bold cyan", border_style="magenta")
+    stages.add_column("Стадия")
+    stages.add_column("Пик", justify="right", style="yellow")
+    stages.add_column("Прирост", justify="right")
+    stages.add_column("На выходе", justify="right")
+    for stage in sorted(profiler.stages, key=lambda s: s.order):
+        growth_style = "red" if stage.growth_bytes > 0 else "green"
+        stages.add_row(
+            "  " * stage.depth + stage.name,
+            _format_bytes(stage.peak_bytes),
+            f"[{growth_style}]{_format_bytes(stage.growth_bytes)}[/{growth_style}]",
+            _format_bytes(stage.end_bytes),
+        )
+
+    modules = Table(
+        title=f"Живые аллокации по модулям (снимок после «{profiler.peak_snapshot_stage}»)",
+        header_style="bold cyan",
+        border_style="magenta",
+    )
+    modules.add_column("Модуль")
+    modules.add_column("Объём", justify="right", style="yellow")
+    for module, size in profiler.module_totals():
+        modules.add_row(module, _format_bytes(size))
+
+    sites = Table(title="Топ мест аллокаций", header_style="bold cyan", border_style="magenta")
+    sites.add_column("Место")
+    sites.add_column("Объём", justify="right", style="yellow")
+    sites.add_column("Блоков", justify="right")
+    for site in profiler.top_sites():
+        sites.add_row(site.location, _format_bytes(site.size_bytes), str(site.blocks))
+
+    err_console.print(stages)
+    err_console.print(modules)
+    err_console.print(sites)
+
+
+def install_memory_profiler(ctx: typer.Context) -> None:
+    """Включить профиль памяти по стадиям pipeline (tracemalloc).
+
+    Args:
+        ctx: Контекст корневой команды (callback приложения).
+    """
+    profiler = MemoryProfiler()
+
+    def _finish() -> None:
+        profiler.stop()
+        _print_memory_report(profiler)
+
+    ctx.call_on_close(_finish)
+    profiler.start()
+    _enter_command_span(ctx)
@@ -1,6 +1,22 @@
-"""Экспорт данных проекта в машинно-читаемые форматы (JSON/CSV)."""
+"""Экспорт данных проекта в машинно-читаемые форматы (JSON/CSV/SQLite)."""
 
-from .csv import export_structures_csv_string
-from .json import export_structures_json
+from .compact import decode_compact, encode_compact, export_structures_compact
+from .csv import export_structures_csv_string, write_structures_csv
+from .json import export_structures_json, export_structures_ndjson
+from .search_index import build_search_index, export_search_index
+from .shards import export_structures_sharded
+from .sqlite import export_catalog_sqlite
 
-__all__ = ["export_structures_csv_string", "export_structures_json"]
+__all__ = [
+    "build_search_index",
+    "decode_compact",
+    "encode_compact",
+    "export_catalog_sqlite",
+    "export_search_index",
+    "export_structures_compact",
+    "export_structures_csv_string",
+    "export_structures_json",
+    "export_structures_ndjson",
+    "export_structures_sharded",
+    "write_structures_csv",
+]
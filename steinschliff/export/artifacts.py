@@ -0,0 +1,130 @@
+"""Статические артефакты экспорта для деплоя: хешированные имена и `.gz`.
+
+Для долгого кэширования на статическом хостинге файл выгрузки дополнительно
+публикуется под именем с хешем содержимого (`structures.<hash>.json`), рядом кладётся
+предсжатая копия (`.gz`, stdlib `gzip`, детерминированно — без mtime), а в
+`latest.json` той же директории фиксируется, какой файл сейчас актуален.
+
+Если хеш содержимого совпадает с записанным в `latest.json` и файлы на месте,
+повторная запись и сжатие пропускаются.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+LATEST_MANIFEST_NAME = "latest.json"
+DEFAULT_GZIP_LEVEL = 9
+FINGERPRINT_LENGTH = 12
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """Опубликованный артефакт.
+
+    Attributes:
+        name: Логическое имя (имя исходного файла, например `structures.json`).
+        file: Имя публикуемого файла (с хешем, если включён fingerprint).
+        gzip_file: Имя предсжатой копии или `None`.
+        sha256: Хеш содержимого.
+        size: Размер исходного содержимого, байт.
+        gzip_size: Размер сжатой копии, байт (или `None`).
+        unchanged: Содержимое не изменилось — запись и сжатие пропущены.
+    """
+
+    name: str
+    file: str
+    gzip_file: str | None
+    sha256: str
+    size: int
+    gzip_size: int | None
+    unchanged: bool = False
+
+
+def fingerprinted_name(path: Path, digest: str) -> str:
+    """Имя файла с хешем перед расширением: `structures.json` → `structures.<hash>.json`."""
+    return f"{path.stem}.{digest[:FINGERPRINT_LENGTH]}{path.suffix}"
+
+
+def read_latest_manifest(directory: Path) -> dict[str, Any]:
+    """Прочитать `latest.json` (или вернуть пустой манифест)."""
+    path = directory / LATEST_MANIFEST_NAME
+    if not path.exists():
+        return {"artifacts": {}}
+    with path.open(encoding="utf-8") as f:
+        data: dict[str, Any] = json.load(f)
+    data.setdefault("artifacts", {})
+    return data
+
+
+def publish_artifact(
+    source: str | Path,
+    *,
+    fingerprint: bool = True,
+    gzip_level: int | None = DEFAULT_GZIP_LEVEL,
+) -> Artifact:
+    """Опубликовать уже записанный файл выгрузки как статический артефакт.
+
+    Исходный файл остаётся на месте; хешированная копия и `.gz` кладутся рядом,
+    запись в `latest.json` обновляется.
+
+    Args:
+        source: Путь к файлу выгрузки.
+        fingerprint: Публиковать под именем с хешем содержимого.
+        gzip_level: Уровень сжатия для `.gz` (1–9) или `None`, чтобы не сжимать.
+
+    Returns:
+        Описание артефакта.
+    """
+    src = Path(source)
+    directory = src.parent
+    payload = src.read_bytes()
+    digest = hashlib.sha256(payload).hexdigest()
+
+    file_name = fingerprinted_name(src, digest) if fingerprint else src.name
+    gzip_name = f"{file_name}.gz" if gzip_level is not None else None
+    target = directory / file_name
+    gzip_target = directory / gzip_name if gzip_name else None
+
+    manifest = read_latest_manifest(directory)
+    previous = manifest["artifacts"].get(src.name, {})
+    unchanged = (
+        previous.get("sha256") == digest
+        and previous.get("file") == file_name
+        and previous.get("gzip_file") == gzip_name
+        and target.exists()
+        and (gzip_target is None or gzip_target.exists())
+    )
+
+    if unchanged:
+        gzip_size = previous.get("gzip_size")
+    else:
+        if target != src:
+            target.write_bytes(payload)
+        gzip_size = None
+        if gzip_target is not None and gzip_level is not None:
+            compressed = gzip.compress(payload, compresslevel=gzip_level, mtime=0)
+            gzip_target.write_bytes(compressed)
+            gzip_size = len(compressed)
+
+    artifact = Artifact(
+        name=src.name,
+        file=file_name,
+        gzip_file=gzip_name,
+        sha256=digest,
+        size=len(payload),
+        gzip_size=gzip_size,
+        unchanged=unchanged,
+    )
+    if not unchanged:
+        entry = asdict(artifact)
+        del entry["name"], entry["unchanged"]
+        manifest["artifacts"][src.name] = entry
+        with (directory / LATEST_MANIFEST_NAME).open("w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return artifact
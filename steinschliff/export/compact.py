@@ -0,0 +1,151 @@
+"""Компактный JSON-экспорт со словарём строк.
+
+В “плоском” экспорте в каждой записи повторяются `service`, `country`, `snow_type`,
+теги и длинные префиксы `file_path`. Компактный формат хранит каждую строку один раз
+в общей таблице `strings`, а записи — как массивы в порядке `fields`, где строки
+заменены целочисленными ссылками:
+
+```json
+{"format": "steinschliff-compact", "version": 1,
+ "fields": ["name", "service", ...], "strings": ["Fischer", ...],
+ "records": [[12, 0, 3, 5, -5.0, -15.0, [7, 9], [], [], [], [14, 15]], ...]}
+```
+
+- строковые поля и элементы списков — индексы в `strings` (`null` остаётся `null`)
+- числа (`temp_min`/`temp_max`) хранятся как есть
+- `file_path` — пара `[директория, имя файла]`, обе части — ссылки на строки
+
+Таблица строк упорядочена по частоте: самые частые значения получают короткие индексы.
+Документ всегда пишется без пробелов и отступов.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from steinschliff.models import StructureInfo
+
+from .json import iter_structure_records
+
+COMPACT_FORMAT = "steinschliff-compact"
+COMPACT_VERSION = 1
+
+STRING_FIELDS = ("name", "service", "country", "snow_type")
+NUMBER_FIELDS = ("temp_min", "temp_max")
+LIST_FIELDS = ("tags", "similars", "features", "images")
+PATH_FIELD = "file_path"
+FIELDS = (*STRING_FIELDS, *NUMBER_FIELDS, *LIST_FIELDS, PATH_FIELD)
+
+
+def _split_path(value: object) -> tuple[str, str] | None:
+    if value is None:
+        return None
+    directory, _, name = str(value).rpartition("/")
+    return directory, name
+
+
+def _join_path(directory: str, name: str) -> str:
+    return f"{directory}/{name}" if directory else name
+
+
+def _record_strings(record: Mapping[str, Any]) -> list[str]:
+    strings = [str(record[field]) for field in STRING_FIELDS if record[field] is not None]
+    for field in LIST_FIELDS:
+        strings.extend(str(item) for item in record[field])
+    path = _split_path(record[PATH_FIELD])
+    if path is not None:
+        strings.extend(path)
+    return strings
+
+
+def encode_compact(records: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+    """Закодировать “плоские” записи в компактный формат.
+
+    Args:
+        records: Записи в формате `structure_record`.
+
+    Returns:
+        Компактный документ (`format`, `version`, `fields`, `strings`, `records`).
+    """
+    frequency: Counter[str] = Counter()
+    for record in records:
+        frequency.update(_record_strings(record))
+    strings = [value for value, _ in frequency.most_common()]
+    index = {value: i for i, value in enumerate(strings)}
+
+    def ref(value: object) -> int | None:
+        return None if value is None else index[str(value)]
+
+    encoded: list[list[Any]] = []
+    for record in records:
+        row: list[Any] = [ref(record[field]) for field in STRING_FIELDS]
+        row.extend(record[field] for field in NUMBER_FIELDS)
+        row.extend([index[str(item)] for item in record[field]] for field in LIST_FIELDS)
+        path = _split_path(record[PATH_FIELD])
+        row.append(None if path is None else [index[path[0]], index[path[1]]])
+        encoded.append(row)
+
+    return {
+        "format": COMPACT_FORMAT,
+        "version": COMPACT_VERSION,
+        "fields": list(FIELDS),
+        "strings": strings,
+        "records": encoded,
+    }
+
+
+def decode_compact(doc: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Раскодировать компактный документ обратно в “плоские” записи.
+
+    Args:
+        doc: Документ, полученный из `encode_compact`.
+
+    Returns:
+        Записи в формате `structure_record`.
+
+    Raises:
+        ValueError: Если формат или версия документа не поддерживаются.
+    """
+    if doc.get("format") != COMPACT_FORMAT or doc.get("version") != COMPACT_VERSION:
+        msg = f"Неподдерживаемый компактный формат: {doc.get('format')!r} v{doc.get('version')!r}"
+        raise ValueError(msg)
+
+    strings: list[str] = doc["strings"]
+    fields: list[str] = doc["fields"]
+    records: list[dict[str, Any]] = []
+    for row in doc["records"]:
+        record: dict[str, Any] = {}
+        for field, value in zip(fields, row, strict=True):
+            if field in NUMBER_FIELDS:
+                record[field] = value
+            elif field in LIST_FIELDS:
+                record[field] = [strings[i] for i in value]
+            elif field == PATH_FIELD:
+                record[field] = None if value is None else _join_path(strings[value[0]], strings[value[1]])
+            else:
+                record[field] = None if value is None else strings[value]
+        records.append(record)
+    return records
+
+
+def export_structures_compact(*, services: Mapping[str, Sequence[StructureInfo]], out_path: str) -> dict[str, Any]:
+    """Экспортировать структуры в компактный JSON (без отступов).
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]`.
+        out_path: Путь выходного файла.
+
+    Returns:
+        Записанный компактный документ.
+    """
+    doc = encode_compact(list(iter_structure_records(services)))
+
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, separators=(",", ":"))
+    return doc
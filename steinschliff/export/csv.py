@@ -1,20 +1,24 @@
 """Экспорт структур в CSV.
 
 Функции этого модуля не читают YAML напрямую: на вход подаются уже
-сформированные `StructureInfo`.
+сформированные `StructureInfo`. Основной API — потоковый `write_structures_csv`;
+`export_structures_csv_string` оставлен для случаев, когда нужна строка целиком.
 """
 
 from __future__ import annotations
 
 import csv
 import io
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, TextIO
 
 from steinschliff.formatters import format_list_for_display, format_temperature_range
 from steinschliff.models import StructureInfo
 from steinschliff.snow_conditions import get_name_ru
 
+CSV_HEADER = ("Сервис", "Имя", "Тип снега", "Условия", "Температура", "Похожие")
+DEFAULT_FLUSH_EVERY = 256
+
 
 def _format_condition(condition: str | None) -> str:
     """Отформатировать условие снега для CSV.
@@ -36,42 +40,68 @@ def _format_condition(condition: str | None) -> str:
     return name_ru or key.capitalize()
 
 
-def export_structures_csv_string(
+def write_structures_csv(
     *,
-    services: dict[str, list[StructureInfo]],
+    services: Mapping[str, Sequence[StructureInfo]],
+    sink: TextIO,
     sort_key: Callable[[StructureInfo], Any] | None = None,
-) -> str:
-    """Экспортировать структуры в CSV и вернуть содержимое как строку.
+    flush_every: int = DEFAULT_FLUSH_EVERY,
+) -> int:
+    """Записать структуры в CSV построчно в текстовый поток.
+
+    Строки пишутся по мере обхода сервисов, без промежуточного буфера со всем CSV;
+    каждые `flush_every` строк поток сбрасывается, чтобы читатель (`| head`) получал
+    данные сразу.
 
     Args:
         services: Маппинг `service_key -> list[StructureInfo]`.
+        sink: Текстовый поток (файл, stdout, `io.StringIO`). Для файлов — открывать с `newline=""`.
         sort_key: Необязательная функция ключа сортировки внутри сервиса.
+        flush_every: Через сколько строк вызывать `sink.flush()` (`0` — не сбрасывать).
 
     Returns:
-        CSV в виде строки (с заголовком).
+        Количество записанных строк данных (без заголовка).
     """
-    csv_buffer = io.StringIO()
-    writer = csv.writer(csv_buffer)
-
-    writer.writerow(["Сервис", "Имя", "Тип снега", "Условия", "Температура", "Похожие"])
+    writer = csv.writer(sink)
+    writer.writerow(CSV_HEADER)
 
+    rows = 0
     for service_key, service_items in services.items():
         sorted_items = sorted(service_items, key=sort_key) if sort_key is not None else service_items
 
         for s in sorted_items:
-            temp_str = format_temperature_range(s.temperature)
-            similars_str = format_list_for_display(s.similars)
-            condition_str = _format_condition(s.condition)
-
             writer.writerow(
                 [
                     (s.service.name if s.service and s.service.name else service_key) or service_key,
                     str(s.name),
                     s.snow_type or "",
-                    condition_str,
-                    temp_str,
-                    similars_str,
+                    _format_condition(s.condition),
+                    format_temperature_range(s.temperature),
+                    format_list_for_display(s.similars),
                 ]
             )
+            rows += 1
+            if flush_every and rows % flush_every == 0:
+                sink.flush()
+
+    sink.flush()
+    return rows
 
+
+def export_structures_csv_string(
+    *,
+    services: dict[str, list[StructureInfo]],
+    sort_key: Callable[[StructureInfo], Any] | None = None,
+) -> str:
+    """Экспортировать структуры в CSV и вернуть содержимое как строку.
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]`.
+        sort_key: Необязательная функция ключа сортировки внутри сервиса.
+
+    Returns:
+        CSV в виде строки (с заголовком).
+    """
+    csv_buffer = io.StringIO()
+    write_structures_csv(services=services, sink=csv_buffer, sort_key=sort_key, flush_every=0)
     return csv_buffer.getvalue()
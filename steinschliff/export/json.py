@@ -1,44 +1,121 @@
 """Экспорт структур в JSON (для webapp).
 
 Формат JSON соответствует ожиданиям фронтенда и содержит “плоский” список структур.
+
+Поддерживаются два варианта вывода:
+- `json` — один JSON-массив (документ целиком, с отступами)
+- `json --minify` — тот же массив без отступов и пробелов
+- `ndjson` — по одной структуре на строку; записи пишутся по мере обхода `services`,
+  поэтому память не зависит от размера выгрузки, а вывод можно сразу передавать в `jq`
 """
 
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import Any, TextIO
 
 from steinschliff.models import StructureInfo
 
 
-def export_structures_json(*, services: dict[str, list[StructureInfo]], out_path: str) -> None:
-    """Экспортировать структуры в JSON (для webapp).
+def structure_record(service: str, s: StructureInfo) -> dict[str, object]:
+    """Собрать “плоскую” запись структуры для JSON-экспорта.
+
+    Args:
+        service: Ключ сервиса (имя папки) — используется, если в структуре нет `service.name`.
+        s: Структура.
+
+    Returns:
+        Словарь с полями, которые ожидает фронтенд.
+    """
+    tr = s.temperature[0] if s.temperature else None
+    return {
+        "name": s.name,
+        "service": (s.service.name if s.service else service) or service,
+        "country": s.country or "",
+        "snow_type": (s.snow_type or "").strip(),
+        "temp_min": tr.get("min") if tr else None,
+        "temp_max": tr.get("max") if tr else None,
+        "tags": [t for t in (s.tags or []) if t],
+        "similars": [x for x in (s.similars or []) if x],
+        "features": [x for x in (s.features or []) if x],
+        "images": s.images or [],
+        "file_path": s.file_path,
+    }
+
+
+def iter_structure_records(services: Mapping[str, Sequence[StructureInfo]]) -> Iterator[dict[str, object]]:
+    """Лениво обойти сервисы и выдать “плоские” записи структур по одной.
 
     Args:
         services: Маппинг `service_key -> list[StructureInfo]`.
-        out_path: Путь выходного файла.
+
+    Yields:
+        Записи в порядке сервисов и структур внутри них.
     """
-    flat: list[dict[str, object]] = []
     for service, items in services.items():
         for s in items:
-            tr = s.temperature[0] if s.temperature else None
-            flat.append(
-                {
-                    "name": s.name,
-                    "service": (s.service.name if s.service else service) or service,
-                    "country": s.country or "",
-                    "snow_type": (s.snow_type or "").strip(),
-                    "temp_min": tr.get("min") if tr else None,
-                    "temp_max": tr.get("max") if tr else None,
-                    "tags": [t for t in (s.tags or []) if t],
-                    "similars": [x for x in (s.similars or []) if x],
-                    "features": [x for x in (s.features or []) if x],
-                    "images": s.images or [],
-                    "file_path": s.file_path,
-                }
-            )
+            yield structure_record(service, s)
+
+
+def write_structures_ndjson(*, services: Mapping[str, Sequence[StructureInfo]], stream: TextIO) -> int:
+    """Записать структуры в поток в формате NDJSON (одна структура на строку).
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]`.
+        stream: Текстовый поток (файл или stdout).
+
+    Returns:
+        Количество записанных структур.
+    """
+    count = 0
+    for record in iter_structure_records(services):
+        stream.write(json.dumps(record, ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def export_structures_ndjson(*, services: Mapping[str, Sequence[StructureInfo]], out_path: str) -> int:
+    """Экспортировать структуры в NDJSON-файл.
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]`.
+        out_path: Путь выходного файла.
+
+    Returns:
+        Количество записанных структур.
+    """
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", encoding="utf-8") as f:
+        return write_structures_ndjson(services=services, stream=f)
+
+
+def json_dump_kwargs(*, minify: bool) -> dict[str, Any]:
+    """Параметры `json.dump` для читаемого или минифицированного вывода."""
+    if minify:
+        return {"ensure_ascii": False, "separators": (",", ":")}
+    return {"ensure_ascii": False, "indent": 2}
+
+
+def export_structures_json(
+    *,
+    services: Mapping[str, Sequence[StructureInfo]],
+    out_path: str,
+    minify: bool = False,
+) -> None:
+    """Экспортировать структуры в JSON (для webapp).
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]`.
+        out_path: Путь выходного файла.
+        minify: Писать без отступов и пробелов между токенами.
+    """
+    flat = list(iter_structure_records(services))
 
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
     with out.open("w", encoding="utf-8") as f:
-        json.dump(flat, f, ensure_ascii=False, indent=2)
+        json.dump(flat, f, **json_dump_kwargs(minify=minify))
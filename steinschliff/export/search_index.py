@@ -0,0 +1,118 @@
+"""Предрассчитанный поисковый индекс для фильтрации в webapp.
+
+Индекс строится из тех же `StructureInfo`, что и JSON-экспорт, и ссылается на записи
+по их позиции в выгрузке (`json`, `ndjson` и `compact` пишут записи в одном порядке).
+Фронтенду не нужно сканировать весь список: фильтр — это пересечение posting-списков,
+температура — бинарный поиск по отсортированным концам диапазонов, автодополнение —
+бинарный поиск по отсортированным именам.
+
+Структура документа:
+- `postings` — `{группа: {значение: [id, ...]}}` для `tags`, `snow_type`, `condition`, `service`
+- `facets` — `{группа: {значение: количество}}`
+- `temperature` — `lo`/`hi`: пары `[градусы, id]`, отсортированные по градусам
+- `names` — пары `[ключ, id]`, отсортированные по ключу (`casefold` имени)
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from steinschliff.models import StructureInfo
+from steinschliff.snow_conditions import temperature_ranges
+
+from .json import json_dump_kwargs
+
+INDEX_FORMAT = "steinschliff-index"
+INDEX_VERSION = 1
+
+POSTING_GROUPS = ("tags", "snow_type", "condition", "service")
+
+
+def _snow_types(value: str | None) -> list[str]:
+    # В YAML тип снега часто перечислен через запятую: "all, fresh".
+    return [part.strip().lower() for part in (value or "").split(",") if part.strip()]
+
+
+def _values(service: str, s: StructureInfo) -> dict[str, Iterable[str]]:
+    return {
+        "tags": {str(t).strip() for t in s.tags or [] if t},
+        "snow_type": set(_snow_types(s.snow_type)),
+        "condition": [c] if (c := (s.condition or "").strip().lower()) else [],
+        "service": [(s.service.name if s.service else service) or service],
+    }
+
+
+def _temperature_range(s: StructureInfo) -> tuple[float, float] | None:
+    # Границы по всем диапазонам структуры — как в запросах и API.
+    ranges = temperature_ranges(s.temperature)
+    if not ranges:
+        return None
+    return min(low for low, _ in ranges), max(high for _, high in ranges)
+
+
+def build_search_index(services: Mapping[str, Sequence[StructureInfo]]) -> dict[str, Any]:
+    """Построить поисковый индекс по структурам.
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]` (тот же, что передаётся в экспорт).
+
+    Returns:
+        Документ индекса (см. описание модуля).
+    """
+    postings: dict[str, dict[str, list[int]]] = {group: {} for group in POSTING_GROUPS}
+    lo: list[tuple[float, int]] = []
+    hi: list[tuple[float, int]] = []
+    names: list[tuple[str, int]] = []
+
+    doc_id = 0
+    for service, items in services.items():
+        for s in items:
+            for group, values in _values(service, s).items():
+                for value in values:
+                    postings[group].setdefault(value, []).append(doc_id)
+
+            bounds = _temperature_range(s)
+            if bounds is not None:
+                lo.append((bounds[0], doc_id))
+                hi.append((bounds[1], doc_id))
+            names.append((str(s.name).casefold(), doc_id))
+            doc_id += 1
+
+    ordered = {group: dict(sorted(values.items())) for group, values in postings.items()}
+    return {
+        "format": INDEX_FORMAT,
+        "version": INDEX_VERSION,
+        "count": doc_id,
+        "postings": ordered,
+        "facets": {group: {value: len(ids) for value, ids in values.items()} for group, values in ordered.items()},
+        "temperature": {"lo": [list(p) for p in sorted(lo)], "hi": [list(p) for p in sorted(hi)]},
+        "names": [list(p) for p in sorted(names)],
+    }
+
+
+def export_search_index(
+    *,
+    services: Mapping[str, Sequence[StructureInfo]],
+    out_path: str | Path,
+    minify: bool = False,
+) -> dict[str, Any]:
+    """Построить поисковый индекс и записать его в JSON.
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]`.
+        out_path: Путь выходного файла.
+        minify: Писать без отступов и пробелов.
+
+    Returns:
+        Записанный документ индекса.
+    """
+    index = build_search_index(services)
+
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", encoding="utf-8") as f:
+        json.dump(index, f, **json_dump_kwargs(minify=minify))
+    return index
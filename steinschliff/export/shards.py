@@ -0,0 +1,171 @@
+"""Шардированный JSON-экспорт для ленивой загрузки в webapp.
+
+Вместо одного `structures.json` структуры раскладываются по файлам-шардам
+(по сервису, стране или условию снега) и описываются маленьким `manifest.json`:
+имя шарда, файл, количество структур, sha256 содержимого и температурный диапазон.
+Фронтенд сначала загружает манифест, а затем — только нужные текущему экрану шарды.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Any, Literal
+
+from steinschliff.models import StructureInfo
+from steinschliff.snow_conditions import temperature_ranges
+
+from .json import json_dump_kwargs, structure_record
+
+ShardBy = Literal["service", "country", "condition"]
+ShardFormat = Literal["json", "ndjson"]
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+UNKNOWN_SHARD = "unknown"
+
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _service_shard(service: str, s: StructureInfo) -> str:  # noqa: ARG001
+    return service
+
+
+def _country_shard(service: str, s: StructureInfo) -> str:  # noqa: ARG001
+    return (s.country or "").strip()
+
+
+def _condition_shard(service: str, s: StructureInfo) -> str:  # noqa: ARG001
+    return (s.condition or "").strip().lower()
+
+
+_SHARD_KEYS: dict[str, Callable[[str, StructureInfo], str]] = {
+    "service": _service_shard,
+    "country": _country_shard,
+    "condition": _condition_shard,
+}
+
+
+def shard_file_stem(name: str, taken: set[str]) -> str:
+    """Подобрать ASCII-имя файла шарда.
+
+    Имена вроде `Россия` или `mass sport` не годятся для URL как есть: латиница
+    переводится в slug, а для остальных используется короткий хеш имени.
+
+    Args:
+        name: Имя шарда.
+        taken: Уже занятые имена (пополняется выбранным).
+
+    Returns:
+        Уникальное имя файла без расширения.
+    """
+    stem = _NON_SLUG_RE.sub("-", name.lower()).strip("-")
+    if not stem or not name.isascii():
+        digest = hashlib.sha1(name.encode("utf-8"), usedforsecurity=False).hexdigest()[:8]
+        stem = f"{stem}-{digest}" if stem else f"x-{digest}"
+
+    candidate, n = stem, 2
+    while candidate in taken:
+        candidate = f"{stem}-{n}"
+        n += 1
+    taken.add(candidate)
+    return candidate
+
+
+def _temperature_bounds(structures: Sequence[StructureInfo]) -> tuple[float | None, float | None]:
+    # Учитываем все диапазоны структуры: в данных встречаются min > max и открытые концы.
+    ranges = [r for s in structures for r in temperature_ranges(s.temperature)]
+    if not ranges:
+        return None, None
+    return min(low for low, _ in ranges), max(high for _, high in ranges)
+
+
+def _manifest_files(out: Path) -> set[str]:
+    """Файлы шардов из манифеста предыдущего экспорта в директорию (если он есть)."""
+    try:
+        manifest = json.loads((out / MANIFEST_NAME).read_text(encoding="utf-8"))
+        files = {str(shard["file"]) for shard in manifest["shards"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return set()
+    # Удалять разрешено только файлы внутри директории экспорта и никогда — сам манифест.
+    return {name for name in files if name and Path(name).name == name and name != MANIFEST_NAME}
+
+
+def _encode_shard(records: Sequence[Mapping[str, Any]], fmt: ShardFormat, *, minify: bool) -> bytes:
+    if fmt == "ndjson":
+        return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode("utf-8")
+    return json.dumps(records, **json_dump_kwargs(minify=minify)).encode("utf-8")
+
+
+def export_structures_sharded(
+    *,
+    services: Mapping[str, Sequence[StructureInfo]],
+    out_dir: str | Path,
+    shard_by: ShardBy,
+    fmt: ShardFormat = "json",
+    minify: bool = False,
+) -> dict[str, Any]:
+    """Экспортировать структуры в шарды и записать манифест.
+
+    Шарды предыдущего экспорта в ту же директорию, которых нет в новом манифесте,
+    удаляются; остальные файлы директории не трогаются.
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]`.
+        out_dir: Директория для шардов и `manifest.json`.
+        shard_by: Признак шардирования: `service` (ключ сервиса), `country` или `condition`.
+        fmt: Формат шардов (`json` — массив, `ndjson` — по записи на строку).
+        minify: Писать JSON-шарды без отступов.
+
+    Returns:
+        Содержимое манифеста (то же, что записано в `manifest.json`).
+    """
+    shard_key = _SHARD_KEYS[shard_by]
+    groups: dict[str, list[tuple[str, StructureInfo]]] = {}
+    for service, items in services.items():
+        for s in items:
+            name = shard_key(service, s) or UNKNOWN_SHARD
+            groups.setdefault(name, []).append((service, s))
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    previous_files = _manifest_files(out)
+
+    # Шард `manifest` не должен перезаписать сам манифест.
+    taken = {Path(MANIFEST_NAME).stem}
+    shards: list[dict[str, Any]] = []
+    for name in sorted(groups, key=str.casefold):
+        members = groups[name]
+        records = [structure_record(service, s) for service, s in members]
+        payload = _encode_shard(records, fmt, minify=minify)
+        file_name = f"{shard_file_stem(name, taken)}.{fmt}"
+        (out / file_name).write_bytes(payload)
+
+        temp_min, temp_max = _temperature_bounds([s for _, s in members])
+        shards.append(
+            {
+                "name": name,
+                "file": file_name,
+                "count": len(records),
+                "sha256": hashlib.sha256(payload).hexdigest(),
+                "temp_min": temp_min,
+                "temp_max": temp_max,
+            }
+        )
+
+    manifest: dict[str, Any] = {
+        "version": MANIFEST_VERSION,
+        "shard_by": shard_by,
+        "format": fmt,
+        "total": sum(shard["count"] for shard in shards),
+        "shards": shards,
+    }
+    with (out / MANIFEST_NAME).open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    # Удаляем устаревшие шарды после записи манифеста: он на них больше не ссылается.
+    for file_name in previous_files - {shard["file"] for shard in shards}:
+        (out / file_name).unlink(missing_ok=True)
+    return manifest
@@ -0,0 +1,258 @@
+"""Экспорт каталога в SQLite.
+
+Нормализованная схема для SQL-аналитики и быстрых запросов без повторного разбора YAML:
+- `services` — сервисы (ключ директории + метаданные из `_meta.yaml`)
+- `snow_conditions` — справочник условий снега
+- `structures` — структуры (ссылаются на сервис и условие)
+- `temperature_ranges` — диапазоны температур: исходные `temp_min`/`temp_max` и
+  упорядоченные границы `temp_low <= temp_high` (в данных встречается min > max;
+  диапазон с одним заданным концом — точка)
+- `tags`, `similars` — списковые поля
+- `structures_fts` — FTS5 по имени и ru/en описаниям (если SQLite собран с FTS5)
+
+База собирается во временном файле одной транзакцией (`executemany`) и затем
+атомарно подменяет целевой файл.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from steinschliff.models import ServiceMetadata, StructureInfo
+from steinschliff.snow_conditions import get_registry, temperature_ranges
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE services (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    country TEXT,
+    city TEXT,
+    website_url TEXT,
+    description TEXT,
+    description_ru TEXT
+);
+CREATE TABLE snow_conditions (
+    key TEXT PRIMARY KEY,
+    name TEXT,
+    name_ru TEXT,
+    color TEXT,
+    temp_min REAL,
+    temp_max REAL
+);
+CREATE TABLE structures (
+    id INTEGER PRIMARY KEY,
+    service_id INTEGER NOT NULL REFERENCES services(id),
+    name TEXT NOT NULL,
+    description TEXT,
+    description_ru TEXT,
+    snow_type TEXT,
+    condition TEXT REFERENCES snow_conditions(key),
+    country TEXT,
+    file_path TEXT NOT NULL
+);
+CREATE TABLE temperature_ranges (
+    structure_id INTEGER NOT NULL REFERENCES structures(id),
+    position INTEGER NOT NULL,
+    temp_min REAL,
+    temp_max REAL,
+    temp_low REAL,
+    temp_high REAL,
+    PRIMARY KEY (structure_id, position)
+);
+CREATE TABLE tags (
+    structure_id INTEGER NOT NULL REFERENCES structures(id),
+    tag TEXT NOT NULL
+);
+CREATE TABLE similars (
+    structure_id INTEGER NOT NULL REFERENCES structures(id),
+    similar TEXT NOT NULL
+);
+CREATE INDEX idx_structures_condition ON structures(condition);
+CREATE INDEX idx_structures_service ON structures(service_id);
+CREATE INDEX idx_temperature_bounds ON temperature_ranges(temp_low, temp_high);
+CREATE INDEX idx_tags_tag ON tags(tag);
+CREATE INDEX idx_similars_similar ON similars(similar);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE structures_fts USING fts5(
+    name, description, description_ru, content='structures', content_rowid='id'
+);
+INSERT INTO structures_fts(structures_fts) VALUES ('rebuild');
+"""
+
+
+@dataclass(frozen=True)
+class SqliteExportStats:
+    """Итоги экспорта в SQLite.
+
+    Attributes:
+        path: Путь к записанной базе.
+        rows: Количество строк по таблицам.
+        fts: Создана ли FTS5-таблица.
+    """
+
+    path: Path
+    rows: dict[str, int] = field(default_factory=dict)
+    fts: bool = False
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value)
+
+
+def _bounds(tr: Any) -> tuple[float | None, float | None]:
+    # То же правило, что в запросах и API: один заданный конец — точка.
+    ranges = temperature_ranges([tr])
+    return ranges[0] if ranges else (None, None)
+
+
+def _clean(values: Iterable[object] | None) -> list[str]:
+    return [str(v).strip() for v in values or [] if v is not None and str(v).strip()]
+
+
+def _condition_rows() -> list[tuple[Any, ...]]:
+    rows = []
+    registry = get_registry()
+    for key in registry.keys:
+        info = registry.info.get(key) or {}
+        temperature = info.get("temperature") or [{}]
+        tr = temperature[0] if isinstance(temperature[0], dict) else {}
+        rows.append(
+            (
+                key,
+                info.get("name"),
+                info.get("name_ru"),
+                info.get("color"),
+                _number(tr.get("min")),
+                _number(tr.get("max")),
+            )
+        )
+    return rows
+
+
+def _create_fts(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.executescript(FTS_SCHEMA)
+    except sqlite3.OperationalError as err:
+        logger.warning("FTS5 недоступен в этой сборке SQLite (%s) — полнотекстовый индекс не создан", err)
+        return False
+    return True
+
+
+def export_catalog_sqlite(
+    *,
+    services: Mapping[str, Sequence[StructureInfo]],
+    service_metadata: Mapping[str, ServiceMetadata],
+    out_path: str | Path,
+) -> SqliteExportStats:
+    """Экспортировать каталог в SQLite-базу.
+
+    Args:
+        services: Маппинг `service_key -> list[StructureInfo]`.
+        service_metadata: Метаданные сервисов (`service_key -> ServiceMetadata`).
+        out_path: Путь к файлу базы (перезаписывается).
+
+    Returns:
+        Итоги экспорта (количество строк по таблицам, наличие FTS).
+
+    Raises:
+        sqlite3.Error: Ошибка сборки базы (временный файл удаляется, прежняя база остаётся).
+        OSError: Ошибка записи файла.
+    """
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f"{out.name}.tmp")
+    tmp.unlink(missing_ok=True)
+
+    service_rows: list[tuple[Any, ...]] = []
+    structure_rows: list[tuple[Any, ...]] = []
+    temperature_rows: list[tuple[Any, ...]] = []
+    tag_rows: list[tuple[int, str]] = []
+    similar_rows: list[tuple[int, str]] = []
+
+    structure_id = 0
+    for service_id, (service_key, items) in enumerate(services.items(), start=1):
+        meta = service_metadata.get(service_key) or ServiceMetadata()
+        service_rows.append(
+            (
+                service_id,
+                service_key,
+                meta.name or service_key,
+                meta.country or None,
+                meta.city or None,
+                meta.website_url or None,
+                meta.description or None,
+                meta.description_ru or None,
+            )
+        )
+        for s in items:
+            structure_id += 1
+            structure_rows.append(
+                (
+                    structure_id,
+                    service_id,
+                    str(s.name),
+                    s.description or None,
+                    s.description_ru or None,
+                    (s.snow_type or "").strip() or None,
+                    (s.condition or "").strip().lower() or None,
+                    s.country or None,
+                    s.file_path,
+                )
+            )
+            for position, tr in enumerate(s.temperature or []):
+                temp_min, temp_max = _number(tr.get("min")), _number(tr.get("max"))
+                temperature_rows.append((structure_id, position, temp_min, temp_max, *_bounds(tr)))
+            tag_rows.extend((structure_id, tag) for tag in _clean(s.tags))
+            similar_rows.extend((structure_id, similar) for similar in _clean(s.similars))
+
+    condition_rows = _condition_rows()
+
+    try:
+        conn = sqlite3.connect(tmp)
+        try:
+            # Файл временный и собирается с нуля: журнал и fsync на каждую страницу не нужны.
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(SCHEMA)
+            with conn:
+                conn.executemany("INSERT INTO services VALUES (?, ?, ?, ?, ?, ?, ?, ?)", service_rows)
+                conn.executemany("INSERT INTO snow_conditions VALUES (?, ?, ?, ?, ?, ?)", condition_rows)
+                conn.executemany("INSERT INTO structures VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", structure_rows)
+                conn.executemany("INSERT INTO temperature_ranges VALUES (?, ?, ?, ?, ?, ?)", temperature_rows)
+                conn.executemany("INSERT INTO tags VALUES (?, ?)", tag_rows)
+                conn.executemany("INSERT INTO similars VALUES (?, ?)", similar_rows)
+            fts = _create_fts(conn)
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+        tmp.replace(out)
+    except BaseException:
+        # Недособранная база не должна оставаться рядом с выгрузкой; прежний `out` не тронут.
+        tmp.unlink(missing_ok=True)
+        raise
+
+    return SqliteExportStats(
+        path=out,
+        rows={
+            "services": len(service_rows),
+            "snow_conditions": len(condition_rows),
+            "structures": len(structure_rows),
+            "temperature_ranges": len(temperature_rows),
+            "tags": len(tag_rows),
+            "similars": len(similar_rows),
+        },
+        fts=fts,
+    )
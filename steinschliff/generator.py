@@ -32,6 +32,8 @@ from .pipeline.readme import (
     prepare_countries_data,
     sort_countries_data_in_place,
 )
+from .profiling.trace import span
+from .sorting import SortIndex, structure_sort_key
 from .ui.rich import print_kv_panel, print_validation_summary
 
 logger = logging.getLogger("steinschliff.generator")
@@ -62,6 +64,7 @@ class ReadmeGenerator:
         self.services: defaultdict[str, list[StructureInfo]] = defaultdict(list)
         self.name_to_path: dict[str, str] = {}
         self.service_metadata: dict[str, ServiceMetadata] = {}
+        self._sort_index: SortIndex | None = None
 
         # Устанавливаем окружение Jinja2
         self.jinja_env = Environment(
@@ -94,13 +97,16 @@ class ReadmeGenerator:
 
         Также печатает краткую сводку в консоль (UI слой).
         """
-        yaml_files = discover_yaml_files(schliffs_dir=Path(self.schliffs_dir))
+        with span("discover_yaml_files"):
+            yaml_files = discover_yaml_files(schliffs_dir=Path(self.schliffs_dir))
         print_kv_panel("Поиск YAML-файлов", [("Найдено", str(len(yaml_files)))])
 
         # Прогресс оставляем в генераторе (UI слой), а загрузку/валидацию — в pipeline.
-        loaded = load_structures_from_yaml_files(yaml_files=yaml_files, schliffs_dir=Path(self.schliffs_dir))
+        with span("load_structures", files=len(yaml_files)):
+            loaded = load_structures_from_yaml_files(yaml_files=yaml_files, schliffs_dir=Path(self.schliffs_dir))
         self.services = defaultdict(list, loaded.services)
         self.name_to_path = loaded.name_to_path
+        self._sort_index = None
 
         print_kv_panel(
             "Итоги обработки YAML",
@@ -122,7 +128,8 @@ class ReadmeGenerator:
         services = list(self.services.keys())
 
         # Загружаем метаданные - передаем корневую директорию schliffs
-        self.service_metadata = read_service_metadata(self.schliffs_dir, services)
+        with span("load_service_metadata", services=len(services)):
+            self.service_metadata = read_service_metadata(self.schliffs_dir, services)
 
     # NOTE: шаг load+validate вынесен в steinschliff.pipeline.readme
 
@@ -137,12 +144,24 @@ class ReadmeGenerator:
         """
         return self.name_to_path.get(str(name))
 
+    @property
+    def sort_index(self) -> SortIndex:
+        """Порядки сортировки структур (строятся один раз на загруженные данные)."""
+        if self._sort_index is None:
+            self._sort_index = SortIndex(s for items in self.services.values() for s in items)
+        return self._sort_index
+
+    @sort_index.setter
+    def sort_index(self, value: SortIndex | None) -> None:
+        self._sort_index = value
+
     def _get_structure_sort_key(self, structure: StructureInfo) -> Any:
         """Вернуть ключ сортировки для структуры.
 
         Note:
             Метод оставлен для обратной совместимости с кодом/тестами, но “источник истины”
-            для сортировки теперь находится в `steinschliff.pipeline.readme.get_structure_sort_key`.
+            для сортировки теперь находится в `steinschliff.sorting.structure_sort_key`;
+            для сортировки списков используйте `sort_index`.
 
         Args:
             structure: Структура.
@@ -150,20 +169,7 @@ class ReadmeGenerator:
         Returns:
             Ключ сортировки.
         """
-        if self.sort_field == "temperature":
-            # Сортировка по температуре (сначала самые теплые)
-            if structure.temperature and isinstance(structure.temperature, list) and structure.temperature[0]:
-                temp_range = structure.temperature[0]
-                max_temp = temp_range.get("max")
-                if max_temp is not None:
-                    try:
-                        return -float(max_temp)  # Негативное значение для сортировки по убыванию
-                    except (ValueError, TypeError):
-                        pass
-            # Структуры без температуры отправляем в конец сортировки
-            return float("inf")
-        # Сортировка по имени или другому полю
-        return getattr(structure, self.sort_field, "") or ""
+        return structure_sort_key(self.sort_field, structure)
 
     def _prepare_countries_data(self) -> dict[str, Any]:
         """Подготовить иерархические данные о странах/сервисах для шаблона.
@@ -189,7 +195,8 @@ class ReadmeGenerator:
             logger.warning("Нет данных о структурах для генерации README")
             return
 
-        countries_data = self._prepare_countries_data()
+        with span("prepare_countries_data"):
+            countries_data = self._prepare_countries_data()
 
         # Компилируем шаблон
         template = self.jinja_env.get_template("readme.jinja2")
@@ -199,7 +206,10 @@ class ReadmeGenerator:
         )
 
         # Добавляем функцию для сортировки по температуре
-        sort_countries_data_in_place(countries_data=countries_data, sort_field=self.sort_field)
+        with span("sort_countries_data", sort_field=self.sort_field):
+            sort_countries_data_in_place(
+                countries_data=countries_data, sort_field=self.sort_field, sort_index=self.sort_index
+            )
 
         # Генерируем README для каждого языка
         locales = {
@@ -232,16 +242,18 @@ class ReadmeGenerator:
             )
 
             # Рендерим шаблон
-            rendered_content = template.render(**template_data)
+            with span("render_readme", locale=locale):
+                rendered_content = template.render(**template_data)
 
             # Записываем результат в файл
-            with Path(output_file).open("w", encoding="utf-8") as f:
+            with span("write_readme", locale=locale), Path(output_file).open("w", encoding="utf-8") as f:
                 f.write(rendered_content)
 
             # logger.info("README для языка %s успешно сгенерирован в %s", locale.upper(), Path(output_file).resolve())
 
     def run(self) -> None:
         """Запустить полный цикл генерации README: load → metadata → render."""
-        self.load_structures()
-        self.load_service_metadata()
-        self.generate()
+        with span("ReadmeGenerator.run"):
+            self.load_structures()
+            self.load_service_metadata()
+            self.generate()
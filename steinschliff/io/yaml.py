@@ -70,31 +70,35 @@ def _validate_structure_file(data: dict[str, Any], path: Path) -> dict[str, Any]
         return None
 
 
-def _load_yaml_data(path: Path) -> dict[str, Any] | None:
+def _load_yaml_data(path: Path, payload: bytes | None = None) -> dict[str, Any] | None:
     """Прочитать YAML-файл и убедиться, что на верхнем уровне находится mapping.
 
     Args:
         path: Путь к YAML-файлу.
+        payload: Уже прочитанное содержимое файла (тогда файл не открывается повторно).
 
     Returns:
         Словарь (mapping) или `None`, если файл не найден/битый/не имеет корректной структуры.
     """
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        if payload is None:
+            with path.open("r", encoding="utf-8") as f:
+                data = yaml.safe_load(f)
+        else:
+            data = yaml.safe_load(payload.decode("utf-8"))
 
-            if data is None:
-                data = {}
+        if data is None:
+            data = {}
 
-            if not isinstance(data, dict):
-                logger.error(
-                    "Файл %s должен содержать YAML-объект (mapping), получен %s",
-                    path,
-                    type(data).__name__,
-                )
-                return None
+        if not isinstance(data, dict):
+            logger.error(
+                "Файл %s должен содержать YAML-объект (mapping), получен %s",
+                path,
+                type(data).__name__,
+            )
+            return None
 
-            return data
+        return data
 
     except yaml.YAMLError as e:
         logger.error("Ошибка разбора YAML в %s: %s", path, e)
@@ -110,7 +114,7 @@ def _load_yaml_data(path: Path) -> dict[str, Any] | None:
         return None
 
 
-def read_yaml_file(file_path: str | Path) -> dict[str, Any] | ServiceMetadata | None:
+def read_yaml_file(file_path: str | Path, payload: bytes | None = None) -> dict[str, Any] | ServiceMetadata | None:
     """Прочитать YAML-файл и (частично) провалидировать через Pydantic.
 
     Поведение зависит от файла:
@@ -120,13 +124,14 @@ def read_yaml_file(file_path: str | Path) -> dict[str, Any] | ServiceMetadata |
 
     Args:
         file_path: Путь к YAML-файлу.
+        payload: Уже прочитанное содержимое файла (например, асинхронным загрузчиком).
 
     Returns:
         Объект данных (`ServiceMetadata`/`dict`) или `None`, если файл непригоден.
     """
     path = Path(file_path) if not isinstance(file_path, Path) else file_path
 
-    data = _load_yaml_data(path)
+    data = _load_yaml_data(path, payload)
     if data is None:
         return None
 
@@ -0,0 +1,196 @@
+"""Нечёткое сопоставление пользовательского ввода с известными именами.
+
+`FuzzyMatcher` строится один раз по таблице «вариант написания → каноническое значение»
+(ключи условий, названия, синонимы, имена сервисов) и отвечает на запросы без перебора
+всех вариантов:
+
+- точное совпадение после нормализации (`casefold`, `ё` → `е`, `_`/`-` → пробел) — O(1);
+- кандидаты для опечаток берутся из индекса триграмм (и из корзины по длине для коротких
+  строк, у которых почти нет общих триграмм);
+- кандидаты проверяются ограниченным расстоянием Левенштейна (с перестановкой соседних
+  символов как одной правкой): расчёт матрицы прекращается, как только минимум в строке
+  превысил порог.
+
+Порог зависит от длины ввода (`max_distance`): 1 правка для строк до 4 символов, 2 — до
+9, 3 — для более длинных.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+DEFAULT_SUGGESTIONS = 5
+SHORT_QUERY_LENGTH = 4
+
+
+def normalize_text(value: str) -> str:
+    """Нормализовать строку для сопоставления.
+
+    Args:
+        value: Исходная строка.
+
+    Returns:
+        Строка в `casefold`, с `ё` → `е`, `_`/`-` → пробел и схлопнутыми пробелами.
+    """
+    text = (value or "").casefold().replace("ё", "е").replace("_", " ").replace("-", " ")
+    return " ".join(text.split())
+
+
+def max_distance(length: int) -> int:
+    """Допустимое число правок для ввода заданной длины."""
+    if length <= SHORT_QUERY_LENGTH:
+        return 1
+    return 2 if length <= 9 else 3
+
+
+def bounded_levenshtein(a: str, b: str, bound: int) -> int | None:
+    """Расстояние Левенштейна (перестановка соседних символов — одна правка), если оно не больше `bound`.
+
+    Args:
+        a: Первая строка.
+        b: Вторая строка.
+        bound: Максимальное интересующее расстояние.
+
+    Returns:
+        Расстояние или `None`, если оно больше `bound`.
+    """
+    if abs(len(a) - len(b)) > bound:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    before_previous: list[int] = []
+    previous = list(range(len(a) + 1))
+    for j, cb in enumerate(b, start=1):
+        current = [j]
+        for i, ca in enumerate(a, start=1):
+            cost = min(previous[i] + 1, current[i - 1] + 1, previous[i - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before_previous[i - 2] + 1)
+            current.append(cost)
+        if min(current) > bound:
+            return None
+        before_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= bound else None
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """Результат сопоставления.
+
+    Attributes:
+        query: Исходный ввод.
+        value: Распознанное каноническое значение (`None`, если не распознано или неоднозначно).
+        exact: Совпадение точное (без исправления опечаток).
+        suggestions: Подходящие канонические значения от лучшего к худшему.
+    """
+
+    query: str
+    value: str | None
+    exact: bool
+    suggestions: tuple[str, ...]
+
+
+class FuzzyMatcher:
+    """Предвычисленный индекс для нечёткого поиска канонических значений."""
+
+    def __init__(self, aliases: Mapping[str, str] | Iterable[tuple[str, str]]) -> None:
+        """Построить индекс.
+
+        Args:
+            aliases: Пары «вариант написания → каноническое значение».
+        """
+        items = aliases.items() if isinstance(aliases, Mapping) else aliases
+        self._exact: dict[str, str] = {}
+        for alias, value in items:
+            normalized = normalize_text(alias)
+            if normalized:
+                self._exact.setdefault(normalized, value)
+        self._aliases = sorted(self._exact)
+        self._by_trigram: dict[str, list[int]] = defaultdict(list)
+        self._by_length: dict[int, list[int]] = defaultdict(list)
+        for position, alias in enumerate(self._aliases):
+            for gram in _trigrams(alias):
+                self._by_trigram[gram].append(position)
+            if len(alias) <= SHORT_QUERY_LENGTH + 1:
+                self._by_length[len(alias)].append(position)
+
+    def __len__(self) -> int:
+        """Количество вариантов написания в индексе."""
+        return len(self._aliases)
+
+    def _candidates(self, query: str, bound: int) -> set[int]:
+        candidates: set[int] = set()
+        for gram in _trigrams(query):
+            candidates.update(self._by_trigram.get(gram, ()))
+        if len(query) <= SHORT_QUERY_LENGTH:
+            for length in range(max(1, len(query) - bound), len(query) + bound + 1):
+                candidates.update(self._by_length.get(length, ()))
+        return candidates
+
+    def match(self, query: str, *, limit: int = DEFAULT_SUGGESTIONS) -> MatchResult:
+        """Найти каноническое значение для ввода.
+
+        Опечатка исправляется, только если ближайший вариант однозначен: все варианты на
+        минимальном расстоянии ведут к одному значению.
+
+        Args:
+            query: Пользовательский ввод.
+            limit: Максимум подсказок.
+
+        Returns:
+            Результат сопоставления.
+        """
+        normalized = normalize_text(query)
+        if not normalized:
+            return MatchResult(query, None, False, ())
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            return MatchResult(query, exact, True, (exact,))
+
+        bound = max_distance(len(normalized))
+        best: dict[str, int] = {}
+        for position in self._candidates(normalized, bound):
+            alias = self._aliases[position]
+            distance = bounded_levenshtein(normalized, alias, bound)
+            if distance is None:
+                continue
+            value = self._exact[alias]
+            if distance < best.get(value, bound + 1):
+                best[value] = distance
+        ranked = sorted(best, key=lambda value: (best[value], value))
+        closest = [value for value in ranked if best[value] == best[ranked[0]]] if ranked else []
+        resolved = closest[0] if len(closest) == 1 else None
+        return MatchResult(query, resolved, False, tuple(ranked[:limit]))
+
+    def complete(self, prefix: str, *, limit: int = 20) -> list[str]:
+        """Варианты автодополнения: значения, у которых есть вариант с таким префиксом.
+
+        Если по префиксу ничего нет, возвращаются подсказки `match`.
+
+        Args:
+            prefix: Введённая часть.
+            limit: Максимум вариантов.
+
+        Returns:
+            Канонические значения без повторов, по алфавиту вариантов.
+        """
+        normalized = normalize_text(prefix)
+        values: list[str] = []
+        start = bisect.bisect_left(self._aliases, normalized)
+        for alias in self._aliases[start:]:
+            if not alias.startswith(normalized) or len(values) >= limit:
+                break
+            value = self._exact[alias]
+            if value not in values:
+                values.append(value)
+        if values or not normalized:
+            return values
+        return list(self.match(prefix, limit=limit).suggestions)
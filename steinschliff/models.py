@@ -10,7 +10,7 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from steinschliff.snow_conditions import get_valid_keys
+from steinschliff.snow_conditions import get_registry
 
 
 class TemperatureRange(BaseModel):
@@ -77,9 +77,9 @@ class SchliffStructure(BaseModel):
         if not value:
             return ""
 
-        valid_keys = get_valid_keys()
-        if value not in valid_keys:
-            valid_str = ", ".join(valid_keys)
+        registry = get_registry()
+        if value not in registry.key_set:
+            valid_str = ", ".join(registry.keys)
             msg = f"condition must be one of valid SnowCondition keys: {valid_str}. Got: '{v}'"
             raise ValueError(msg)
 
@@ -0,0 +1,157 @@
+"""Сборка нескольких артефактов из одного загруженного каталога.
+
+Каталог (YAML + `_meta.yaml`) загружается один раз, после чего независимые экспортеры
+(README, JSON, CSV, SQLite) запускаются параллельно в пуле потоков и только читают
+общие `services`/`service_metadata`. Каждая цель размечается span `build:<цель>`,
+поэтому в `--trace` цели видны на отдельных потоках.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+from steinschliff.export.csv import write_structures_csv
+from steinschliff.export.json import export_structures_json
+from steinschliff.export.sqlite import export_catalog_sqlite
+from steinschliff.generator import ReadmeGenerator
+from steinschliff.profiling.trace import span
+
+BuildTarget = Literal["readme", "json", "csv", "sqlite"]
+BUILD_TARGETS: tuple[BuildTarget, ...] = ("readme", "json", "csv", "sqlite")
+
+
+@dataclass(frozen=True)
+class BuildOutputs:
+    """Пути артефактов сборки.
+
+    Attributes:
+        json_path: Путь JSON для webapp.
+        csv_path: Путь CSV.
+        sqlite_path: Путь SQLite-базы.
+
+    README пишутся по путям из конфигурации генератора.
+    """
+
+    json_path: Path
+    csv_path: Path
+    sqlite_path: Path
+
+
+@dataclass(frozen=True)
+class TargetResult:
+    """Результат одной цели сборки.
+
+    Attributes:
+        target: Цель.
+        outputs: Записанные файлы.
+        seconds: Время выполнения цели.
+    """
+
+    target: BuildTarget
+    outputs: tuple[Path, ...]
+    seconds: float
+
+
+def parse_targets(value: str) -> list[BuildTarget]:
+    """Разобрать список целей вида `readme,json,csv` (порядок сохраняется, дубли отбрасываются).
+
+    Args:
+        value: Цели через запятую; `all` — все цели.
+
+    Returns:
+        Список целей.
+
+    Raises:
+        ValueError: Если цель неизвестна или список пуст.
+    """
+    targets: list[BuildTarget] = []
+    for raw in value.split(","):
+        name = raw.strip().lower()
+        if not name:
+            continue
+        if name == "all":
+            return list(BUILD_TARGETS)
+        target = next((t for t in BUILD_TARGETS if t == name), None)
+        if target is None:
+            msg = f"Неизвестная цель сборки '{raw.strip()}'. Допустимые: {', '.join(BUILD_TARGETS)}, all"
+            raise ValueError(msg)
+        if target not in targets:
+            targets.append(target)
+    if not targets:
+        msg = "Не указано ни одной цели сборки"
+        raise ValueError(msg)
+    return targets
+
+
+def _build_readme(generator: ReadmeGenerator, outputs: BuildOutputs) -> tuple[Path, ...]:  # noqa: ARG001
+    generator.generate()
+    return (Path(generator.readme_file), Path(generator.readme_ru_file))
+
+
+def _build_json(generator: ReadmeGenerator, outputs: BuildOutputs) -> tuple[Path, ...]:
+    export_structures_json(services=generator.services, out_path=str(outputs.json_path))
+    return (outputs.json_path,)
+
+
+def _build_csv(generator: ReadmeGenerator, outputs: BuildOutputs) -> tuple[Path, ...]:
+    outputs.csv_path.parent.mkdir(parents=True, exist_ok=True)
+    with outputs.csv_path.open("w", encoding="utf-8", newline="") as f:
+        write_structures_csv(
+            services=generator.services, sink=f, sort_key=generator.sort_index.key(generator.sort_field)
+        )
+    return (outputs.csv_path,)
+
+
+def _build_sqlite(generator: ReadmeGenerator, outputs: BuildOutputs) -> tuple[Path, ...]:
+    stats = export_catalog_sqlite(
+        services=generator.services,
+        service_metadata=generator.service_metadata,
+        out_path=outputs.sqlite_path,
+    )
+    return (stats.path,)
+
+
+_BUILDERS: dict[BuildTarget, Callable[[ReadmeGenerator, BuildOutputs], tuple[Path, ...]]] = {
+    "readme": _build_readme,
+    "json": _build_json,
+    "csv": _build_csv,
+    "sqlite": _build_sqlite,
+}
+
+
+def _run_target(target: BuildTarget, generator: ReadmeGenerator, outputs: BuildOutputs) -> TargetResult:
+    started = time.perf_counter()
+    with span(f"build:{target}", category="export"):
+        written = _BUILDERS[target](generator, outputs)
+    return TargetResult(target=target, outputs=written, seconds=time.perf_counter() - started)
+
+
+def run_build(
+    generator: ReadmeGenerator,
+    targets: Sequence[BuildTarget],
+    *,
+    outputs: BuildOutputs,
+    max_workers: int | None = None,
+) -> list[TargetResult]:
+    """Выполнить цели сборки параллельно над уже загруженным каталогом.
+
+    Args:
+        generator: Генератор с загруженными `services` и `service_metadata`.
+        targets: Цели сборки.
+        outputs: Пути артефактов.
+        max_workers: Размер пула потоков (по умолчанию — по потоку на цель).
+
+    Returns:
+        Результаты целей в порядке `targets`.
+
+    Raises:
+        Exception: Первая ошибка среди целей (остальные цели при этом доводятся до конца).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or len(targets) or 1, thread_name_prefix="build") as pool:
+        futures = [pool.submit(_run_target, target, generator, outputs) for target in targets]
+    return [future.result() for future in futures]
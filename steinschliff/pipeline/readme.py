@@ -9,6 +9,8 @@ load → validate → transform → render.
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,6 +18,10 @@ from typing import Any
 from steinschliff.formatters import format_snow_types
 from steinschliff.io import find_yaml_files, read_yaml_file
 from steinschliff.models import Service, ServiceMetadata, StructureInfo
+from steinschliff.profiling.trace import span
+from steinschliff.sorting import SortIndex, structure_sort_key
+
+DEFAULT_READ_CONCURRENCY = 32
 
 
 @dataclass(frozen=True)
@@ -62,6 +68,97 @@ def discover_yaml_files(*, schliffs_dir: Path) -> list[Path]:
     return [Path(p) for p in find_yaml_files(str(schliffs_dir))]
 
 
+@dataclass(frozen=True)
+class _ParsedStructure:
+    service_key: str
+    name: str
+    structure: StructureInfo
+    partial: bool
+
+
+def _build_structure(file_path: Path, data: object, schliffs_dir: Path) -> _ParsedStructure | None:
+    """Собрать `StructureInfo` из результата `read_yaml_file` (`None` — файл не годится)."""
+    # read_yaml_file для структур возвращает dict (или dict с _partial_validation).
+    if not data or not isinstance(data, dict):
+        return None
+
+    name_str = str(data.get("name", file_path.stem))
+
+    try:
+        service_rel = file_path.parent.relative_to(schliffs_dir)
+        service_key = service_rel.as_posix() or "main"
+    except ValueError:
+        # Файл вне schliffs_dir — сохраняем “как есть” (историческое поведение).
+        service_key = file_path.parent.as_posix() or "main"
+
+    formatted_snow_type = format_snow_types(data.get("snow_type", []))
+
+    service_data = data.get("service", {})
+    if isinstance(service_data, dict):
+        service_obj = Service(name=str(service_data.get("name", "")))
+    else:
+        service_obj = Service(name=str(service_data or ""))
+
+    structure_info = StructureInfo(
+        name=name_str,
+        description=data.get("description", ""),
+        description_ru=data.get("description_ru", ""),
+        snow_type=formatted_snow_type,
+        temperature=data.get("temperature", []),
+        condition=data.get("condition", ""),
+        service=service_obj,
+        country=data.get("country", ""),
+        tags=data.get("tags", []),
+        similars=data.get("similars", []),
+        features=data.get("features", []),
+        images=data.get("images", []),
+        file_path=str(file_path),
+    )
+    return _ParsedStructure(service_key, name_str, structure_info, bool(data.get("_partial_validation")))
+
+
+class _StructureCollector:
+    """Накопитель результата load+validate (общий для синхронной и асинхронной загрузки)."""
+
+    def __init__(self, schliffs_dir: Path) -> None:
+        self.schliffs_dir = schliffs_dir
+        self.services: dict[str, list[StructureInfo]] = {}
+        self.name_to_path: dict[str, str] = {}
+        self.valid_files = 0
+        self.warning_files = 0
+        self.error_files = 0
+        self.processed_structures = 0
+
+    def add(self, file_path: Path, data: object) -> None:
+        """Учесть результат `read_yaml_file` для одного файла структуры."""
+        self.add_parsed(_build_structure(file_path, data, self.schliffs_dir))
+
+    def add_parsed(self, parsed: _ParsedStructure | None) -> None:
+        """Учесть уже собранную структуру (`None` — файл не удалось прочитать/использовать)."""
+        if parsed is None:
+            self.error_files += 1
+            return
+        if parsed.partial:
+            self.warning_files += 1
+        else:
+            self.valid_files += 1
+        self.name_to_path[parsed.name] = parsed.structure.file_path
+        self.services.setdefault(parsed.service_key, []).append(parsed.structure)
+        self.processed_structures += 1
+
+    def result(self) -> LoadedStructures:
+        return LoadedStructures(
+            services=self.services,
+            name_to_path=self.name_to_path,
+            stats=LoadValidationStats(
+                valid_files=self.valid_files,
+                warning_files=self.warning_files,
+                error_files=self.error_files,
+                processed_structures=self.processed_structures,
+            ),
+        )
+
+
 def load_structures_from_yaml_files(*, yaml_files: list[Path], schliffs_dir: Path) -> LoadedStructures:
     """LOAD+VALIDATE: прочитать YAML-файлы структур и собрать `services/name_to_path`.
 
@@ -79,82 +176,77 @@ def load_structures_from_yaml_files(*, yaml_files: list[Path], schliffs_dir: Pat
     Returns:
         `LoadedStructures` с сервисами, индексом по имени и статистикой.
     """
-    services: dict[str, list[StructureInfo]] = {}
-    name_to_path: dict[str, str] = {}
-
-    valid_files = 0
-    warning_files = 0
-    error_files = 0
-    processed_structures = 0
-
+    collector = _StructureCollector(schliffs_dir)
     for file_path in yaml_files:
         if file_path.name == "_meta.yaml":
             continue
 
-        data = read_yaml_file(file_path)
-        if not data:
-            error_files += 1
-            continue
+        with span("load_file", category="io", path=file_path.as_posix()):
+            data = read_yaml_file(file_path)
+        collector.add(file_path, data)
 
-        # read_yaml_file для структур возвращает dict (или dict с _partial_validation).
-        if not isinstance(data, dict):
-            error_files += 1
-            continue
+    return collector.result()
 
-        is_partial_validation = bool(data.get("_partial_validation"))
-        if is_partial_validation:
-            warning_files += 1
-        else:
-            valid_files += 1
 
-        name = data.get("name", file_path.stem)
-        name_str = str(name)
-        name_to_path[name_str] = str(file_path)
-
-        try:
-            service_rel = file_path.parent.relative_to(schliffs_dir)
-            service_key = service_rel.as_posix() or "main"
-        except ValueError:
-            # Файл вне schliffs_dir — сохраняем “как есть” (историческое поведение).
-            service_key = file_path.parent.as_posix() or "main"
-
-        formatted_snow_type = format_snow_types(data.get("snow_type", []))
+async def aload_structures_from_yaml_files(
+    *,
+    yaml_files: list[Path],
+    schliffs_dir: Path,
+    concurrency: int = DEFAULT_READ_CONCURRENCY,
+) -> LoadedStructures:
+    """LOAD+VALIDATE (asyncio): то же, что `load_structures_from_yaml_files`, с конкурентным чтением.
+
+    Содержимое файлов читается в потоках (`asyncio.to_thread`, не больше `concurrency`
+    чтений одновременно), а каждый прочитанный файл сразу уходит в отдельный поток-парсер,
+    который разбирает YAML и собирает `StructureInfo` — ввод-вывод перекрывается с разбором,
+    а в event loop остаётся только учёт готовых структур.
+    Порядок результата совпадает с порядком `yaml_files`, как у синхронной версии.
 
-        service_data = data.get("service", {})
-        if isinstance(service_data, dict):
-            service_obj = Service(name=str(service_data.get("name", "")))
-        else:
-            service_obj = Service(name=str(service_data or ""))
-
-        structure_info = StructureInfo(
-            name=name_str,
-            description=data.get("description", ""),
-            description_ru=data.get("description_ru", ""),
-            snow_type=formatted_snow_type,
-            temperature=data.get("temperature", []),
-            condition=data.get("condition", ""),
-            service=service_obj,
-            country=data.get("country", ""),
-            tags=data.get("tags", []),
-            similars=data.get("similars", []),
-            features=data.get("features", []),
-            images=data.get("images", []),
-            file_path=str(file_path),
-        )
+    Args:
+        yaml_files: Список YAML-файлов (может включать `_meta.yaml`).
+        schliffs_dir: Корневая директория каталога `schliffs/`.
+        concurrency: Максимум одновременных чтений файлов.
 
-        services.setdefault(service_key, []).append(structure_info)
-        processed_structures += 1
-
-    return LoadedStructures(
-        services=services,
-        name_to_path=name_to_path,
-        stats=LoadValidationStats(
-            valid_files=valid_files,
-            warning_files=warning_files,
-            error_files=error_files,
-            processed_structures=processed_structures,
-        ),
-    )
+    Returns:
+        `LoadedStructures` с сервисами, индексом по имени и статистикой.
+    """
+    files = [path for path in yaml_files if path.name != "_meta.yaml"]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    loop = asyncio.get_running_loop()
+
+    def read(path: Path) -> bytes | None:
+        with span("read_file", category="io", path=path.as_posix()):
+            try:
+                return path.read_bytes()
+            except OSError:
+                # Ошибку залогирует read_yaml_file при повторной попытке открыть файл.
+                return None
+
+    def parse(path: Path, payload: bytes | None) -> _ParsedStructure | None:
+        # Модели pydantic тоже собираются в потоке-парсере, а не в event loop.
+        with span("parse_file", path=path.as_posix()):
+            return _build_structure(path, read_yaml_file(path, payload), schliffs_dir)
+
+    # Разбор упирается в GIL, поэтому одного потока-парсера достаточно: он работает,
+    # пока остальные файлы ещё читаются.
+    parser = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yaml-parse")
+    try:
+
+        async def load_one(path: Path) -> _ParsedStructure | None:
+            async with semaphore:
+                payload = await asyncio.to_thread(read, path)
+            return await loop.run_in_executor(parser, parse, path, payload)
+
+        results = await asyncio.gather(*(load_one(path) for path in files))
+    finally:
+        # Не ждём поток-парсер в event loop (например, при отмене загрузки): текущий файл
+        # он дочитает сам, а ещё не начатые задачи отменяются.
+        parser.shutdown(wait=False, cancel_futures=True)
+
+    collector = _StructureCollector(schliffs_dir)
+    for parsed in results:
+        collector.add_parsed(parsed)
+    return collector.result()
 
 
 def prepare_countries_data(
@@ -236,41 +328,28 @@ def get_structure_sort_key(*, sort_field: str, structure: StructureInfo) -> Any:
         structure: Структура.
 
     Returns:
-        Ключ сортировки. Для `temperature` возвращает значение, позволяющее
-        сортировать “сначала тёплые”, а структуры без температуры отправлять в конец.
+        Ключ сортировки (см. `steinschliff.sorting.structure_sort_key`). Для `temperature`
+        возвращает значение, позволяющее сортировать “сначала тёплые”, а структуры без
+        температуры отправлять в конец.
     """
-    if sort_field == "temperature":
-        if structure.temperature and isinstance(structure.temperature, list) and structure.temperature[0]:
-            temp_range = structure.temperature[0]
-            max_temp = temp_range.get("max")
-            if max_temp is not None:
-                try:
-                    return -float(max_temp)
-                except (ValueError, TypeError):
-                    pass
-        return float("inf")
-    return getattr(structure, sort_field, "") or ""
-
-
-def sort_countries_data_in_place(*, countries_data: dict[str, Any], sort_field: str) -> None:
-    """TRANSFORM: отсортировать структуры внутри каждого сервиса (in-place).
+    return structure_sort_key(sort_field, structure)
 
-    Сейчас сортировка применяется только для `sort_field="temperature"`.
+
+def sort_countries_data_in_place(
+    *, countries_data: dict[str, Any], sort_field: str, sort_index: SortIndex | None = None
+) -> None:
+    """TRANSFORM: отсортировать структуры внутри каждого сервиса (in-place).
 
     Args:
         countries_data: Данные, возвращаемые `prepare_countries_data`.
         sort_field: Поле сортировки.
+        sort_index: Готовые порядки сортировки (например, каталога); без него ключи
+            считаются заново.
     """
-    if sort_field != "temperature":
-        return
-
+    sort_index = sort_index or SortIndex(())
     for country in countries_data["countries"].values():
         for _service_name, service_data in country["services"].items():
-            structures = service_data["structures"]
-            service_data["structures"] = sorted(
-                structures,
-                key=lambda s: get_structure_sort_key(sort_field=sort_field, structure=s),
-            )
+            service_data["structures"] = sort_index.sort(service_data["structures"], sort_field)
 
 
 def build_template_data(
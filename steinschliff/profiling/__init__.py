@@ -0,0 +1,10 @@
+"""Инструменты профилирования команд и pipeline.
+
+Модули пакета не зависят от CLI: обвязка для Typer живёт в `steinschliff.cli.profiling`.
+"""
+
+from .cpu import CommandProfiler
+from .memory import MemoryProfiler
+from .sampler import DEFAULT_SAMPLE_RATE_HZ, StackSampler
+
+__all__ = ["DEFAULT_SAMPLE_RATE_HZ", "CommandProfiler", "MemoryProfiler", "StackSampler"]
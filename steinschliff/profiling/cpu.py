@@ -0,0 +1,69 @@
+"""Детерминированное профилирование через `cProfile`/`pstats`.
+
+Профиль сохраняется в стандартном формате pstats (его понимают `snakeviz`, `pstats`,
+`gprof2dot`), а краткий отчёт показывает только функции пакета `steinschliff`.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import re
+from pathlib import Path
+from typing import TextIO
+
+from steinschliff.paths import package_root
+
+DEFAULT_TOP_ENTRIES = 25
+
+
+def package_filter_pattern() -> str:
+    """Получить regex-ограничение pstats, оставляющее только функции пакета `steinschliff`.
+
+    Фильтр строится по абсолютному пути пакета, а не по имени: иначе в отчёт попадали бы
+    файлы виртуального окружения, лежащего внутри репозитория.
+
+    Returns:
+        Регулярное выражение для `pstats.Stats.print_stats`.
+    """
+    return re.escape(str(package_root()))
+
+
+class CommandProfiler:
+    """Обёртка над `cProfile.Profile` для профилирования одной CLI-команды."""
+
+    def __init__(self, out_path: str | Path, *, top: int = DEFAULT_TOP_ENTRIES) -> None:
+        """Создать профайлер.
+
+        Args:
+            out_path: Куда сохранить pstats-дамп.
+            top: Сколько записей показать в отчёте (после фильтра по пакету).
+        """
+        self.out_path = Path(out_path)
+        self.top = top
+        self._profile = cProfile.Profile()
+        self._running = False
+
+    def start(self) -> None:
+        """Начать сбор профиля."""
+        self._profile.enable()
+        self._running = True
+
+    def stop(self) -> None:
+        """Остановить сбор профиля и сохранить pstats в `out_path`."""
+        if self._running:
+            self._profile.disable()
+            self._running = False
+
+        self.out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(str(self.out_path))
+
+    def report(self, stream: TextIO) -> None:
+        """Напечатать топ записей по cumulative time, ограниченный функциями `steinschliff`.
+
+        Args:
+            stream: Текстовый поток для отчёта (обычно stderr, чтобы не портить stdout команды).
+        """
+        # strip_dirs() не вызываем: полный путь нужен для фильтра по пакету.
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(package_filter_pattern(), self.top)
@@ -0,0 +1,249 @@
+"""Профиль памяти по стадиям pipeline (tracemalloc).
+
+Профайлер подписывается на границы span (см. `steinschliff.profiling.trace`) и на
+каждой стадии (`pipeline`/`export`/`cli`, без по-файловых `io`-span) фиксирует:
+- пиковое потребление внутри стадии
+- прирост памяти за стадию (конец − начало)
+- снимок `tracemalloc` на выходе из стадии, если памяти занято больше, чем на всех
+  предыдущих границах
+
+Аллокации из этого самого “тяжёлого” снимка группируются по ближайшему кадру
+пакета `steinschliff`: так видно, кто “держит” память — YAML-словари, pydantic-модели,
+копии `StructureInfo` или отрендеренный README.
+"""
+
+from __future__ import annotations
+
+import threading
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from steinschliff.paths import package_root, project_root
+
+from .trace import add_span_observer, remove_span_observer
+
+STAGE_CATEGORIES = frozenset({"cli", "pipeline", "export"})
+DEFAULT_TRACEBACK_FRAMES = 25
+DEFAULT_TOP_SITES = 15
+OUTSIDE_PACKAGE = "<вне steinschliff>"
+
+
+@dataclass(frozen=True)
+class StageMemory:
+    """Память одной стадии pipeline.
+
+    Attributes:
+        order: Порядковый номер входа в стадию (для вывода в хронологическом порядке).
+        name: Имя span стадии.
+        depth: Глубина вложенности (0 — верхний уровень).
+        start_bytes: Занятая память на входе в стадию.
+        end_bytes: Занятая память на выходе из стадии.
+        peak_bytes: Пик внутри стадии.
+    """
+
+    order: int
+    name: str
+    depth: int
+    start_bytes: int
+    end_bytes: int
+    peak_bytes: int
+
+    @property
+    def growth_bytes(self) -> int:
+        """Прирост памяти за стадию (может быть отрицательным)."""
+        return self.end_bytes - self.start_bytes
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """Агрегированная аллокация, отнесённая к коду `steinschliff`.
+
+    Attributes:
+        module: Модуль пакета (например, `steinschliff.pipeline.readme`) или `OUTSIDE_PACKAGE`.
+        location: `путь:строка` ближайшего кадра пакета.
+        size_bytes: Суммарный объём живых блоков.
+        blocks: Количество блоков.
+    """
+
+    module: str
+    location: str
+    size_bytes: int
+    blocks: int
+
+
+@dataclass
+class _OpenStage:
+    order: int
+    name: str
+    start_bytes: int
+    peak_bytes: int
+
+
+def _module_name(filename: str, root: str) -> str:
+    path, base = Path(filename), Path(root).parent
+    if not path.is_relative_to(base):
+        return filename
+    relative = path.relative_to(base).with_suffix("")
+    parts = relative.parts[:-1] if relative.name == "__init__" else relative.parts
+    return ".".join(parts)
+
+
+def _aggregate_sites(snapshot: tracemalloc.Snapshot) -> list[AllocationSite]:
+    """Сгруппировать живые аллокации снимка по ближайшему кадру `steinschliff`.
+
+    Каждый блок относится к самому глубокому кадру пакета в его traceback, поэтому
+    аллокации внутри PyYAML/pydantic/Jinja2 попадают на вызывающую строку пакета.
+    """
+    root = str(package_root())
+    project = project_root()
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            # Собственные структуры профайлера в отчёт не попадают.
+            tracemalloc.Filter(False, str(Path(__file__).parent / "*"), all_frames=True),
+        ]
+    )
+    modules: dict[str, str] = {}
+    paths: dict[str, str] = {}
+    sizes: Counter[tuple[str, str]] = Counter()
+    blocks: Counter[tuple[str, str]] = Counter()
+
+    # statistics("traceback") заранее схлопывает одинаковые traceback — их намного меньше, чем блоков.
+    for stat in snapshot.statistics("traceback"):
+        key = (OUTSIDE_PACKAGE, OUTSIDE_PACKAGE)
+        # Кадры traceback идут от самого старого к самому свежему — ищем с конца.
+        for frame in reversed(stat.traceback):
+            filename = frame.filename
+            if filename.startswith(root):
+                module = modules.get(filename)
+                if module is None:
+                    module = modules[filename] = _module_name(filename, root)
+                    path = Path(filename)
+                    paths[filename] = path.relative_to(project).as_posix() if path.is_relative_to(project) else filename
+                key = (module, f"{paths[filename]}:{frame.lineno}")
+                break
+        sizes[key] += stat.size
+        blocks[key] += stat.count
+
+    return [
+        AllocationSite(module=module, location=location, size_bytes=size, blocks=blocks[(module, location)])
+        for (module, location), size in sizes.most_common()
+    ]
+
+
+class MemoryProfiler:
+    """Профайлер памяти по стадиям (наблюдатель span).
+
+    Вложенные стадии поддерживаются: перед сбросом пикового счётчика `tracemalloc`
+    текущий пик переносится во все открытые родительские стадии.
+
+    Span приходят и из рабочих потоков (пул `build`, асинхронная загрузка YAML), поэтому
+    стек открытых стадий ведётся отдельно для каждого потока. Пиковый счётчик `tracemalloc`
+    общий на процесс, так что пик переносится в открытые стадии всех потоков.
+    """
+
+    def __init__(self, *, frames: int = DEFAULT_TRACEBACK_FRAMES, top: int = DEFAULT_TOP_SITES) -> None:
+        """Создать профайлер.
+
+        Args:
+            frames: Глубина traceback в `tracemalloc` (нужна, чтобы дойти до кода пакета).
+            top: Сколько мест аллокаций показать.
+        """
+        self.frames = frames
+        self.top = top
+        self.stages: list[StageMemory] = []  # в порядке завершения (вложенные — раньше родителя)
+        self.peak_snapshot_stage = ""
+
+        self._open: dict[int, list[_OpenStage]] = {}
+        self._lock = threading.Lock()
+        self._entered = 0
+        self._peak_snapshot_bytes = -1
+        self._peak_snapshot: tracemalloc.Snapshot | None = None
+        self._peak_sites: list[AllocationSite] | None = None
+        self._started_here = False
+
+    def start(self) -> None:
+        """Включить `tracemalloc` (если ещё не включён) и подписаться на span."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_here = True
+        add_span_observer(self)
+
+    def stop(self) -> None:
+        """Отписаться от span и выключить `tracemalloc`, если его включал профайлер."""
+        remove_span_observer(self)
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    def _fold_peak(self, peak: int) -> None:
+        for stack in self._open.values():
+            for stage in stack:
+                stage.peak_bytes = max(stage.peak_bytes, peak)
+
+    def span_started(self, name: str, category: str, args: dict[str, Any]) -> None:  # noqa: ARG002
+        """Открыть стадию: запомнить память на входе и сбросить пиковый счётчик."""
+        if category not in STAGE_CATEGORIES:
+            return
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            self._fold_peak(peak)
+            tracemalloc.reset_peak()
+            stack = self._open.setdefault(threading.get_ident(), [])
+            stack.append(_OpenStage(order=self._entered, name=name, start_bytes=current, peak_bytes=current))
+            self._entered += 1
+
+    def span_finished(self, name: str, category: str, args: dict[str, Any]) -> None:  # noqa: ARG002
+        """Закрыть стадию: зафиксировать пик/прирост и снять снимок."""
+        if category not in STAGE_CATEGORIES:
+            return
+        with self._lock:
+            stack = self._open.get(threading.get_ident())
+            if not stack:
+                return
+            current, peak = tracemalloc.get_traced_memory()
+            self._fold_peak(peak)
+            stage = stack.pop()
+            self.stages.append(
+                StageMemory(
+                    order=stage.order,
+                    name=stage.name,
+                    depth=len(stack),
+                    start_bytes=stage.start_bytes,
+                    end_bytes=current,
+                    peak_bytes=stage.peak_bytes,
+                )
+            )
+            if not stack:
+                del self._open[threading.get_ident()]
+
+            if current > self._peak_snapshot_bytes:
+                # Сырые трассы снимка создаются без трассировки, поэтому хранение снимка не искажает
+                # замеры следующих стадий; агрегация откладывается до отчёта.
+                self._peak_snapshot_bytes = current
+                self._peak_snapshot = tracemalloc.take_snapshot()
+                self._peak_sites = None
+                self.peak_snapshot_stage = stage.name
+
+    def _sites(self) -> list[AllocationSite]:
+        if self._peak_sites is None:
+            self._peak_sites = _aggregate_sites(self._peak_snapshot) if self._peak_snapshot is not None else []
+        return self._peak_sites
+
+    def top_sites(self) -> list[AllocationSite]:
+        """Места аллокаций самого “тяжёлого” снимка, сгруппированные по коду `steinschliff`.
+
+        Returns:
+            Места аллокаций, отсортированные по убыванию объёма (не более `top`).
+        """
+        return self._sites()[: self.top]
+
+    def module_totals(self) -> list[tuple[str, int]]:
+        """Суммарный объём живых аллокаций самого “тяжёлого” снимка по модулям пакета (по убыванию)."""
+        totals: Counter[str] = Counter()
+        for site in self._sites():
+            totals[site.module] += site.size_bytes
+        return totals.most_common()
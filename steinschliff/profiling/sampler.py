@@ -0,0 +1,122 @@
+"""Сэмплирующий профайлер на сигналах (stdlib-only).
+
+В отличие от `cProfile`, профайлер не перехватывает каждый вызов: по таймеру
+`ITIMER_PROF` (процессорное время процесса) приходит `SIGPROF`, и обработчик
+снимает текущие стеки потоков. Поэтому мелкие “горячие” функции (форматтеры,
+Jinja-фильтры) не искажаются накладными расходами на вызов.
+
+Результат пишется в формате collapsed stacks (“folded”): одна строка на уникальный
+стек, кадры через `;`, в конце — число сэмплов. Формат понимают `flamegraph.pl`,
+`inferno` и speedscope.
+"""
+
+from __future__ import annotations
+
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+
+from steinschliff.exceptions import SteinschliffUserError
+
+DEFAULT_SAMPLE_RATE_HZ = 200
+MAX_STACK_DEPTH = 256
+
+
+class StackSampler:
+    """Сэмплер стеков по `SIGPROF` с выводом в collapsed-формат.
+
+    Запускать и останавливать нужно из главного потока (ограничение модуля `signal`).
+    """
+
+    def __init__(self, out_path: str | Path, *, rate_hz: int = DEFAULT_SAMPLE_RATE_HZ) -> None:
+        """Создать сэмплер.
+
+        Args:
+            out_path: Куда сохранить collapsed stacks.
+            rate_hz: Частота сэмплирования (сэмплов в секунду процессорного времени).
+
+        Raises:
+            SteinschliffUserError: Если частота некорректна или платформа не поддерживает `setitimer`.
+        """
+        if rate_hz <= 0:
+            msg = f"Частота сэмплирования должна быть положительной, получено: {rate_hz}"
+            raise SteinschliffUserError(msg)
+        if not hasattr(signal, "setitimer"):
+            raise SteinschliffUserError("Сэмплирующий профайлер недоступен на этой платформе (нужен signal.setitimer)")
+
+        self.out_path = Path(out_path)
+        self.interval = 1.0 / rate_hz
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.handler_seconds = 0.0
+        self.wall_seconds = 0.0
+
+        self._labels: dict[CodeType, str] = {}
+        self._previous_handler: Any = None
+        self._started_at = 0.0
+        self._running = False
+
+    def _label(self, code: CodeType, module: str) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{module}:{code.co_qualname}"
+            self._labels[code] = label
+        return label
+
+    def _collapse(self, frame: FrameType | None, root: str | None = None) -> str:
+        parts: list[str] = []
+        while frame is not None and len(parts) < MAX_STACK_DEPTH:
+            parts.append(self._label(frame.f_code, frame.f_globals.get("__name__", "?")))
+            frame = frame.f_back
+        if root:
+            parts.append(root)
+        parts.reverse()
+        return ";".join(parts)
+
+    def _handle(self, _signum: int, frame: FrameType | None) -> None:
+        started = time.perf_counter()
+
+        main_ident = threading.main_thread().ident
+        other_frames = {ident: f for ident, f in sys._current_frames().items() if ident != main_ident}
+        if other_frames:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            self.stacks[self._collapse(frame, root="thread:MainThread")] += 1
+            for ident, thread_frame in other_frames.items():
+                self.stacks[self._collapse(thread_frame, root=f"thread:{names.get(ident, ident)}")] += 1
+        else:
+            self.stacks[self._collapse(frame)] += 1
+
+        self.samples += 1
+        self.handler_seconds += time.perf_counter() - started
+
+    def start(self) -> None:
+        """Установить обработчик `SIGPROF` и запустить таймер."""
+        self._previous_handler = signal.signal(signal.SIGPROF, self._handle)
+        self._started_at = time.perf_counter()
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self._running = True
+
+    def stop(self) -> None:
+        """Остановить таймер, восстановить обработчик и сохранить collapsed stacks."""
+        if self._running:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+            self.wall_seconds = time.perf_counter() - self._started_at
+            self._running = False
+
+        self.out_path.parent.mkdir(parents=True, exist_ok=True)
+        self.out_path.write_text("".join(f"{line}\n" for line in self.folded_lines()), encoding="utf-8")
+
+    @property
+    def overhead(self) -> float:
+        """Доля wall-time, потраченная внутри обработчика сигнала (0…1)."""
+        return self.handler_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def folded_lines(self) -> list[str]:
+        """Получить строки collapsed-формата (`frame;frame;frame count`), отсортированные по стеку."""
+        return [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
@@ -0,0 +1,198 @@
+"""Span-инструментирование pipeline с экспортом в Chrome trace-event JSON.
+
+Pipeline размечается через контекстный менеджер `span(...)`. Пока нет подписанных
+наблюдателей (`start_tracing()`, профиль памяти), `span` почти ничего не стоит: одна
+проверка глобального кортежа. Включённый recorder собирает события “complete” (`ph: "X"`) с `pid`/`tid`,
+поэтому параллельные шаги на таймлайне раскладываются по своим потокам.
+
+Итоговый файл открывается в `chrome://tracing`, Perfetto UI или speedscope.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Protocol
+
+DEFAULT_CATEGORY = "pipeline"
+
+
+class SpanObserver(Protocol):
+    """Наблюдатель за границами span (трассировка, профиль памяти и т.п.)."""
+
+    def span_started(self, name: str, category: str, args: dict[str, Any]) -> None:
+        """Вызывается при входе в span."""
+
+    def span_finished(self, name: str, category: str, args: dict[str, Any]) -> None:
+        """Вызывается при выходе из span (в том числе по исключению)."""
+
+
+class TraceRecorder:
+    """Потокобезопасный сборщик trace-событий."""
+
+    def __init__(self) -> None:
+        """Создать recorder; отсчёт времени ведётся от момента создания."""
+        self.events: list[dict[str, Any]] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._thread_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def now_us(self) -> float:
+        """Текущее время в микросекундах от начала трассировки."""
+        return (time.perf_counter_ns() - self._origin_ns) / 1000
+
+    def _starts(self) -> list[float]:
+        starts: list[float] | None = getattr(self._local, "starts", None)
+        if starts is None:
+            starts = []
+            self._local.starts = starts
+        return starts
+
+    def span_started(self, name: str, category: str, args: dict[str, Any]) -> None:  # noqa: ARG002
+        """Запомнить время начала span (стек — на поток)."""
+        self._starts().append(self.now_us())
+
+    def span_finished(self, name: str, category: str, args: dict[str, Any]) -> None:
+        """Записать завершённый span."""
+        start_us = self._starts().pop()
+        self.add_complete(name, category=category, start_us=start_us, duration_us=self.now_us() - start_us, args=args)
+
+    def add_complete(
+        self,
+        name: str,
+        *,
+        category: str,
+        start_us: float,
+        duration_us: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Добавить завершённый span (`ph: "X"`) для текущего потока.
+
+        Args:
+            name: Имя span.
+            category: Категория (`cat`) — удобно для фильтрации в просмотрщике.
+            start_us: Начало span (мкс от начала трассировки).
+            duration_us: Длительность span (мкс).
+            args: Дополнительные атрибуты (попадают в `args`).
+        """
+        thread = threading.current_thread()
+        tid = threading.get_native_id()
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_us,
+            "dur": duration_us,
+            "pid": os.getpid(),
+            "tid": tid,
+        }
+        if args:
+            event["args"] = {
+                key: value if isinstance(value, int | float | bool) else str(value) for key, value in args.items()
+            }
+
+        with self._lock:
+            self.events.append(event)
+            self._thread_names.setdefault(tid, thread.name)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Собрать документ в формате Chrome trace-event (JSON Object Format).
+
+        Returns:
+            Словарь с ключами `traceEvents` и `displayTimeUnit`.
+        """
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+            thread_names = dict(self._thread_names)
+
+        metadata: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "steinschliff"}}
+        ]
+        metadata.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in sorted(thread_names.items())
+        )
+        return {"traceEvents": [*metadata, *sorted(events, key=lambda e: e["ts"])], "displayTimeUnit": "ms"}
+
+    def write(self, out_path: str | Path) -> Path:
+        """Сохранить трассу в JSON-файл.
+
+        Args:
+            out_path: Путь выходного файла.
+
+        Returns:
+            Путь к записанному файлу.
+        """
+        out = Path(out_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with out.open("w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        return out
+
+
+_observers: tuple[SpanObserver, ...] = ()
+_recorder: TraceRecorder | None = None
+
+
+def add_span_observer(observer: SpanObserver) -> None:
+    """Подписать наблюдателя на границы span."""
+    global _observers  # noqa: PLW0603 — реестр наблюдателей на процесс
+    _observers = (*_observers, observer)
+
+
+def remove_span_observer(observer: SpanObserver) -> None:
+    """Отписать наблюдателя (если он был подписан)."""
+    global _observers  # noqa: PLW0603 — реестр наблюдателей на процесс
+    _observers = tuple(o for o in _observers if o is not observer)
+
+
+def start_tracing() -> TraceRecorder:
+    """Включить сбор span и вернуть активный recorder."""
+    global _recorder  # noqa: PLW0603 — один recorder на процесс
+    stop_tracing()
+    _recorder = TraceRecorder()
+    add_span_observer(_recorder)
+    return _recorder
+
+
+def stop_tracing() -> TraceRecorder | None:
+    """Выключить сбор span.
+
+    Returns:
+        Recorder, который был активен (или `None`).
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None:
+        remove_span_observer(recorder)
+    return recorder
+
+
+@contextmanager
+def span(name: str, *, category: str = DEFAULT_CATEGORY, **args: Any) -> Iterator[None]:
+    """Разметить участок кода как span трассы.
+
+    Args:
+        name: Имя span (например, `load_structures`).
+        category: Категория события.
+        **args: Атрибуты span (путь файла, локаль и т.п.).
+    """
+    observers = _observers
+    if not observers:
+        yield
+        return
+
+    for observer in observers:
+        observer.span_started(name, category, args)
+    try:
+        yield
+    finally:
+        for observer in reversed(observers):
+            observer.span_finished(name, category, args)
@@ -0,0 +1,13 @@
+"""Многокритериальные запросы к каталогу: язык запросов и планировщик по posting-спискам."""
+
+from .language import FIELD_ALIASES, Predicate, parse_query, parse_temperature
+from .planner import PlanStep, QueryIndex
+
+__all__ = [
+    "FIELD_ALIASES",
+    "PlanStep",
+    "Predicate",
+    "QueryIndex",
+    "parse_query",
+    "parse_temperature",
+]
@@ -0,0 +1,123 @@
+"""Язык запросов к каталогу (`steinschliff query "..."`).
+
+Запрос — последовательность условий через пробел, все условия должны выполняться (AND):
+
+- `поле:значение` — предикат по полю; несколько значений через запятую объединяются (OR):
+  `service:fisch*,uventa`;
+- слово без поля — поиск подстроки в имени и описаниях (`text:`);
+- значения с пробелами берутся в кавычки: `country:"Россия"`, `"мелкий рисунок"`.
+
+Поля (в скобках — сокращения): `service` (`s`), `country`, `condition` (`c`), `tag`,
+`snow_type` (`snow`), `temperature` (`temp`, `t`), `text` (`q`).
+
+Температура — одно значение (допускается десятичная запятая): точка `temp:-5` (диапазон
+структуры содержит −5 °C) или интервал `temp:-10..0` (диапазон структуры пересекается с
+интервалом).
+"""
+
+from __future__ import annotations
+
+import shlex
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Literal
+
+Field = Literal["service", "country", "condition", "tag", "snow_type", "temperature", "text"]
+Range = tuple[float, float]
+
+FIELD_ALIASES: Mapping[str, Field] = {
+    "service": "service",
+    "s": "service",
+    "country": "country",
+    "condition": "condition",
+    "c": "condition",
+    "tag": "tag",
+    "tags": "tag",
+    "snow_type": "snow_type",
+    "snow": "snow_type",
+    "temperature": "temperature",
+    "temp": "temperature",
+    "t": "temperature",
+    "text": "text",
+    "q": "text",
+}
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """Условие запроса.
+
+    Attributes:
+        field: Поле каталога.
+        values: Допустимые значения (структура подходит, если подходит любое).
+    """
+
+    field: Field
+    values: tuple[str, ...]
+
+    def __str__(self) -> str:
+        """Предикат в синтаксисе языка запросов."""
+        values = ",".join(f'"{v}"' if " " in v else v for v in self.values)
+        return f"{self.field}:{values}"
+
+
+def parse_temperature(value: str) -> Range:
+    """Разобрать температуру: точку `-5` или интервал `-10..0`.
+
+    Args:
+        value: Значение из запроса (допускается десятичная запятая).
+
+    Returns:
+        Интервал `(low, high)`, `low <= high`; для точки `low == high`.
+
+    Raises:
+        ValueError: Если значение не число и не интервал.
+    """
+    text = value.strip().replace(",", ".")
+    low, sep, high = text.partition("..")
+    try:
+        ends = (float(low), float(high)) if sep else (float(text), float(text))
+    except ValueError:
+        msg = f"Некорректная температура '{value}' (ожидается, например, -5 или -10..0)"
+        raise ValueError(msg) from None
+    return min(ends), max(ends)
+
+
+def parse_query(expression: str) -> list[Predicate]:
+    """Разобрать запрос.
+
+    Args:
+        expression: Текст запроса (см. описание модуля).
+
+    Returns:
+        Предикаты в порядке записи.
+
+    Raises:
+        ValueError: Если запрос синтаксически некорректен или поле неизвестно.
+    """
+    try:
+        tokens = shlex.split(expression)
+    except ValueError as err:
+        msg = f"Некорректный запрос: {err}"
+        raise ValueError(msg) from None
+
+    predicates = []
+    for token in tokens:
+        name, sep, raw = token.partition(":")
+        if not sep:
+            name, raw = "text", token
+        field = FIELD_ALIASES.get(name.strip().lower())
+        if field is None:
+            msg = f"Неизвестное поле '{name}'. Допустимо: {', '.join(sorted(set(FIELD_ALIASES.values())))}"
+            raise ValueError(msg)
+        # В тексте и температуре запятая — часть значения (`-2,5`), а не разделитель.
+        values = (raw.strip(),) if field in ("text", "temperature") else tuple(v.strip() for v in raw.split(","))
+        values = tuple(v for v in values if v)
+        if not values:
+            msg = f"Пустое значение в '{token}'"
+            raise ValueError(msg)
+        if field == "temperature":
+            for value in values:
+                parse_temperature(value)
+        predicates.append(Predicate(field, values))
+    return predicates
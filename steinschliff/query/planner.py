@@ -0,0 +1,238 @@
+"""Планировщик и исполнитель запросов к каталогу.
+
+`QueryIndex` строится один раз на каталог и хранит:
+
+- posting-списки (`frozenset` позиций структур) для `service`, `condition`, `tag`,
+  `snow_type`; `country` раскрывается в сервисы через `ServiceIndex`;
+- диапазоны температур каждой структуры и отсортированные концы всех диапазонов — по ним
+  бинарным поиском оценивается, сколько структур подходит под температуру;
+- нормализованный текст (имя и описания) для поиска подстроки.
+
+План — предикаты по возрастанию оценки числа подходящих структур. Для posting-предикатов
+оценка точная (размер объединения списков), для температуры — верхняя граница по
+отсортированным концам, для текста — весь каталог. Первый шаг даёт множество кандидатов
+(posting-список или проход по каталогу); следующие posting-предикаты пересекаются с ним,
+а температура и текст проверяются только на оставшихся кандидатах.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal
+
+from steinschliff.models import StructureInfo
+from steinschliff.snow_conditions import SnowConditionRegistry, get_registry, temperature_ranges
+
+from .language import Predicate, Range, parse_query, parse_temperature
+
+if TYPE_CHECKING:
+    from steinschliff.catalog.selection import ServiceIndex
+
+Access = Literal["postings", "scan", "filter"]
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """Шаг плана запроса.
+
+    Attributes:
+        predicate: Предикат.
+        estimate: Оценка числа подходящих структур по статистике индекса.
+        access: Способ вычисления: `postings` — posting-список (пересечение с кандидатами),
+            `scan` — проход по каталогу (первый шаг без posting-списка), `filter` — проверка
+            оставшихся кандидатов.
+        ids: Posting-список предиката (для `postings`).
+        test: Проверка позиции структуры (для `scan` и `filter`).
+    """
+
+    predicate: Predicate
+    estimate: int
+    access: Access
+    ids: frozenset[int] | None = field(default=None, repr=False, compare=False)
+    test: Callable[[int], bool] | None = field(default=None, repr=False, compare=False)
+
+
+def _searchable_text(s: StructureInfo) -> str:
+    return "\n".join(str(part).casefold() for part in (s.name, s.description, s.description_ru) if part)
+
+
+class QueryIndex:
+    """Индекс каталога для многокритериальных запросов (строится один раз на каталог)."""
+
+    def __init__(
+        self,
+        services: Mapping[str, Sequence[StructureInfo]],
+        *,
+        service_index: ServiceIndex,
+        registry: SnowConditionRegistry | None = None,
+    ) -> None:
+        """Построить индекс.
+
+        Args:
+            services: Маппинг `service_key -> list[StructureInfo]`.
+            service_index: Индекс имён сервисов и стран (для `service` и `country`).
+            registry: Реестр условий снега (по умолчанию — `get_registry()`).
+        """
+        self.service_index = service_index
+        self.registry = registry or get_registry()
+        self.service_keys: list[str] = []
+        self.structures: list[StructureInfo] = []
+        self.ranges: list[tuple[Range, ...]] = []
+        self.texts: list[str] = []
+        postings: dict[str, dict[str, list[int]]] = {"service": {}, "condition": {}, "tag": {}, "snow_type": {}}
+        for service, items in services.items():
+            for s in items:
+                position = len(self.structures)
+                self.service_keys.append(service)
+                self.structures.append(s)
+                self.ranges.append(temperature_ranges(s.temperature))
+                self.texts.append(_searchable_text(s))
+                values = {
+                    "service": {service},
+                    "condition": {c} if (c := (s.condition or "").strip().lower()) else set(),
+                    "tag": {str(t).strip().casefold() for t in s.tags or [] if t},
+                    "snow_type": {part.strip().lower() for part in (s.snow_type or "").split(",") if part.strip()},
+                }
+                for group, keys in values.items():
+                    for key in keys:
+                        postings[group].setdefault(key, []).append(position)
+        self.postings: Mapping[str, Mapping[str, frozenset[int]]] = MappingProxyType(
+            {group: {key: frozenset(ids) for key, ids in by_key.items()} for group, by_key in postings.items()}
+        )
+        self._lows = sorted(low for ranges in self.ranges for low, _ in ranges)
+        self._highs = sorted(high for ranges in self.ranges for _, high in ranges)
+
+    def __len__(self) -> int:
+        """Количество структур в индексе."""
+        return len(self.structures)
+
+    def _posting_keys(self, predicate: Predicate) -> tuple[str, Sequence[str]]:
+        if predicate.field == "service":
+            return "service", self.service_index.resolve_many(predicate.values)
+        if predicate.field == "country":
+            return "service", self.service_index.by_country(predicate.values)
+        if predicate.field == "condition":
+            keys = []
+            for value in predicate.values:
+                match = self.registry.match(value)
+                if match.value is None:
+                    msg = f"Неизвестное условие '{value}'"
+                    if match.suggestions:
+                        msg += f". Возможно: {', '.join(match.suggestions)}"
+                    raise ValueError(msg)
+                keys.append(match.value)
+            return "condition", keys
+        if predicate.field == "tag":
+            return "tag", [value.casefold() for value in predicate.values]
+        return "snow_type", [value.lower() for value in predicate.values]
+
+    def _posting(self, predicate: Predicate) -> frozenset[int]:
+        group, keys = self._posting_keys(predicate)
+        lists = [self.postings[group].get(key, frozenset()) for key in keys]
+        return lists[0] if len(lists) == 1 else frozenset().union(*lists)
+
+    def _temperature_test(self, predicate: Predicate) -> tuple[int, Callable[[int], bool]]:
+        low, high = parse_temperature(predicate.values[0])
+        # Подходят диапазоны с началом не выше `high` и концом не ниже `low`.
+        estimate = min(bisect.bisect_right(self._lows, high), len(self._highs) - bisect.bisect_left(self._highs, low))
+        ranges = self.ranges
+        return min(estimate, len(self)), lambda i: any(lo <= high and hi >= low for lo, hi in ranges[i])
+
+    def _text_test(self, predicate: Predicate) -> tuple[int, Callable[[int], bool]]:
+        needles = [value.casefold() for value in predicate.values]
+        texts = self.texts
+        return len(self), lambda i: any(needle in texts[i] for needle in needles)
+
+    def plan(self, predicates: Sequence[Predicate]) -> list[PlanStep]:
+        """Составить план: предикаты по возрастанию оценки числа подходящих структур.
+
+        Args:
+            predicates: Предикаты запроса (все должны выполняться).
+
+        Returns:
+            Шаги плана в порядке выполнения.
+
+        Raises:
+            ValueError: Если сервис, страна, условие или температура не распознаны.
+        """
+        steps = []
+        for predicate in predicates:
+            if predicate.field in ("temperature", "text"):
+                make_test = self._temperature_test if predicate.field == "temperature" else self._text_test
+                estimate, test = make_test(predicate)
+                steps.append(PlanStep(predicate, estimate, "filter", test=test))
+            else:
+                ids = self._posting(predicate)
+                steps.append(PlanStep(predicate, len(ids), "postings", ids=ids))
+        # При равной оценке posting-список дешевле проверки кандидатов.
+        steps.sort(key=lambda step: (step.estimate, step.access != "postings"))
+        if steps and steps[0].access == "filter":
+            first = steps[0]
+            steps[0] = PlanStep(first.predicate, first.estimate, "scan", test=first.test)
+        return steps
+
+    def execute(self, steps: Sequence[PlanStep]) -> list[int]:
+        """Выполнить план.
+
+        Args:
+            steps: Шаги из `plan`.
+
+        Returns:
+            Позиции подходящих структур в порядке каталога.
+        """
+        candidates: set[int] | frozenset[int] | None = None
+        for step in steps:
+            if candidates is not None and not candidates:
+                break
+            if step.ids is not None:
+                candidates = step.ids if candidates is None else candidates & step.ids
+            elif step.test is not None:
+                pool = range(len(self)) if candidates is None else candidates
+                candidates = {i for i in pool if step.test(i)}
+        return list(range(len(self))) if candidates is None else sorted(candidates)
+
+    def run(self, query: str | Sequence[Predicate]) -> list[int]:
+        """Разобрать (если нужно), спланировать и выполнить запрос.
+
+        Args:
+            query: Текст запроса или готовые предикаты.
+
+        Returns:
+            Позиции подходящих структур в порядке каталога.
+
+        Raises:
+            ValueError: Если запрос некорректен или значение не распознано.
+        """
+        predicates = parse_query(query) if isinstance(query, str) else query
+        return self.execute(self.plan(predicates))
+
+    def select(self, query: str | Sequence[Predicate]) -> Mapping[str, list[StructureInfo]]:
+        """Выполнить запрос и сгруппировать результат по сервисам (как `Catalog.select`).
+
+        Args:
+            query: Текст запроса или готовые предикаты.
+
+        Returns:
+            Read-only маппинг `service_key -> структуры` в порядке каталога.
+
+        Raises:
+            ValueError: Если запрос некорректен или значение не распознано.
+        """
+        return self.group(self.run(query))
+
+    def group(self, positions: Iterable[int]) -> Mapping[str, list[StructureInfo]]:
+        """Сгруппировать позиции структур по сервисам.
+
+        Args:
+            positions: Позиции структур (например, результат `execute`).
+
+        Returns:
+            Read-only маппинг `service_key -> структуры` в порядке позиций.
+        """
+        selected: dict[str, list[StructureInfo]] = {}
+        for i in positions:
+            selected.setdefault(self.service_keys[i], []).append(self.structures[i])
+        return MappingProxyType(selected)
@@ -0,0 +1,29 @@
+"""Подбор структур по погодным условиям (температура, влажность, возраст снега)."""
+
+from .engine import Recommendation, RecommendIndex, RecommendQuery, recommend, temperature_score
+from .plan import (
+    CoverPick,
+    ForecastPlan,
+    ForecastSlot,
+    SlotPick,
+    greedy_cover,
+    plan_forecast,
+    read_forecast_csv,
+    slot_windows,
+)
+
+__all__ = [
+    "CoverPick",
+    "ForecastPlan",
+    "ForecastSlot",
+    "RecommendIndex",
+    "RecommendQuery",
+    "Recommendation",
+    "SlotPick",
+    "greedy_cover",
+    "plan_forecast",
+    "read_forecast_csv",
+    "recommend",
+    "slot_windows",
+    "temperature_score",
+]
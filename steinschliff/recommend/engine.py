@@ -0,0 +1,431 @@
+"""Подбор структур по погоде: температура воздуха/снега, влажность, возраст снега.
+
+Скоринг связывает два справочника, которые раньше жили отдельно: диапазоны температур
+структур и описания условий снега (`snow_conditions/*.yaml`: температура, `humidity`,
+`snow_age`). Итоговый балл структуры (0…1) — взвешенная сумма:
+
+- температура (`WEIGHT_TEMPERATURE`): внутри диапазона структуры — от 1.0 в центре до 0.5
+  на краю, снаружи — линейное затухание до 0 за `TEMPERATURE_FALLOFF` градусов;
+- условие (`WEIGHT_CONDITION`): насколько условие структуры (`condition`) подходит под
+  погоду — по диапазону температур, влажности и возрасту снега этого условия;
+- тип снега (`WEIGHT_SNOW_TYPE`): пересечение `snow_type` структуры с типами, характерными
+  для заданной влажности и возраста снега (`all`/`universal` — половина балла).
+
+Если влажность и возраст снега не заданы, вес типа снега перераспределяется на остальные.
+
+`RecommendIndex` строится один раз на каталог: диапазоны, коды условий и наборы типов
+снега лежат в колонках, а позиции структур разложены по градусным корзинам — в корзине
+температуры только структуры, чей диапазон с затуханием её накрывает. Балл температуры
+считается только для них, баллы условий и типов снега — один раз на уникальное значение,
+а не на структуру. Для серии запросов (`score_batch`, `top_batch`) баллы переиспользуются
+между запросами с теми же значениями.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Callable, Collection, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal, NamedTuple
+
+from steinschliff.models import StructureInfo
+from steinschliff.snow_conditions import SnowConditionRegistry, get_registry, temperature_ranges
+
+Humidity = Literal["very_dry", "dry", "wet", "saturated"]
+SnowAge = Literal["new", "old", "transformed"]
+
+WEIGHT_TEMPERATURE = 0.5
+WEIGHT_CONDITION = 0.3
+WEIGHT_SNOW_TYPE = 0.2
+# Вес воздуха при известной температуре снега (диапазоны в каталоге заданы по воздуху).
+AIR_SHARE_WITH_SNOW = 0.6
+TEMPERATURE_FALLOFF = 5.0
+# Диапазон шире стольких градусов (с затуханием) не раскладывается по корзинам.
+MAX_BUCKETS_PER_RANGE = 200
+
+UNIVERSAL_SNOW_TYPES = frozenset({"all", "universal"})
+HUMIDITY_SNOW_TYPES: Mapping[str, frozenset[str]] = {
+    "very_dry": frozenset({"dry", "cold", "extremely_cold", "fine", "fine_grained"}),
+    "dry": frozenset({"dry", "cold", "fine", "fine_grained"}),
+    "wet": frozenset({"wet", "damp", "watery", "high_humidity", "spring", "thawed", "warm"}),
+    "saturated": frozenset({"wet", "watery", "water", "rain", "high_humidity", "extreme_humidity", "spring"}),
+}
+SNOW_AGE_SNOW_TYPES: Mapping[str, frozenset[str]] = {
+    "new": frozenset({"fresh", "new", "falling", "fine", "natural"}),
+    "old": frozenset({"old", "transformed", "slightly_transformed", "coarse", "used", "refrozen", "frozen", "icy"}),
+    "transformed": frozenset(
+        {"transformed", "slightly_transformed", "old", "coarse", "refrozen", "frozen", "icy", "hard", "glazed"}
+    ),
+}
+
+Range = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class RecommendQuery:
+    """Погодные условия для подбора.
+
+    Attributes:
+        air: Температура воздуха, °C.
+        snow: Температура снега, °C (если измерена).
+        humidity: Влажность снега.
+        snow_age: Возраст снега.
+    """
+
+    air: float
+    snow: float | None = None
+    humidity: Humidity | None = None
+    snow_age: SnowAge | None = None
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    """Структура с баллом подбора.
+
+    Attributes:
+        service: Ключ сервиса.
+        structure: Структура.
+        score: Итоговый балл (0…1).
+        temperature: Балл температуры.
+        condition: Балл условия.
+        snow_type: Балл типа снега (`None`, если влажность и возраст снега не заданы).
+    """
+
+    service: str
+    structure: StructureInfo
+    score: float
+    temperature: float
+    condition: float
+    snow_type: float | None
+
+
+def temperature_score(t: float, ranges: Sequence[Range]) -> float:
+    """Балл попадания температуры в диапазоны (лучший из диапазонов).
+
+    Args:
+        t: Температура, °C.
+        ranges: Диапазоны `(low, high)`, `low <= high`.
+
+    Returns:
+        1.0 в центре диапазона, 0.5 на краю, снаружи — затухание до 0.
+    """
+    best = 0.0
+    for low, high in ranges:
+        if low <= t <= high:
+            half = (high - low) / 2
+            score = 1.0 - 0.5 * abs(t - (low + half)) / half if half > 0 else 1.0
+        else:
+            distance = low - t if t < low else t - high
+            score = 0.5 * max(0.0, 1.0 - distance / TEMPERATURE_FALLOFF)
+        best = max(best, score)
+    return best
+
+
+def _snow_type_tokens(value: str | None) -> frozenset[str]:
+    return frozenset(part.strip().lower() for part in (value or "").split(",") if part.strip())
+
+
+def _facet_score(value: str | None, allowed: frozenset[str]) -> float | None:
+    if value is None:
+        return None
+    if not allowed:
+        return 0.5  # условие не уточняет этот признак
+    return 1.0 if value in allowed else 0.0
+
+
+class _Scores(NamedTuple):
+    # Балл температуры только у структур, чей диапазон (с затуханием) накрывает температуру;
+    # у остальных он равен 0. Баллы условий и типов снега — по уникальным значениям.
+    temperature: Mapping[int, float]
+    condition: Mapping[str, float]
+    snow_type: Mapping[frozenset[str], float] | None
+
+
+@dataclass(frozen=True)
+class _ConditionFacets:
+    ranges: tuple[Range, ...]
+    humidity: frozenset[str]
+    snow_age: frozenset[str]
+
+
+class RecommendIndex:
+    """Колоночный индекс каталога для подбора (строится один раз на каталог)."""
+
+    def __init__(
+        self,
+        services: Mapping[str, Sequence[StructureInfo]],
+        registry: SnowConditionRegistry | None = None,
+    ) -> None:
+        """Построить индекс.
+
+        Args:
+            services: Маппинг `service_key -> list[StructureInfo]`.
+            registry: Реестр условий снега (по умолчанию — `get_registry()`).
+        """
+        registry = registry or get_registry()
+        self.conditions: dict[str, _ConditionFacets] = {
+            key: _ConditionFacets(
+                ranges=registry.temperatures.get(key, ()),
+                humidity=frozenset(str(v) for v in (registry.info.get(key) or {}).get("humidity") or []),
+                snow_age=frozenset(str(v) for v in (registry.info.get(key) or {}).get("snow_age") or []),
+            )
+            for key in registry.keys
+        }
+        self.service_keys: list[str] = []
+        self.structures: list[StructureInfo] = []
+        self.ranges: list[tuple[Range, ...]] = []
+        self.condition_keys: list[str] = []
+        self.snow_types: list[frozenset[str]] = []
+        for service, items in services.items():
+            for s in items:
+                self.service_keys.append(service)
+                self.structures.append(s)
+                self.ranges.append(temperature_ranges(s.temperature))
+                self.condition_keys.append((s.condition or "").strip().lower())
+                self.snow_types.append(_snow_type_tokens(s.snow_type))
+        self._buckets, self._wide = self._bucket_ranges()
+
+    def _bucket_ranges(self) -> tuple[dict[int, tuple[int, ...]], tuple[int, ...]]:
+        # Градусные корзины: позиция попадает во все корзины, где её балл температуры
+        # может быть больше 0 (диапазон ± `TEMPERATURE_FALLOFF`). Слишком широкие
+        # диапазоны (ошибки в данных) не раскладываются, а проверяются всегда.
+        buckets: dict[int, set[int]] = {}
+        wide: set[int] = set()
+        for position, ranges in enumerate(self.ranges):
+            for low, high in ranges:
+                first = math.floor(low - TEMPERATURE_FALLOFF)
+                last = math.floor(high + TEMPERATURE_FALLOFF)
+                if last - first > MAX_BUCKETS_PER_RANGE:
+                    wide.add(position)
+                    continue
+                for bucket in range(first, last + 1):
+                    buckets.setdefault(bucket, set()).add(position)
+        return {key: tuple(sorted(ids)) for key, ids in buckets.items()}, tuple(sorted(wide))
+
+    def __len__(self) -> int:
+        """Количество структур в индексе."""
+        return len(self.structures)
+
+    def temperature_candidates(self, t: float) -> frozenset[int]:
+        """Позиции структур, у которых балл температуры `t` может быть больше 0.
+
+        Args:
+            t: Температура, °C.
+
+        Returns:
+            Позиции из градусной корзины `t` и структуры со слишком широкими диапазонами;
+            у всех остальных структур балл температуры равен 0.
+        """
+        return frozenset(self._buckets.get(math.floor(t), ())).union(self._wide)
+
+    def _condition_scores(self, query: RecommendQuery) -> dict[str, float]:
+        scores: dict[str, float] = {"": 0.0}
+        for key, facets in self.conditions.items():
+            parts = [(0.5, temperature_score(query.air, facets.ranges) if facets.ranges else 0.5)]
+            humidity = _facet_score(query.humidity, facets.humidity)
+            if humidity is not None:
+                parts.append((0.25, humidity))
+            snow_age = _facet_score(query.snow_age, facets.snow_age)
+            if snow_age is not None:
+                parts.append((0.25, snow_age))
+            scores[key] = sum(w * v for w, v in parts) / sum(w for w, _ in parts)
+        return scores
+
+    def _snow_type_score(self, tokens: frozenset[str], query: RecommendQuery) -> float:
+        wanted = []
+        if query.humidity is not None:
+            wanted.append(HUMIDITY_SNOW_TYPES.get(query.humidity, frozenset()))
+        if query.snow_age is not None:
+            wanted.append(SNOW_AGE_SNOW_TYPES.get(query.snow_age, frozenset()))
+        universal = 0.5 if tokens & UNIVERSAL_SNOW_TYPES else 0.0
+        return sum(1.0 if tokens & group else universal for group in wanted) / len(wanted)
+
+    def _scores(self, query: RecommendQuery, cache: dict[tuple[Any, ...], Any]) -> _Scores:
+        def cached(key: tuple[Any, ...], build: Callable[[], Any]) -> Any:
+            values = cache.get(key)
+            if values is None:
+                values = cache[key] = build()
+            return values
+
+        def temperature(t: float) -> dict[int, float]:
+            return cached(
+                ("t", t),
+                lambda: {i: temperature_score(t, self.ranges[i]) for i in self.temperature_candidates(t)},
+            )
+
+        t_scores = temperature(query.air)
+        if query.snow is not None:
+            air, snow = t_scores, temperature(query.snow)
+            t_scores = cached(
+                ("ts", query.air, query.snow),
+                lambda: {
+                    i: AIR_SHARE_WITH_SNOW * air.get(i, 0.0) + (1 - AIR_SHARE_WITH_SNOW) * snow.get(i, 0.0)
+                    for i in air.keys() | snow.keys()
+                },
+            )
+
+        c_scores = cached(("c", query.air, query.humidity, query.snow_age), lambda: self._condition_scores(query))
+        if query.humidity is None and query.snow_age is None:
+            return _Scores(t_scores, c_scores, None)
+
+        st_scores = cached(
+            ("st", query.humidity, query.snow_age),
+            lambda: {tokens: self._snow_type_score(tokens, query) for tokens in set(self.snow_types)},
+        )
+        return _Scores(t_scores, c_scores, st_scores)
+
+    @staticmethod
+    def _weights(use_snow_type: bool) -> tuple[float, float, float]:
+        if use_snow_type:
+            return WEIGHT_TEMPERATURE, WEIGHT_CONDITION, WEIGHT_SNOW_TYPE
+        total = WEIGHT_TEMPERATURE + WEIGHT_CONDITION
+        return WEIGHT_TEMPERATURE / total, WEIGHT_CONDITION / total, 0.0
+
+    def _scorer(self, scores: _Scores) -> Callable[[int], float]:
+        t_scores, c_scores, st_scores = scores
+        w_t, w_c, w_st = self._weights(st_scores is not None)
+        condition_keys, snow_types = self.condition_keys, self.snow_types
+        if st_scores is None:
+            return lambda i: w_t * t_scores.get(i, 0.0) + w_c * c_scores.get(condition_keys[i], 0.0)
+        return lambda i: (
+            w_t * t_scores.get(i, 0.0) + w_c * c_scores.get(condition_keys[i], 0.0) + w_st * st_scores[snow_types[i]]
+        )
+
+    def _bound_without_temperature(self, scores: _Scores) -> float:
+        # Верхняя граница итогового балла структуры с нулевым баллом температуры.
+        _, c_scores, st_scores = scores
+        _, w_c, w_st = self._weights(st_scores is not None)
+        bound = w_c * max(c_scores.values())
+        if st_scores:
+            bound += w_st * max(st_scores.values())
+        return bound
+
+    def score(self, query: RecommendQuery, *, positions: Collection[int] | None = None) -> list[Recommendation]:
+        """Оценить структуры каталога.
+
+        Args:
+            query: Погодные условия.
+            positions: Оценить только эти позиции индекса (например, выбранные сервисы).
+
+        Returns:
+            Оценки в порядке индекса (по сервисам, как в каталоге).
+        """
+        t_scores, c_scores, st_scores = self._scores(query, {})
+        w_t, w_c, w_st = self._weights(st_scores is not None)
+        results = []
+        for i in range(len(self.structures)) if positions is None else sorted(positions):
+            structure = self.structures[i]
+            t_score = t_scores.get(i, 0.0)
+            c_score = c_scores.get(self.condition_keys[i], 0.0)
+            st_score = st_scores[self.snow_types[i]] if st_scores is not None else None
+            total_score = w_t * t_score + w_c * c_score + w_st * (st_score or 0.0)
+            results.append(
+                Recommendation(
+                    service=self.service_keys[i],
+                    structure=structure,
+                    score=round(total_score, 4),
+                    temperature=round(t_score, 4),
+                    condition=round(c_score, 4),
+                    snow_type=round(st_score, 4) if st_score is not None else None,
+                )
+            )
+        return results
+
+    def score_batch(self, queries: Sequence[RecommendQuery]) -> list[list[float]]:
+        """Итоговые баллы всех структур для серии запросов (например, почасового прогноза).
+
+        Баллы кэшируются на время вызова: температуры — по значению температуры (и только
+        для структур из её градусной корзины), условий — по (воздух, влажность, возраст
+        снега), типов снега — по (влажность, возраст снега). Повторяющиеся значения в
+        прогнозе не пересчитываются. Если нужны только лучшие структуры, `top_batch`
+        дешевле: он не считает баллы всего каталога.
+
+        Args:
+            queries: Запросы.
+
+        Returns:
+            Для каждого запроса — баллы в порядке индекса.
+        """
+        cache: dict[tuple[Any, ...], Any] = {}
+        totals: dict[RecommendQuery, list[float]] = {}
+        results = []
+        for query in queries:
+            row = totals.get(query)
+            if row is None:
+                row = totals[query] = list(map(self._scorer(self._scores(query, cache)), range(len(self))))
+            results.append(row)
+        return results
+
+    def top_batch(
+        self, queries: Sequence[RecommendQuery], top: int, *, positions: Collection[int] | None = None
+    ) -> list[list[tuple[int, float]]]:
+        """Лучшие `top` структур для каждого запроса серии.
+
+        Сначала оцениваются только структуры из градусных корзин температуры запроса
+        (`temperature_candidates`). Остальные структуры могут набрать не больше, чем дают
+        условие и тип снега без температуры; если `top`-й кандидат набрал строго больше
+        этой границы, весь каталог не просматривается.
+
+        Args:
+            queries: Запросы.
+            top: Сколько структур вернуть для запроса.
+            positions: Рассматривать только эти позиции индекса (например, выбранные сервисы).
+
+        Returns:
+            Для каждого запроса — пары `(позиция, балл)` по убыванию балла (при равенстве —
+            по позиции).
+        """
+        allowed = None if positions is None else frozenset(positions)
+        cache: dict[tuple[Any, ...], Any] = {}
+        picks: dict[RecommendQuery, list[tuple[int, float]]] = {}
+        results = []
+        for query in queries:
+            best = picks.get(query)
+            if best is None:
+                scores = self._scores(query, cache)
+                total = self._scorer(scores)
+                candidates = scores.temperature.keys() if allowed is None else scores.temperature.keys() & allowed
+                ranked = heapq.nlargest(top, ((total(i), -i) for i in candidates))
+                if len(ranked) < top or ranked[-1][0] <= self._bound_without_temperature(scores):
+                    pool = range(len(self)) if allowed is None else allowed
+                    ranked = heapq.nlargest(top, ((total(i), -i) for i in pool))
+                best = picks[query] = [(-i, score) for score, i in ranked]
+            results.append(best)
+        return results
+
+
+def recommend(
+    index: RecommendIndex,
+    query: RecommendQuery,
+    *,
+    per_service: int = 3,
+    min_score: float = 0.0,
+    services: Collection[str] | None = None,
+) -> dict[str, list[Recommendation]]:
+    """Подобрать лучшие структуры в каждом сервисе.
+
+    Args:
+        index: Индекс каталога.
+        query: Погодные условия.
+        per_service: Сколько структур оставить в каждом сервисе.
+        min_score: Отбросить структуры с баллом ниже порога.
+        services: Оценивать только структуры этих сервисов.
+
+    Returns:
+        `service_key -> рекомендации` по убыванию балла; сервисы упорядочены по лучшему баллу.
+    """
+    positions = None
+    if services is not None:
+        positions = [i for i, key in enumerate(index.service_keys) if key in services]
+
+    by_service: dict[str, list[Recommendation]] = {}
+    for rec in index.score(query, positions=positions):
+        if rec.score >= min_score:
+            by_service.setdefault(rec.service, []).append(rec)
+
+    ranked = {
+        service: sorted(items, key=lambda r: (-r.score, str(r.structure.name)))[:per_service]
+        for service, items in by_service.items()
+    }
+    return dict(sorted(ranked.items(), key=lambda item: (-item[1][0].score, item[0])))
@@ -0,0 +1,274 @@
+"""План шлифов по прогнозу погоды (`steinschliff plan forecast.csv`).
+
+Прогноз — CSV с колонкой времени, температурой воздуха и (необязательно) температурой
+снега, влажностью и возрастом снега. Для каждого слота пакетно подбираются лучшие `top`
+структур (`RecommendIndex.top_batch`: оцениваются только структуры из градусной корзины
+температуры слота, повторяющиеся погодные условия не пересчитываются), а жадным покрытием
+множеств (greedy set cover) подбирается небольшой набор структур, в котором для каждого
+слота есть хотя бы одна из его лучших.
+"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+from steinschliff.models import StructureInfo
+
+from .engine import HUMIDITY_SNOW_TYPES, SNOW_AGE_SNOW_TYPES, Humidity, RecommendIndex, RecommendQuery, SnowAge
+
+# Допустимые названия колонок CSV (в нижнем регистре).
+COLUMN_ALIASES: Mapping[str, tuple[str, ...]] = {
+    "timestamp": ("timestamp", "time", "datetime", "date"),
+    "air": ("air", "air_temp", "air_temperature", "t_air"),
+    "snow": ("snow", "snow_temp", "snow_temperature", "t_snow"),
+    "humidity": ("humidity",),
+    "snow_age": ("snow_age",),
+}
+
+
+@dataclass(frozen=True)
+class ForecastSlot:
+    """Слот прогноза.
+
+    Attributes:
+        timestamp: Метка времени (как в CSV).
+        query: Погодные условия слота.
+    """
+
+    timestamp: str
+    query: RecommendQuery
+
+
+@dataclass(frozen=True)
+class SlotPick:
+    """Структура среди лучших для слота.
+
+    Attributes:
+        position: Позиция структуры в `RecommendIndex`.
+        service: Ключ сервиса.
+        structure: Структура.
+        score: Балл в этом слоте.
+    """
+
+    position: int
+    service: str
+    structure: StructureInfo
+    score: float
+
+
+@dataclass(frozen=True)
+class CoverPick:
+    """Структура из покрывающего набора.
+
+    Attributes:
+        position: Позиция структуры в `RecommendIndex`.
+        service: Ключ сервиса.
+        structure: Структура.
+        slots: Индексы слотов, которые она закрывает (ещё не закрытые к моменту выбора).
+    """
+
+    position: int
+    service: str
+    structure: StructureInfo
+    slots: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class ForecastPlan:
+    """Результат планирования.
+
+    Attributes:
+        slots: Слоты прогноза.
+        top: Для каждого слота — лучшие структуры по убыванию балла.
+        cover: Покрывающий набор структур в порядке выбора.
+    """
+
+    slots: list[ForecastSlot]
+    top: list[list[SlotPick]]
+    cover: list[CoverPick]
+
+
+def _resolve_columns(fieldnames: Sequence[str] | None) -> dict[str, str]:
+    by_lower = {name.strip().lower(): name for name in fieldnames or []}
+    resolved = {}
+    for column, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in by_lower:
+                resolved[column] = by_lower[alias]
+                break
+    missing = [column for column in ("timestamp", "air") if column not in resolved]
+    if missing:
+        msg = f"В CSV нет колонок: {', '.join(missing)} (ожидаются, например, timestamp, air, snow, humidity)"
+        raise ValueError(msg)
+    return resolved
+
+
+def _optional_choice(value: str | None, allowed: Collection[str], column: str, line: int) -> str | None:
+    text = (value or "").strip().lower()
+    if not text:
+        return None
+    if text not in allowed:
+        msg = f"Строка {line}: неизвестное значение {column} '{value}' (допустимо: {', '.join(sorted(allowed))})"
+        raise ValueError(msg)
+    return text
+
+
+def _temperature(value: str | None, column: str, line: int) -> float | None:
+    text = (value or "").strip().replace(",", ".")
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        msg = f"Строка {line}: некорректная температура {column} '{value}'"
+        raise ValueError(msg) from None
+
+
+def parse_forecast(rows: Iterable[Mapping[str, str | None]], columns: Mapping[str, str]) -> list[ForecastSlot]:
+    """Разобрать строки прогноза.
+
+    Args:
+        rows: Строки CSV (`csv.DictReader`).
+        columns: Маппинг `колонка -> имя в CSV` (см. `COLUMN_ALIASES`).
+
+    Returns:
+        Слоты прогноза.
+
+    Raises:
+        ValueError: Если значение в строке некорректно.
+    """
+
+    def cell(row: Mapping[str, str | None], column: str) -> str | None:
+        return row.get(columns[column]) if column in columns else None
+
+    slots = []
+    for line, row in enumerate(rows, start=2):
+        air = _temperature(cell(row, "air"), "air", line)
+        if air is None:
+            msg = f"Строка {line}: пустое значение air"
+            raise ValueError(msg)
+        query = RecommendQuery(
+            air=air,
+            snow=_temperature(cell(row, "snow"), "snow", line),
+            humidity=cast(
+                "Humidity | None", _optional_choice(cell(row, "humidity"), HUMIDITY_SNOW_TYPES, "humidity", line)
+            ),
+            snow_age=cast(
+                "SnowAge | None", _optional_choice(cell(row, "snow_age"), SNOW_AGE_SNOW_TYPES, "snow_age", line)
+            ),
+        )
+        slots.append(ForecastSlot(timestamp=(cell(row, "timestamp") or "").strip(), query=query))
+    return slots
+
+
+def read_forecast_csv(path: str | Path) -> list[ForecastSlot]:
+    """Прочитать прогноз из CSV.
+
+    Args:
+        path: Путь к CSV (UTF-8, с заголовком).
+
+    Returns:
+        Слоты прогноза в порядке файла.
+
+    Raises:
+        OSError: Если файл не читается.
+        ValueError: Если нет обязательных колонок или значение некорректно.
+    """
+    with Path(path).open(encoding="utf-8-sig", newline="") as handle:
+        reader = csv.DictReader(handle)
+        return parse_forecast(reader, _resolve_columns(reader.fieldnames))
+
+
+def greedy_cover(
+    candidates: Sequence[Collection[int]], weights: Mapping[int, float] | None = None
+) -> list[tuple[int, tuple[int, ...]]]:
+    """Жадное покрытие: выбрать кандидатов, пока все элементы не покрыты.
+
+    На каждом шаге берётся кандидат, покрывающий больше всего непокрытых элементов;
+    при равенстве — с большим весом, затем с меньшим индексом.
+
+    Args:
+        candidates: Для каждого элемента (слота) — множество подходящих кандидатов.
+        weights: Вес кандидата для разрешения равенств.
+
+    Returns:
+        Выбранные кандидаты в порядке выбора вместе с элементами, которые каждый из них
+        покрыл впервые.
+    """
+    covers: dict[int, set[int]] = {}
+    for element, options in enumerate(candidates):
+        for candidate in options:
+            covers.setdefault(candidate, set()).add(element)
+    weights = weights or {}
+    uncovered = {element for element, options in enumerate(candidates) if options}
+    chosen = []
+    while uncovered:
+        best = max(covers, key=lambda c: (len(covers[c] & uncovered), weights.get(c, 0.0), -c))
+        newly = covers.pop(best) & uncovered
+        chosen.append((best, tuple(sorted(newly))))
+        uncovered -= newly
+    return chosen
+
+
+def plan_forecast(
+    index: RecommendIndex,
+    slots: Sequence[ForecastSlot],
+    *,
+    top: int = 3,
+    services: Collection[str] | None = None,
+) -> ForecastPlan:
+    """Подобрать структуры для каждого слота прогноза и покрывающий набор.
+
+    Args:
+        index: Индекс каталога.
+        slots: Слоты прогноза.
+        top: Сколько лучших структур считать подходящими для слота.
+        services: Ограничить подбор этими сервисами.
+
+    Returns:
+        План: лучшие структуры по слотам и покрывающий набор.
+    """
+    positions = None
+    if services is not None:
+        positions = [i for i, key in enumerate(index.service_keys) if key in services]
+
+    def pick(position: int, score: float) -> SlotPick:
+        return SlotPick(position, index.service_keys[position], index.structures[position], round(score, 4))
+
+    top_picks = []
+    totals: dict[int, float] = {}
+    for best in index.top_batch([slot.query for slot in slots], top, positions=positions):
+        top_picks.append([pick(i, score) for i, score in best])
+        for i, score in best:
+            totals[i] = totals.get(i, 0.0) + score
+
+    cover = [
+        CoverPick(position, index.service_keys[position], index.structures[position], covered)
+        for position, covered in greedy_cover([[p.position for p in picks] for picks in top_picks], totals)
+    ]
+    return ForecastPlan(slots=list(slots), top=top_picks, cover=cover)
+
+
+def slot_windows(slots: Sequence[ForecastSlot], indices: Iterable[int]) -> list[tuple[str, str]]:
+    """Свернуть индексы слотов в непрерывные окна `(начало, конец)`.
+
+    Args:
+        slots: Слоты прогноза.
+        indices: Индексы слотов.
+
+    Returns:
+        Окна по меткам времени первого и последнего слота.
+    """
+    windows: list[tuple[str, str]] = []
+    previous = None
+    for i in sorted(indices):
+        if previous is not None and i == previous + 1:
+            windows[-1] = (windows[-1][0], slots[i].timestamp)
+        else:
+            windows.append((slots[i].timestamp, slots[i].timestamp))
+        previous = i
+    return windows
@@ -0,0 +1,23 @@
+"""Локальный JSON API над каталогом структур.
+
+- `api` — маршрутизация и готовые ответы (без привязки к транспорту)
+- `http` — HTTP-сервер на stdlib с ETag и gzip
+- `reload` — горячая перезагрузка каталога при изменении YAML
+- `daemon` — фоновый демон с каталогом в памяти для CLI-команд (Unix socket)
+"""
+
+from .api import ApiResponse, CatalogAPI
+from .daemon import DaemonServer, daemon_socket_path, fetch_catalog
+from .http import CatalogHTTPServer
+from .reload import CatalogReloader, snapshot_tree
+
+__all__ = [
+    "ApiResponse",
+    "CatalogAPI",
+    "CatalogHTTPServer",
+    "CatalogReloader",
+    "DaemonServer",
+    "daemon_socket_path",
+    "fetch_catalog",
+    "snapshot_tree",
+]
@@ -0,0 +1,241 @@
+"""Маршрутизация JSON API поверх загруженного каталога.
+
+Модуль не зависит от транспорта: `CatalogAPI.handle(path, query)` возвращает готовый
+`ApiResponse` (статус, тело в байтах, ETag). HTTP-сервер (`steinschliff.server.http`)
+только разбирает запрос и пишет ответ — поэтому API легко тестировать без сокетов.
+
+Эндпоинты:
+- `/structures` — список структур; фильтры `service`, `country`, `condition`, `temperature`,
+  `tag`. `service` и `country` можно повторять и задавать glob-шаблонами (значения одного
+  параметра объединяются, `service` и `country` — пересекаются); `tag` тоже повторяется —
+  структура должна содержать все теги. В `service` и `condition` исправляются опечатки, на
+  нераспознанное значение API отвечает ошибкой с подсказками
+- `/structures/{name}` — структуры с этим именем (имена уникальны только внутри сервиса;
+  уточнить можно через `?service=`)
+- `/conditions` — справочник условий снега с количеством структур
+- `/stats` — сводка по каталогу
+
+Фильтры `/structures` выполняются планировщиком `steinschliff.query`: сначала самый
+селективный предикат, остальные — пересечением posting-списков или проверкой кандидатов.
+
+`CatalogAPI` неизменяем после создания: ответы кэшируются по `(path, query)`, а при
+перезагрузке каталога сервер просто подменяет объект API целиком.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+from steinschliff.catalog import Catalog
+from steinschliff.export.json import structure_record
+from steinschliff.models import StructureInfo
+from steinschliff.query import Predicate
+from steinschliff.snow_conditions import get_registry
+
+ENDPOINTS = ("/structures", "/structures/{name}", "/conditions", "/stats")
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+RESPONSE_CACHE_SIZE = 512
+
+Query = Mapping[str, Sequence[str]]
+
+
+@dataclass(frozen=True)
+class ApiResponse:
+    """Готовый ответ API.
+
+    Attributes:
+        status: HTTP-статус.
+        body: Тело ответа (UTF-8 JSON).
+        etag: Сильный ETag содержимого (в кавычках, как в заголовке).
+    """
+
+    status: int
+    body: bytes
+    etag: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        digest = hashlib.sha256(self.body).hexdigest()[:20]
+        object.__setattr__(self, "etag", f'"{digest}"')
+
+    @cached_property
+    def gzip_body(self) -> bytes:
+        """Сжатое тело (считается один раз на ответ, детерминированно — без mtime)."""
+        return gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class ApiError(Exception):
+    """Ошибка запроса, которую API отдаёт клиенту как JSON `{"error": ...}`."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """Создать ошибку.
+
+        Args:
+            status: HTTP-статус ответа.
+            message: Сообщение для клиента.
+        """
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json_response(status: int, payload: Any) -> ApiResponse:
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return ApiResponse(status=status, body=body)
+
+
+def _first(query: Query, name: str) -> str | None:
+    values = query.get(name) or []
+    value = values[0].strip() if values else ""
+    return value or None
+
+
+def _api_record(service: str, s: StructureInfo) -> dict[str, object]:
+    record = structure_record(service, s)
+    record["condition"] = (s.condition or "").strip().lower() or None
+    record["description"] = s.description or None
+    record["description_ru"] = s.description_ru or None
+    return record
+
+
+class CatalogAPI:
+    """JSON API над неизменяемым снимком каталога."""
+
+    def __init__(self, catalog: Catalog) -> None:
+        """Создать API и загрузить каталог (если ещё не загружен).
+
+        Args:
+            catalog: Каталог структур.
+        """
+        self.catalog = catalog.load()
+        self._records: dict[int, dict[str, object]] = {
+            id(s): _api_record(service, s) for service, items in catalog.services.items() for s in items
+        }
+        self._cache: dict[tuple[str, tuple[tuple[str, tuple[str, ...]], ...]], ApiResponse] = {}
+        self._cache_lock = threading.Lock()
+
+    def handle(self, path: str, query: Query | None = None) -> ApiResponse:
+        """Обработать GET-запрос.
+
+        Args:
+            path: Путь запроса (уже без query string, percent-декодированный).
+            query: Параметры запроса (`parse_qs`-совместимый маппинг).
+
+        Returns:
+            Ответ (в том числе с ошибкой 400/404).
+        """
+        path = path.rstrip("/") or "/"
+        query = query or {}
+        key = (path, tuple(sorted((name, tuple(values)) for name, values in query.items())))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = _json_response(200, self._route(path, query))
+        except ApiError as err:
+            return _json_response(err.status, {"error": err.message})
+
+        with self._cache_lock:
+            if len(self._cache) >= RESPONSE_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = response
+        return response
+
+    def _route(self, path: str, query: Query) -> Any:
+        if path == "/":
+            return {"endpoints": list(ENDPOINTS)}
+        if path == "/structures":
+            return self._list(self._filtered(query))
+        if path.startswith("/structures/"):
+            return self._by_name(path.removeprefix("/structures/"), query)
+        if path == "/conditions":
+            return self._conditions()
+        if path == "/stats":
+            return self._stats()
+        msg = f"Неизвестный путь '{path}'"
+        raise ApiError(404, msg)
+
+    def _list(self, structures: Sequence[StructureInfo]) -> dict[str, Any]:
+        return {"count": len(structures), "items": [self._records[id(s)] for s in structures]}
+
+    def _predicates(self, query: Query) -> list[Predicate]:
+        predicates = []
+        for name in ("service", "country"):
+            values = tuple(v.strip() for v in query.get(name) or [] if v.strip())
+            if values:
+                predicates.append(Predicate(name, values))
+
+        condition = _first(query, "condition")
+        if condition:
+            match = get_registry().match(condition)
+            if match.value is None:
+                msg = f"Неизвестное условие '{condition}'"
+                if match.suggestions:
+                    msg += f". Возможно: {', '.join(match.suggestions)}"
+                raise ApiError(400, msg)
+            predicates.append(Predicate("condition", (match.value,)))
+
+        raw_temperature = _first(query, "temperature")
+        if raw_temperature is not None:
+            try:
+                t = float(raw_temperature.replace(",", "."))
+            except ValueError as err:
+                msg = f"Некорректная температура '{raw_temperature}'"
+                raise ApiError(400, msg) from err
+            predicates.append(Predicate("temperature", (repr(t),)))
+
+        # Каждый тег — отдельный предикат: структура должна содержать все.
+        predicates += [Predicate("tag", (tag.strip(),)) for tag in query.get("tag") or [] if tag.strip()]
+        return predicates
+
+    def _filtered(self, query: Query) -> list[StructureInfo]:
+        index = self.catalog.query_index
+        predicates = self._predicates(query)
+        try:
+            positions = index.run(predicates)
+        except ValueError as err:
+            raise ApiError(404, str(err)) from err
+        return [index.structures[i] for i in positions]
+
+    def _by_name(self, name: str, query: Query) -> dict[str, Any]:
+        wanted = name.strip().casefold()
+        matches = [s for s in self._filtered(query) if str(s.name).casefold() == wanted]
+        if not matches:
+            msg = f"Структура '{name}' не найдена"
+            raise ApiError(404, msg)
+        return self._list(matches)
+
+    def _conditions(self) -> dict[str, Any]:
+        counts = self.catalog.condition_counts
+        items = [
+            {
+                "key": key,
+                "name": info.get("name"),
+                "name_ru": info.get("name_ru"),
+                "color": info.get("color"),
+                "temperature": info.get("temperature"),
+                "count": counts.get(key, 0),
+            }
+            for key, info in self.catalog.conditions.items()
+        ]
+        return {"count": len(items), "items": items}
+
+    def _stats(self) -> dict[str, Any]:
+        services = {
+            (self.catalog.service_metadata[key].name if key in self.catalog.service_metadata else "") or key: len(items)
+            for key, items in self.catalog.services.items()
+        }
+        return {
+            "structures": len(self.catalog.structures),
+            "services": dict(sorted(services.items())),
+            "conditions": dict(sorted(self.catalog.condition_counts.items())),
+            "without_condition": len(self.catalog.structures) - self.catalog.condition_counts.total(),
+        }
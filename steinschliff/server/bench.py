@@ -0,0 +1,304 @@
+"""Нагрузочный прогон JSON API (`steinschliff bench-serve`).
+
+Генератор нагрузки работает по открытой модели: запросы планируются с заданной
+частотой (`qps`) независимо от того, успел ли ответить сервер, а задержка считается от
+*запланированного* момента отправки. Поэтому очередь на стороне клиента или сервера
+видна в перцентилях, а не прячется за замедлившимся генератором (coordinated omission).
+
+Каталог по умолчанию синтетический (`synthetic_snapshot`): размер задаётся параметрами,
+данные детерминированы `seed`, так что прогоны разных версий сравнимы между собой.
+Смесь запросов (`build_query_mix`) строится по записям `/structures` целевого сервера.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from urllib.parse import quote, urlencode, urlsplit
+
+from steinschliff.snow_conditions import get_registry
+
+SYNTHETIC_TAGS = ("холодный", "тёплый", "универсальный", "новый снег", "старый снег", "искусственный", "влажный", "лёд")
+SYNTHETIC_SNOW_TYPES = ("fresh", "fine_grained", "coarse", "wet", "icy", "artificial", "all")
+
+# Доли запросов в смеси: (путь, вес).
+QUERY_WEIGHTS: tuple[tuple[str, int], ...] = (
+    ("condition", 30),
+    ("temperature", 20),
+    ("service", 15),
+    ("tag", 10),
+    ("name", 15),
+    ("conditions", 5),
+    ("stats", 5),
+)
+
+
+def synthetic_snapshot(*, services: int = 20, per_service: int = 50, seed: int = 0) -> dict[str, Any]:
+    """Построить синтетический снимок каталога (формат `Catalog.snapshot()`).
+
+    Args:
+        services: Количество сервисов.
+        per_service: Количество структур в каждом сервисе.
+        seed: Зерно генератора случайных чисел.
+
+    Returns:
+        Снимок каталога для `Catalog.from_snapshot`.
+    """
+    rng = random.Random(seed)
+    conditions = get_registry().keys
+    snapshot: dict[str, Any] = {"services": {}, "service_metadata": {}, "name_to_path": {}}
+    for i in range(services):
+        key = f"service{i:03d}"
+        snapshot["service_metadata"][key] = {"name": f"Service {i}", "country": rng.choice(["Austria", "Norway"])}
+        items = []
+        for j in range(per_service):
+            name = f"S{i}-{j}"
+            high = rng.randint(-20, 10)
+            items.append(
+                {
+                    "name": name,
+                    "description": f"Synthetic structure {name}",
+                    "snow_type": ", ".join(rng.sample(SYNTHETIC_SNOW_TYPES, k=2)),
+                    "temperature": [{"min": high, "max": high - rng.randint(2, 12)}],
+                    "condition": rng.choice(conditions),
+                    "service": {"name": f"Service {i}"},
+                    "tags": rng.sample(SYNTHETIC_TAGS, k=rng.randint(1, 3)),
+                    "similars": [f"S{i}-{rng.randrange(per_service)}"],
+                    "file_path": f"{key}/{name}.yaml",
+                }
+            )
+            snapshot["name_to_path"][name] = f"{key}/{name}.yaml"
+        snapshot["services"][key] = items
+    return snapshot
+
+
+def build_query_mix(records: Sequence[Mapping[str, Any]], *, size: int = 1000, seed: int = 0) -> list[str]:
+    """Построить смешанный список запросов по записям каталога.
+
+    Args:
+        records: Записи `/structures` (нужны `name`, `service`, `condition`, `tags`, `temp_*`).
+        size: Количество запросов в смеси (при прогоне смесь повторяется по кругу).
+        seed: Зерно генератора случайных чисел.
+
+    Returns:
+        Пути запросов с query string.
+    """
+    rng = random.Random(seed)
+    kinds = [kind for kind, _ in QUERY_WEIGHTS]
+    weights = [weight for _, weight in QUERY_WEIGHTS]
+    if not records:
+        return ["/stats"] * size
+
+    mix = []
+    for kind in rng.choices(kinds, weights=weights, k=size):
+        record = rng.choice(records)
+        if kind == "condition" and record.get("condition"):
+            mix.append("/structures?" + urlencode({"condition": record["condition"]}))
+        elif kind == "temperature":
+            mix.append("/structures?" + urlencode({"temperature": rng.randint(-20, 10)}))
+        elif kind == "service":
+            mix.append("/structures?" + urlencode({"service": record["service"]}))
+        elif kind == "tag" and record.get("tags"):
+            mix.append("/structures?" + urlencode({"tag": rng.choice(record["tags"])}))
+        elif kind == "name":
+            mix.append("/structures/" + quote(str(record["name"])))
+        elif kind == "conditions":
+            mix.append("/conditions")
+        else:
+            mix.append("/stats")
+    return mix
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Перцентиль по методу ближайшего ранга.
+
+    Args:
+        sorted_values: Отсортированные значения.
+        pct: Перцентиль (0–100).
+
+    Returns:
+        Значение перцентиля (0.0 для пустой выборки).
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class BenchResult:
+    """Итоги нагрузочного прогона.
+
+    Attributes:
+        url: Адрес сервера.
+        target_qps: Заданная частота запросов.
+        concurrency: Количество клиентских потоков.
+        duration_s: Фактическая длительность прогона, секунды.
+        requests: Отправлено запросов.
+        errors: Ошибок соединения и ответов 5xx.
+        statuses: Количество ответов по HTTP-статусам.
+        throughput_qps: Достигнутая пропускная способность.
+        latency_ms: Перцентили задержки (`p50`, `p95`, `p99`, `max`, `mean`), миллисекунды.
+        catalog: Параметры синтетического каталога (если использовался).
+    """
+
+    url: str
+    target_qps: float
+    concurrency: int
+    duration_s: float
+    requests: int
+    errors: int
+    statuses: dict[str, int]
+    throughput_qps: float
+    latency_ms: dict[str, float]
+    catalog: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Словарь для записи в JSON."""
+        return asdict(self)
+
+
+class _Client:
+    """HTTP-клиент с keep-alive соединением на поток."""
+
+    def __init__(self, url: str, *, accept_gzip: bool, timeout: float) -> None:
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.headers = {"Accept-Encoding": "gzip"} if accept_gzip else {}
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def get(self, path: str) -> int:
+        conn: http.client.HTTPConnection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            conn.request("GET", path, headers=self.headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            self._local.conn = None
+            raise
+        return response.status
+
+
+def run_load(
+    url: str,
+    paths: Sequence[str],
+    *,
+    qps: float,
+    duration: float,
+    concurrency: int,
+    accept_gzip: bool = True,
+    timeout: float = 10.0,
+) -> BenchResult:
+    """Прогнать открытую нагрузку по смеси запросов.
+
+    Args:
+        url: Базовый адрес сервера (`http://host:port`).
+        paths: Смесь запросов (повторяется по кругу).
+        qps: Частота запросов в секунду.
+        duration: Длительность прогона, секунды.
+        concurrency: Количество клиентских потоков.
+        accept_gzip: Отправлять `Accept-Encoding: gzip`.
+        timeout: Таймаут одного запроса, секунды.
+
+    Returns:
+        Итоги прогона.
+    """
+    client = _Client(url, accept_gzip=accept_gzip, timeout=timeout)
+    total = max(1, int(qps * duration))
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def fire(path: str, scheduled: float) -> None:
+        try:
+            status = str(client.get(path))
+        except (OSError, http.client.HTTPException):
+            status = "error"
+        elapsed = time.perf_counter() - scheduled
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench") as pool:
+        for i in range(total):
+            scheduled = started + i / qps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, paths[i % len(paths)], scheduled)
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    errors = statuses["error"] + sum(count for status, count in statuses.items() if status.startswith("5"))
+    return BenchResult(
+        url=url,
+        target_qps=qps,
+        concurrency=concurrency,
+        duration_s=round(elapsed, 3),
+        requests=len(ordered),
+        errors=errors,
+        statuses=dict(sorted(statuses.items())),
+        throughput_qps=round(len(ordered) / elapsed, 1) if elapsed > 0 else 0.0,
+        latency_ms={
+            "p50": round(percentile(ordered, 50) * 1000, 3),
+            "p95": round(percentile(ordered, 95) * 1000, 3),
+            "p99": round(percentile(ordered, 99) * 1000, 3),
+            "max": round((ordered[-1] if ordered else 0.0) * 1000, 3),
+            "mean": round((sum(ordered) / len(ordered) if ordered else 0.0) * 1000, 3),
+        },
+    )
+
+
+def fetch_records(url: str, *, timeout: float = 10.0) -> list[dict[str, Any]]:
+    """Получить записи `/structures` у сервера (для построения смеси запросов).
+
+    Args:
+        url: Базовый адрес сервера.
+        timeout: Таймаут запроса, секунды.
+
+    Returns:
+        Записи структур.
+
+    Raises:
+        OSError: Сервер недоступен.
+        ValueError: Ответ не похож на `/structures` API каталога (не 200, не JSON, нет `items`).
+    """
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname or "127.0.0.1", parts.port or 80, timeout=timeout)
+    try:
+        conn.request("GET", "/structures")
+        response = conn.getresponse()
+        body = response.read()
+    except http.client.HTTPException as err:
+        msg = f"{url} не отвечает по HTTP: {err!r}"
+        raise ValueError(msg) from err
+    finally:
+        conn.close()
+    if response.status != 200:
+        msg = f"{url}/structures вернул HTTP {response.status}"
+        raise ValueError(msg)
+    try:
+        payload = json.loads(body)
+    except ValueError as err:
+        msg = f"{url}/structures вернул не JSON"
+        raise ValueError(msg) from err
+    items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        msg = f"{url}/structures вернул JSON без списка записей `items`"
+        raise ValueError(msg)
+    return items
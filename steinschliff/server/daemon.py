@@ -0,0 +1,297 @@
+"""Фоновый демон с загруженным каталогом (Unix domain socket).
+
+Демон держит каталог в памяти (с горячей перезагрузкой, см. `reload`) и отвечает на
+запросы по протоколу «одна JSON-строка запроса — одна JSON-строка ответа»:
+- `{"op": "ping"}` — состояние демона
+- `{"op": "snapshot"}` — снимок каталога (`Catalog.snapshot()`) и отпечаток YAML-файлов,
+  из которых он загружен; сериализуется один раз на версию каталога
+- `{"op": "shutdown"}` — остановить демон
+
+CLI-команды получают каталог через `fetch_catalog`: если демон для этой директории
+шлифов запущен, вместо разбора и валидации YAML каталог восстанавливается из снимка;
+если нет, ответ не получен за `CLIENT_TIMEOUT` или файлы изменились с момента загрузки
+каталога демоном (например, демон запущен с `--no-reload`) — команда грузит каталог сама.
+Сокет выбирается по директории шлифов, поэтому демоны разных каталогов не пересекаются.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from steinschliff.catalog import Catalog
+
+from .reload import Snapshot, snapshot_tree
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+CLIENT_TIMEOUT = 2.0
+MAX_REQUEST_SIZE = 64 * 1024
+MAX_RESPONSE_SIZE = 256 * 1024 * 1024
+SOCKET_ENV = "STEINSCHLIFF_DAEMON_SOCKET"
+DISABLE_ENV = "STEINSCHLIFF_NO_DAEMON"
+
+
+def daemon_supported() -> bool:
+    """Поддерживает ли платформа Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def daemon_socket_path(schliffs_dir: str | Path) -> Path:
+    """Путь сокета демона для директории шлифов.
+
+    `$STEINSCHLIFF_DAEMON_SOCKET` переопределяет путь; иначе сокет лежит в
+    `$XDG_RUNTIME_DIR` (или во временной директории) в подкаталоге пользователя.
+
+    Args:
+        schliffs_dir: Директория со шлифами (абсолютный путь).
+
+    Returns:
+        Путь к сокету.
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    base = Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()) / f"steinschliff-{os.getuid()}"
+    digest = hashlib.sha1(str(Path(schliffs_dir).resolve()).encode("utf-8"), usedforsecurity=False).hexdigest()
+    return base / f"{digest[:12]}.sock"
+
+
+def check_socket_dir(directory: str | Path) -> None:
+    """Проверить, что директории сокета можно доверять.
+
+    Во временной директории (без `$XDG_RUNTIME_DIR`) подкаталог с предсказуемым именем
+    может заранее создать другой пользователь и отдавать через свой сокет подложный
+    снимок каталога. Поэтому директория должна быть настоящей (не symlink), принадлежать
+    текущему пользователю и быть закрытой для группы и остальных.
+
+    Args:
+        directory: Директория сокета.
+
+    Raises:
+        PermissionError: Если директория — symlink, чужая или доступна другим.
+        OSError: Если директорию не удалось прочитать.
+    """
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode):
+        msg = f"Директория сокета демона — не директория (или symlink): {directory}"
+        raise PermissionError(msg)
+    if st.st_uid != os.getuid():
+        msg = f"Директория сокета демона принадлежит другому пользователю: {directory}"
+        raise PermissionError(msg)
+    if st.st_mode & 0o077:
+        msg = f"Директория сокета демона доступна другим пользователям ({stat.filemode(st.st_mode)}): {directory}"
+        raise PermissionError(msg)
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def tree_fingerprint(tree: Snapshot) -> str:
+    """Отпечаток снимка YAML-файлов (`snapshot_tree`) для сравнения клиентом и демоном."""
+    payload = json.dumps(sorted(tree.items()), separators=(",", ":")).encode("utf-8")
+    return hashlib.sha1(payload, usedforsecurity=False).hexdigest()
+
+
+def _read_line(sock: socket.socket, *, deadline: float, limit: int) -> bytes:
+    buffer = bytearray()
+    while not buffer.endswith(b"\n"):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            msg = "Демон не ответил вовремя"
+            raise TimeoutError(msg)
+        sock.settimeout(remaining)
+        chunk = sock.recv(min(limit + 1 - len(buffer), 1024 * 1024))
+        if not chunk:
+            break
+        buffer += chunk
+        if len(buffer) > limit:
+            msg = f"Ответ демона больше {limit} байт"
+            raise ValueError(msg)
+    return bytes(buffer)
+
+
+def request(
+    socket_path: str | Path, op: str, *, timeout: float = CLIENT_TIMEOUT, max_size: int = MAX_RESPONSE_SIZE
+) -> dict[str, Any]:
+    """Отправить запрос демону и дождаться ответа.
+
+    Args:
+        socket_path: Путь к сокету демона.
+        op: Операция (`ping`, `snapshot`, `shutdown`).
+        timeout: Таймаут на весь обмен (подключение, отправка и чтение ответа), секунды.
+        max_size: Максимальный размер строки ответа, байты.
+
+    Returns:
+        Ответ демона.
+
+    Raises:
+        OSError: Демон не запущен, соединение оборвалось или ответ не получен за `timeout`.
+        ValueError: Ответ не разобран, слишком большой или демон вернул ошибку.
+    """
+    deadline = time.monotonic() + timeout
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(_encode({"op": op, "version": PROTOCOL_VERSION}))
+        line = _read_line(sock, deadline=deadline, limit=max_size)
+    if not line.endswith(b"\n"):
+        msg = "Демон закрыл соединение без ответа"
+        raise ValueError(msg)
+    response: dict[str, Any] = json.loads(line)
+    if not response.get("ok") or response.get("version") != PROTOCOL_VERSION:
+        msg = str(response.get("error") or "Несовместимая версия протокола демона")
+        raise ValueError(msg)
+    return response
+
+
+def fetch_catalog(schliffs_dir: str | Path) -> Catalog | None:
+    """Получить каталог у запущенного демона.
+
+    Args:
+        schliffs_dir: Директория со шлифами (абсолютный путь).
+
+    Returns:
+        Каталог из снимка демона или `None`, если демон недоступен, отключён через
+        `$STEINSCHLIFF_NO_DAEMON`, директории сокета нельзя доверять (см. `check_socket_dir`)
+        или его каталог загружен не из текущих файлов.
+    """
+    if not daemon_supported() or os.environ.get(DISABLE_ENV):
+        return None
+    socket_path = daemon_socket_path(schliffs_dir)
+    if not socket_path.exists():
+        return None
+    try:
+        check_socket_dir(socket_path.parent)
+    except OSError as err:
+        logger.warning("Демон не используется: %s", err)
+        return None
+    try:
+        response = request(socket_path, "snapshot")
+        # Демон без перезагрузки (или между опросами) мог не увидеть изменений YAML:
+        # снимок берём, только если он загружен из тех же файлов, что лежат на диске.
+        if response.get("tree") != tree_fingerprint(snapshot_tree(schliffs_dir)):
+            logger.debug("Каталог демона устарел, загружаем каталог в процессе")
+            return None
+        catalog = Catalog.from_snapshot(schliffs_dir, response["snapshot"])
+    except (OSError, ValueError, KeyError) as err:
+        logger.debug("Демон недоступен (%s), загружаем каталог в процессе", err)
+        return None
+    logger.debug("Каталог получен от демона %s", socket_path)
+    return catalog
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_REQUEST_SIZE)
+        if not line:
+            return
+        try:
+            op = json.loads(line).get("op")
+        except (ValueError, AttributeError):
+            op = None
+        self.wfile.write(self.server.respond(op))
+        if op == "shutdown":
+            self.wfile.flush()
+            # shutdown() ждёт выхода из serve_forever — вызываем его не из потока обработчика.
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    """Unix-socket сервер, раздающий снимок каталога."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str | Path, catalog: Catalog, *, tree: Snapshot | None = None) -> None:
+        """Привязать сокет (устаревший файл сокета удаляется).
+
+        Args:
+            socket_path: Путь к сокету.
+            catalog: Загруженный каталог.
+            tree: Снимок YAML-файлов, снятый до загрузки каталога (см. `swap_catalog`).
+
+        Raises:
+            OSError: Если по этому пути уже отвечает другой демон или директории сокета
+                нельзя доверять (см. `check_socket_dir`).
+        """
+        self.socket_path = Path(socket_path)
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self.swap_catalog(catalog, tree=tree)
+
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        check_socket_dir(self.socket_path.parent)
+        if self.socket_path.exists():
+            try:
+                request(self.socket_path, "ping", timeout=0.5)
+            except (OSError, ValueError):
+                self.socket_path.unlink()
+            else:
+                msg = f"Демон уже запущен: {self.socket_path}"
+                raise OSError(msg)
+        super().__init__(str(self.socket_path), _DaemonRequestHandler)
+
+    def swap_catalog(self, catalog: Catalog, tree: Snapshot | None = None) -> None:
+        """Подменить каталог и заранее сериализовать его снимок.
+
+        Args:
+            catalog: Загруженный каталог.
+            tree: Снимок YAML-файлов, снятый до загрузки каталога (`CatalogReloader`
+                передаёт его вторым аргументом). Без него снимок снимается сейчас, и файл,
+                изменённый во время загрузки, клиенты считали бы уже загруженным.
+        """
+        if tree is None:
+            tree = snapshot_tree(catalog.schliffs_dir)
+        snapshot_line = _encode(
+            {"ok": True, "version": PROTOCOL_VERSION, "tree": tree_fingerprint(tree), "snapshot": catalog.snapshot()}
+        )
+        with self._lock:
+            self.catalog = catalog
+            self._snapshot_line = snapshot_line
+            self.loaded_at = time.time()
+
+    def respond(self, op: object) -> bytes:
+        """Сформировать ответ на операцию.
+
+        Args:
+            op: Имя операции из запроса.
+
+        Returns:
+            Строка ответа (JSON + перевод строки).
+        """
+        if op == "snapshot":
+            return self._snapshot_line
+        if op == "ping":
+            return _encode(
+                {
+                    "ok": True,
+                    "version": PROTOCOL_VERSION,
+                    "pid": os.getpid(),
+                    "schliffs_dir": str(self.catalog.schliffs_dir),
+                    "structures": len(self.catalog.structures),
+                    "started_at": self.started_at,
+                    "loaded_at": self.loaded_at,
+                }
+            )
+        if op == "shutdown":
+            return _encode({"ok": True, "version": PROTOCOL_VERSION})
+        return _encode({"ok": False, "version": PROTOCOL_VERSION, "error": f"Неизвестная операция: {op!r}"})
+
+    def server_close(self) -> None:
+        """Закрыть сокет и удалить его файл."""
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
@@ -0,0 +1,115 @@
+"""HTTP-транспорт JSON API (stdlib `ThreadingHTTPServer`).
+
+Сервер держит текущий `CatalogAPI` в атрибуте и отдаёт готовые ответы:
+- `ETag` на каждый ответ, `If-None-Match` → `304 Not Modified` без тела
+- `Content-Encoding: gzip` для клиентов с `Accept-Encoding: gzip` (тела от `GZIP_MIN_SIZE`)
+- `Cache-Control: no-cache` — клиент всегда перепроверяет ETag, и после перезагрузки
+  каталога сразу получает новые данные
+"""
+
+from __future__ import annotations
+
+import logging
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from steinschliff.catalog import Catalog
+
+from .api import GZIP_MIN_SIZE, ApiResponse, CatalogAPI
+
+logger = logging.getLogger(__name__)
+
+
+def _accepts_gzip(header: str | None) -> bool:
+    for part in (header or "").split(","):
+        coding, *params = part.split(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                # `q=0` (в любой записи: `0.00`, `0.`) — кодировка запрещена; мусор — тоже отказ.
+                try:
+                    return float(value.strip()) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class CatalogHTTPServer(ThreadingHTTPServer):
+    """HTTP-сервер с подменяемым снимком каталога."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], catalog: Catalog) -> None:
+        """Создать сервер и привязать сокет.
+
+        Args:
+            address: `(host, port)`; порт `0` — выбрать свободный.
+            catalog: Каталог, который будет обслуживаться.
+        """
+        self.api = CatalogAPI(catalog)
+        super().__init__(address, CatalogRequestHandler)
+
+    def swap_catalog(self, catalog: Catalog) -> None:
+        """Подменить обслуживаемый каталог (текущие запросы дорабатывают на старом снимке)."""
+        self.api = CatalogAPI(catalog)
+
+
+class CatalogRequestHandler(BaseHTTPRequestHandler):
+    """Обработчик GET/HEAD-запросов к JSON API."""
+
+    server: CatalogHTTPServer
+    protocol_version = "HTTP/1.1"
+    # Заголовки и тело уходят отдельными записями: без TCP_NODELAY keep-alive ответы
+    # упираются в Nagle + delayed ACK (~40 мс на запрос).
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        """Ответить на GET."""
+        self._respond(with_body=True)
+
+    def do_HEAD(self) -> None:
+        """Ответить на HEAD (заголовки без тела)."""
+        self._respond(with_body=False)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Писать access-log в logging (DEBUG), а не в stderr."""
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _respond(self, *, with_body: bool) -> None:
+        url = urlsplit(self.path)
+        response = self.server.api.handle(unquote(url.path), parse_qs(url.query))
+        compress = len(response.body) >= GZIP_MIN_SIZE and _accepts_gzip(self.headers.get("Accept-Encoding"))
+
+        if response.status == HTTPStatus.OK and _etag_matches(self.headers.get("If-None-Match"), response.etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_common_headers(response)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = response.gzip_body if compress else response.body
+        self.send_response(response.status)
+        self._send_common_headers(response)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def _send_common_headers(self, response: ApiResponse) -> None:
+        self.send_header("ETag", response.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
@@ -0,0 +1,109 @@
+"""Горячая перезагрузка каталога при изменении YAML-файлов.
+
+Без внешних зависимостей: фоновый поток раз в `interval` секунд сравнивает снимок
+`(mtime_ns, size)` всех `*.yaml` в директории шлифов. При изменении каталог
+загружается заново в отдельный объект и передаётся в `on_reload` вместе со снимком
+файлов, снятым до загрузки (по нему демон сверяет актуальность каталога) — обслуживающий
+код подменяет ссылку целиком, поэтому запросы не видят наполовину загруженных данных.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from steinschliff.catalog import Catalog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RELOAD_INTERVAL = 1.0
+
+Snapshot = dict[str, tuple[int, int]]
+
+
+def snapshot_tree(directory: str | Path) -> Snapshot:
+    """Снять снимок YAML-файлов директории: путь → `(mtime_ns, size)`.
+
+    Args:
+        directory: Директория со шлифами.
+
+    Returns:
+        Снимок (файлы, исчезнувшие во время обхода, пропускаются).
+    """
+    snapshot: Snapshot = {}
+    for path in Path(directory).rglob("*.yaml"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class CatalogReloader:
+    """Фоновый поток, перезагружающий каталог при изменении файлов."""
+
+    def __init__(
+        self,
+        schliffs_dir: str | Path,
+        on_reload: Callable[[Catalog, Snapshot], None],
+        *,
+        interval: float = DEFAULT_RELOAD_INTERVAL,
+        snapshot: Snapshot | None = None,
+    ) -> None:
+        """Создать наблюдатель (поток запускается через `start`).
+
+        Args:
+            schliffs_dir: Директория со шлифами (абсолютный путь).
+            on_reload: Вызывается с новым загруженным каталогом и снимком файлов, снятым
+                до его загрузки: файл, изменённый во время загрузки, в снимок не попадёт.
+            interval: Период опроса файловой системы, секунды.
+            snapshot: Снимок файлов, из которых загружен текущий каталог (по умолчанию
+                снимается сейчас); изменения относительно него приведут к перезагрузке.
+        """
+        self.schliffs_dir = Path(schliffs_dir)
+        self.on_reload = on_reload
+        self.interval = interval
+        self._snapshot = snapshot if snapshot is not None else snapshot_tree(self.schliffs_dir)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="catalog-reload", daemon=True)
+
+    def start(self) -> None:
+        """Запустить опрос в фоне."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Остановить опрос и дождаться потока."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def check(self) -> bool:
+        """Один шаг опроса: перезагрузить каталог, если файлы изменились.
+
+        Returns:
+            Была ли выполнена перезагрузка.
+
+        Raises:
+            Exception: Ошибка загрузки каталога или `on_reload`; снимок при этом не обновляется.
+        """
+        snapshot = snapshot_tree(self.schliffs_dir)
+        if snapshot == self._snapshot:
+            return False
+        catalog = Catalog(self.schliffs_dir).load()
+        self.on_reload(catalog, snapshot)
+        # Снимок запоминаем только после успешной подмены: если загрузка упала, следующий
+        # опрос попробует снова, даже если файлы больше не менялись.
+        self._snapshot = snapshot
+        logger.info("Каталог перезагружен: %d структур", len(catalog.structures))
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # Сервер продолжает отдавать предыдущий снимок каталога.
+                logger.exception("Не удалось перезагрузить каталог")
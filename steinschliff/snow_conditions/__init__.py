@@ -8,16 +8,24 @@
 
 from .registry import (
     DEFAULT_SNOW_CONDITION_KEYS,
+    SnowConditionRegistry,
+    compile_registry,
     get_condition_info,
     get_name_ru,
+    get_registry,
     get_valid_keys,
     normalize_condition_input,
+    temperature_ranges,
 )
 
 __all__ = [
     "DEFAULT_SNOW_CONDITION_KEYS",
+    "SnowConditionRegistry",
+    "compile_registry",
     "get_condition_info",
     "get_name_ru",
+    "get_registry",
     "get_valid_keys",
     "normalize_condition_input",
+    "temperature_ranges",
 ]
@@ -6,17 +6,23 @@
 - нормализацию пользовательского ввода (CLI)
 
 Кэширование:
-    Данные YAML и таблица нормализации кэшируются через `functools.lru_cache`.
+    YAML читается один раз: `get_registry()` компилирует `SnowConditionRegistry`
+    (frozenset ключей, таблица нормализации, нечёткий индекс, диапазоны температур) и
+    кэширует его через `functools.lru_cache`. Остальные функции модуля — обёртки над реестром.
 """
 
 from __future__ import annotations
 
 import functools
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+from steinschliff.matching import FuzzyMatcher, MatchResult
 from steinschliff.paths import project_root, snow_conditions_dir
 
 DEFAULT_SNOW_CONDITION_KEYS = ["red", "blue", "violet", "orange", "green", "yellow", "pink", "brown"]
@@ -63,9 +69,8 @@ def _safe_load_yaml(path: Path) -> dict[str, Any] | None:
         return None
 
 
-@functools.lru_cache(maxsize=1)
 def _load_registry() -> dict[str, dict[str, Any]]:
-    """Загрузить все условия из `snow_conditions/*.yaml` и закэшировать.
+    """Прочитать все условия из `snow_conditions/*.yaml`.
 
     Returns:
         Реестр `key -> data`.
@@ -75,7 +80,7 @@ def _load_registry() -> dict[str, dict[str, Any]]:
         return {}
 
     registry: dict[str, dict[str, Any]] = {}
-    for yaml_file in root.glob("*.yaml"):
+    for yaml_file in sorted(root.glob("*.yaml")):
         data = _safe_load_yaml(yaml_file)
         if not data:
             continue
@@ -89,26 +94,84 @@ def _load_registry() -> dict[str, dict[str, Any]]:
     return registry
 
 
-@functools.lru_cache(maxsize=1)
-def _build_lookup() -> dict[str, str]:
-    """Построить маппинг “вариант ввода” → канонический `key`.
+def temperature_ranges(temperature: Sequence[Any] | None) -> tuple[tuple[float, float], ...]:
+    """Диапазоны температур (`[{"min": …, "max": …}, …]`) как `(low, high)`, `low <= high`.
+
+    Единое правило для условий снега, рекомендаций, запросов, API и поискового индекса:
+    диапазон с одним заданным концом — точка, без обоих концов — пропускается. Концом
+    считается только число (`bool` — нет).
+    """
+    ranges = []
+    for tr in temperature or []:
+        if not isinstance(tr, dict):
+            continue
+        ends = [
+            float(v) for v in (tr.get("min"), tr.get("max")) if isinstance(v, int | float) and not isinstance(v, bool)
+        ]
+        if ends:
+            ranges.append((min(ends), max(ends)))
+    return tuple(ranges)
+
+
+@dataclass(frozen=True)
+class SnowConditionRegistry:
+    """Скомпилированный реестр условий снега (строится один раз на процесс).
+
+    Attributes:
+        keys: Отсортированные допустимые ключи.
+        key_set: Те же ключи для проверки принадлежности за O(1).
+        info: Данные YAML по ключу (только чтение).
+        lookup: Таблица нормализации “вариант ввода (lower)” → ключ.
+        temperatures: Диапазоны температур по ключу: кортеж `(low, high)`; пустой — любая температура.
+        matcher: Нечёткий индекс по тем же вариантам ввода (опечатки, автодополнение).
+    """
+
+    keys: tuple[str, ...]
+    key_set: frozenset[str]
+    info: Mapping[str, Mapping[str, Any]]
+    lookup: Mapping[str, str]
+    temperatures: Mapping[str, tuple[tuple[float, float], ...]]
+    matcher: FuzzyMatcher
+
+    def normalize(self, value: str, *, fuzzy: bool = False) -> str:
+        """Нормализовать ввод: ключ, название, синоним → ключ.
+
+        Args:
+            value: Ввод пользователя или значение из данных.
+            fuzzy: Исправлять однозначную опечатку (для интерактивного ввода в CLI);
+                по умолчанию — только точное совпадение.
+
+        Returns:
+            Ключ условия; нераспознанный (или неоднозначный) ввод — как lower-строка.
+        """
+        s = (value or "").strip().lower()
+        key = self.lookup.get(s)
+        if key is not None or not fuzzy:
+            return key or s
+        return self.matcher.match(s).value or s
+
+    def match(self, value: str) -> MatchResult:
+        """Сопоставить ввод с ключами условий (с исправлением опечаток и подсказками)."""
+        return self.matcher.match(value)
+
+
+def compile_registry(entries: Mapping[str, Mapping[str, Any]]) -> SnowConditionRegistry:
+    """Скомпилировать реестр из данных YAML.
+
+    Args:
+        entries: Реестр `key -> data` (как из `snow_conditions/*.yaml`).
 
     Returns:
-        Словарь, в который входят:
-        - `red/blue/...` ключи
-        - русские названия цветов
-        - `name`, `name_ru`, `synonyms`, `synonyms_ru` из YAML-файлов
+        Неизменяемый реестр. Если `entries` пуст, ключи — `DEFAULT_SNOW_CONDITION_KEYS`.
     """
-    lookup: dict[str, str] = {}
+    keys = tuple(sorted(entries)) or tuple(DEFAULT_SNOW_CONDITION_KEYS)
 
     # Ключи и русские названия цветов:
-    for ru, key in _COLOR_RU_TO_KEY.items():
-        lookup[ru] = key
-    for key in get_valid_keys():
-        lookup[key] = key
+    lookup: dict[str, str] = dict(_COLOR_RU_TO_KEY)
+    lookup.update((key, key) for key in keys)
 
     # name_ru / name / synonyms / synonyms_ru:
-    for key, data in _load_registry().items():
+    for key, data in entries.items():
         name = str(data.get("name", "")).strip().lower()
         name_ru = str(data.get("name_ru", "")).strip().lower()
 
@@ -125,17 +188,37 @@ def _build_lookup() -> dict[str, str]:
                     if vv:
                         lookup[vv] = key
 
-    return lookup
+    return SnowConditionRegistry(
+        keys=keys,
+        key_set=frozenset(keys),
+        info=MappingProxyType(dict(entries)),
+        lookup=MappingProxyType(lookup),
+        temperatures=MappingProxyType(
+            {key: temperature_ranges(data.get("temperature")) for key, data in entries.items()}
+        ),
+        matcher=FuzzyMatcher(lookup),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_registry() -> SnowConditionRegistry:
+    """Получить скомпилированный реестр (YAML читается один раз на процесс).
+
+    Returns:
+        Реестр условий снега.
+    """
+    return compile_registry(_load_registry())
 
 
 def get_valid_keys() -> list[str]:
     """Получить список допустимых ключей `condition`.
 
+    Для проверки принадлежности используйте `get_registry().key_set`.
+
     Returns:
-        Список ключей. Если YAML-реестр пуст, возвращает `DEFAULT_SNOW_CONDITION_KEYS`.
+        Новый список ключей. Если YAML-реестр пуст, возвращает `DEFAULT_SNOW_CONDITION_KEYS`.
     """
-    keys = sorted(_load_registry().keys())
-    return keys if keys else DEFAULT_SNOW_CONDITION_KEYS
+    return list(get_registry().keys)
 
 
 def get_condition_info(key: str) -> dict[str, Any] | None:
@@ -149,7 +232,8 @@ def get_condition_info(key: str) -> dict[str, Any] | None:
     """
     if not key:
         return None
-    return _load_registry().get(key.strip().lower())
+    info = get_registry().info.get(key.strip().lower())
+    return dict(info) if info is not None else None
 
 
 def get_name_ru(key: str) -> str | None:
@@ -168,21 +252,18 @@ def get_name_ru(key: str) -> str | None:
     return str(name_ru) if name_ru else None
 
 
-def normalize_condition_input(condition_input: str) -> str:
+def normalize_condition_input(condition_input: str, *, fuzzy: bool = False) -> str:
     """Нормализовать пользовательский ввод условия (для CLI/фильтров).
 
     Поддерживает:
     - key (red/blue/…)
     - русские названия цветов (Красный/Зелёный/…)
     - name/name_ru/synonyms/synonyms_ru из файлов `snow_conditions/*.yaml`
+    - при `fuzzy=True` — всё перечисленное с опечаткой, если ближайший вариант однозначен
+      (см. `steinschliff.matching`)
 
     Если не распознано — возвращает приведённую к lower строку (как было ранее).
     """
     if not condition_input:
         return ""
-
-    s = condition_input.strip().lower()
-    if not s:
-        return ""
-
-    return _build_lookup().get(s, s)
+    return get_registry().normalize(condition_input, fuzzy=fuzzy)
@@ -0,0 +1,210 @@
+"""Предвычисленные порядки сортировки структур.
+
+Ключ сортировки по полю (`structure_sort_key`) считается один раз на структуру и поле:
+`SortIndex` сортирует позиции структур и сохраняет плотный ранг каждой (равные ключи —
+равный ранг). Порядок по спецификации (`"temperature"`, `"-name"`, `("country", "name")`)
+собирается из рангов и кэшируется, поэтому многоключевые и обратные сортировки не
+пересчитывают ключи, а потребители (README, `list`, CSV-экспорт) сортируют по готовому
+целочисленному ключу.
+
+Имена сравниваются по ключу сопоставления (`collation_key`): `casefold`, без диакритики
+(`ё` → `е`, `é` → `e`), при равенстве — по исходной строке. Полноценной локализованной
+сортировки (ICU) в зависимостях нет; для кириллицы и латиницы в именах структур этого
+достаточно.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import partial
+from typing import Any
+
+from steinschliff.models import StructureInfo
+
+SortSpec = str | Sequence[str]
+
+
+def collation_key(value: str) -> str:
+    """Ключ сопоставления строки: `casefold` без диакритических знаков.
+
+    Args:
+        value: Исходная строка.
+
+    Returns:
+        Строка для сравнения.
+    """
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def structure_sort_key(sort_field: str, structure: StructureInfo) -> Any:
+    """Ключ сортировки структуры по полю.
+
+    Args:
+        sort_field: Поле (`name`, `temperature`, `country`, …).
+        structure: Структура.
+
+    Returns:
+        Ключ. Для `temperature` — «сначала тёплые», структуры без температуры — в конце;
+        для `name` — ключ сопоставления и исходное имя.
+    """
+    if sort_field == "temperature":
+        if structure.temperature and isinstance(structure.temperature, list) and structure.temperature[0]:
+            max_temp = structure.temperature[0].get("max")
+            if max_temp is not None:
+                try:
+                    return -float(max_temp)
+                except (ValueError, TypeError):
+                    pass
+        return float("inf")
+    if sort_field == "name":
+        name = str(structure.name or "")
+        return collation_key(name), name
+    return getattr(structure, sort_field, "") or ""
+
+
+def parse_sort_spec(spec: SortSpec) -> tuple[tuple[str, bool], ...]:
+    """Разобрать спецификацию сортировки.
+
+    Args:
+        spec: Поле, поля через запятую (`"country,name"`) или их последовательность;
+            `-` перед полем — по убыванию.
+
+    Returns:
+        Пары `(поле, по_убыванию)`.
+
+    Raises:
+        ValueError: Если не задано ни одного поля.
+    """
+    parts = spec.split(",") if isinstance(spec, str) else spec
+    fields = tuple((part.strip().lstrip("-"), part.strip().startswith("-")) for part in parts if part.strip())
+    if not fields or not all(field for field, _ in fields):
+        msg = f"Некорректная сортировка '{spec}'"
+        raise ValueError(msg)
+    return fields
+
+
+class SortIndex:
+    """Кэш порядков сортировки для неизменяемого набора структур."""
+
+    def __init__(self, structures: Iterable[StructureInfo]) -> None:
+        """Создать индекс (ключи считаются лениво, при первом запросе поля).
+
+        Args:
+            structures: Структуры (обычно весь каталог).
+        """
+        self.structures = list(structures)
+        self._positions = {id(s): i for i, s in enumerate(self.structures)}
+        self._ranks: dict[str, list[int]] = {}
+        self._order_keys: dict[tuple[tuple[str, bool], ...], list[int]] = {}
+
+    def __len__(self) -> int:
+        """Количество структур в индексе."""
+        return len(self.structures)
+
+    def __contains__(self, structure: object) -> bool:
+        """Проверить, что структура (тот же объект) есть в индексе."""
+        return id(structure) in self._positions
+
+    def ranks(self, sort_field: str) -> list[int]:
+        """Плотные ранги структур по полю (равные ключи — равный ранг).
+
+        Args:
+            sort_field: Поле сортировки.
+
+        Returns:
+            Ранг для каждой позиции индекса.
+        """
+        ranks = self._ranks.get(sort_field)
+        if ranks is None:
+            keys = [structure_sort_key(sort_field, s) for s in self.structures]
+            ranks = [0] * len(keys)
+            rank = -1
+            previous: Any = object()
+            for position in sorted(range(len(keys)), key=keys.__getitem__):
+                if keys[position] != previous:
+                    rank += 1
+                    previous = keys[position]
+                ranks[position] = rank
+            self._ranks[sort_field] = ranks
+        return ranks
+
+    def _order_key(self, spec: SortSpec) -> list[int]:
+        fields = parse_sort_spec(spec)
+        order_key = self._order_keys.get(fields)
+        if order_key is None:
+            columns = [(self.ranks(field), descending) for field, descending in fields]
+            order = sorted(
+                range(len(self.structures)),
+                key=lambda i: tuple(-ranks[i] if descending else ranks[i] for ranks, descending in columns),
+            )
+            order_key = [0] * len(order)
+            for place, position in enumerate(order):
+                order_key[position] = place
+            self._order_keys[fields] = order_key
+        return order_key
+
+    def order(self, spec: SortSpec) -> list[int]:
+        """Позиции структур в порядке сортировки (при равенстве — в исходном порядке).
+
+        Args:
+            spec: Спецификация сортировки (см. `parse_sort_spec`).
+
+        Returns:
+            Перестановка позиций индекса.
+        """
+        order_key = self._order_key(spec)
+        order = [0] * len(order_key)
+        for position, place in enumerate(order_key):
+            order[place] = position
+        return order
+
+    def key(self, spec: SortSpec) -> Callable[[StructureInfo], int]:
+        """Функция ключа для `sorted` по готовому порядку.
+
+        Args:
+            spec: Спецификация сортировки.
+
+        Returns:
+            Ключ: место структуры в порядке; структуры не из индекса — в конце.
+        """
+        order_key = self._order_key(spec)
+        positions = self._positions
+        missing = len(order_key)
+        return lambda s: order_key[p] if (p := positions.get(id(s))) is not None else missing
+
+    def sort(self, items: Iterable[StructureInfo], spec: SortSpec) -> list[StructureInfo]:
+        """Отсортировать структуры.
+
+        Структуры из индекса сортируются по готовому порядку; если среди них есть чужие
+        (не из индекса), ключи считаются заново.
+
+        Args:
+            items: Структуры.
+            spec: Спецификация сортировки.
+
+        Returns:
+            Новый отсортированный список.
+        """
+        items = list(items)
+        if all(id(s) in self._positions for s in items):
+            return sorted(items, key=self.key(spec))
+        # Устойчивая сортировка от младшего поля к старшему.
+        for field, descending in reversed(parse_sort_spec(spec)):
+            items.sort(key=partial(structure_sort_key, field), reverse=descending)
+        return items
+
+    def sort_services(
+        self, services: Mapping[str, Iterable[StructureInfo]], spec: SortSpec
+    ) -> dict[str, list[StructureInfo]]:
+        """Отсортировать структуры внутри каждого сервиса.
+
+        Args:
+            services: Маппинг `service_key -> структуры`.
+            spec: Спецификация сортировки.
+
+        Returns:
+            Новый словарь с отсортированными списками (порядок сервисов сохраняется).
+        """
+        return {service: self.sort(items, spec) for service, items in services.items()}
@@ -2,6 +2,9 @@ import logging
 import sys
 from pathlib import Path
 
+import pytest
+import yaml
+
 # Добавляем корневую директорию проекта в sys.path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
@@ -11,3 +14,42 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
+
+
+def _write_schliffs(root, files):
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(yaml.safe_dump(content, allow_unicode=True), encoding="utf-8")
+
+
+@pytest.fixture
+def write_schliffs():
+    """Записать YAML-файлы каталога: `write_schliffs(root, {"service/file.yaml": {...}})`."""
+    return _write_schliffs
+
+
+@pytest.fixture
+def schliffs_dir(tmp_path):
+    """Небольшой каталог: два сервиса, `_meta.yaml` и одноимённые структуры в разных сервисах."""
+    _write_schliffs(
+        tmp_path,
+        {
+            "fischer/c1.yaml": {
+                "name": "C1",
+                "description": "Cold",
+                "condition": "blue",
+                "temperature": [{"min": -5, "max": -15}],
+                "tags": ["холодный", "универсальный"],
+            },
+            "fischer/p3.yaml": {
+                "name": "P3",
+                "description": "Warm",
+                "condition": "red",
+                "temperature": [{"min": 15, "max": 3}],
+            },
+            "fischer/_meta.yaml": {"name": "Fischer Ski", "country": "Austria"},
+            "uventa/c1.yaml": {"name": "C1", "description": "Cold", "condition": "blue", "tags": ["холодный"]},
+        },
+    )
+    return tmp_path
@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from steinschliff.catalog import Catalog, clear_catalog_cache, default_config, get_catalog
+from steinschliff.catalog import catalog as catalog_module
+from steinschliff.generator import ReadmeGenerator
+
+
+def test_catalog_loads_once_and_memoizes_derived_data(schliffs_dir, monkeypatch):
+    loads = []
+    original = ReadmeGenerator.load_structures
+    monkeypatch.setattr(ReadmeGenerator, "load_structures", lambda self: loads.append(1) or original(self))
+    catalog = Catalog(schliffs_dir)
+
+    assert not catalog.loaded
+    assert catalog.load() is catalog
+    assert sorted(s.name for s in catalog.structures) == ["C1", "C1", "P3"]
+    assert catalog.structures is catalog.structures
+    assert catalog.condition_counts == {"blue": 2, "red": 1}
+    assert "blue" in catalog.conditions
+    assert catalog.search_index is catalog.search_index
+    assert catalog.service_metadata["fischer"].name == "Fischer Ski"
+    catalog.load()
+    assert len(loads) == 1
+
+    by_temp = catalog.sorted_services("temperature")
+    assert [s.name for s in by_temp["fischer"]] == ["P3", "C1"]
+    assert catalog.sorted_services("temperature") is by_temp
+    assert by_temp["fischer"] is not catalog.services["fischer"]
+
+
+def test_catalog_builds_derived_data_once_under_concurrent_access(schliffs_dir, monkeypatch):
+    builds = []
+    original = catalog_module.build_search_index
+
+    def slow_build(services):
+        builds.append(1)
+        time.sleep(0.05)
+        return original(services)
+
+    monkeypatch.setattr(catalog_module, "build_search_index", slow_build)
+    catalog = Catalog(schliffs_dir).load()
+    barrier = threading.Barrier(8)
+    indexes, orders = [], []
+
+    def worker():
+        barrier.wait()
+        indexes.append(catalog.search_index)
+        orders.append(catalog.sorted_services("temperature"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(index is indexes[0] for index in indexes)
+    assert all(order is orders[0] for order in orders)
+
+
+def test_catalog_select_by_visible_name_and_condition(schliffs_dir):
+    catalog = Catalog(schliffs_dir).load()
+
+    assert list(catalog.select(service="fischer ski")) == ["fischer"]
+    assert [s.name for s in catalog.select(condition="blue")["fischer"]] == ["C1"]
+    assert list(catalog.select(condition="red")) == ["fischer"]
+    with pytest.raises(ValueError, match="не найден"):
+        catalog.select(service="nope")
+
+
+def test_catalog_select_multiple_globs_and_country_as_cached_views(schliffs_dir):
+    catalog = Catalog(schliffs_dir).load()
+
+    assert list(catalog.select(service=["uventa", "fischer"])) == ["fischer", "uventa"]
+    assert list(catalog.select(service="*ski")) == ["fischer"]
+    assert list(catalog.select(country="Австрия")) == ["fischer"]
+    assert list(catalog.select(service=["uventa", "fisch*"], country="austria")) == ["fischer"]
+
+    selected = catalog.select(service="fischer")
+    assert selected["fischer"] is catalog.services["fischer"]
+    assert catalog.select(service=["fischer"]) is selected
+    with pytest.raises(TypeError):
+        selected["uventa"] = []  # type: ignore[index]
+    with pytest.raises(ValueError, match="ни один сервис"):
+        catalog.select(service="atomic*")
+    with pytest.raises(ValueError, match="Страна 'Norway' не найдена"):
+        catalog.select(country="Norway")
+
+
+def test_catalog_select_service_within_subset(schliffs_dir):
+    catalog = Catalog(schliffs_dir).load()
+    subset = {"uventa": catalog.services["uventa"]}
+
+    assert list(catalog.select(services=subset, service=["uventa", "*"])) == ["uventa"]
+    with pytest.raises(ValueError, match="Сервис 'fischer' не найден"):
+        catalog.select(services=subset, service="fischer")
+    with pytest.raises(ValueError, match="Сервис 'fisch\\*' не найден"):
+        catalog.select(services=subset, service=["uventa", "fisch*"])
+
+
+def test_catalog_condition_buckets_back_condition_filter(schliffs_dir):
+    catalog = Catalog(schliffs_dir).load()
+
+    blue = catalog.condition_buckets["blue"]
+    assert list(blue) == ["fischer", "uventa"]
+    assert catalog.select(condition="blue") is catalog.select(condition="BLUE")
+    assert catalog.select(condition="blue")["fischer"] is blue["fischer"]
+    assert list(catalog.select(service="uventa", condition="blue")) == ["uventa"]
+    assert catalog.select(service="uventa", condition="blue")["uventa"] is blue["uventa"]
+    assert catalog.select(condition="yellow") == {}
+    with pytest.raises(TypeError):
+        blue["uventa"] = ()  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        catalog.select(condition="blue")["uventa"].append(blue["fischer"][0])  # type: ignore[attr-defined]
+
+    # Выборка из своих списков (не из каталога) фильтруется напрямую.
+    custom = {"fischer": list(catalog.services["fischer"])}
+    assert [s.name for s in catalog.select(services=custom, condition="red")["fischer"]] == ["P3"]
+
+
+def test_get_catalog_returns_one_instance_per_directory(schliffs_dir):
+    clear_catalog_cache()
+    try:
+        first = get_catalog(schliffs_dir)
+        assert get_catalog(str(schliffs_dir)) is first
+        clear_catalog_cache()
+        assert get_catalog(schliffs_dir) is not first
+    finally:
+        clear_catalog_cache()
+
+
+def test_generator_for_shares_loaded_data(schliffs_dir, tmp_path):
+    catalog = Catalog(schliffs_dir).load()
+    config = default_config(schliffs_dir, sort_field="temperature").model_copy(
+        update={"readme_file": tmp_path / "R_en.md", "readme_ru_file": tmp_path / "R.md"}
+    )
+
+    generator = catalog.generator_for(config)
+
+    assert generator.services is catalog.services
+    assert generator.service_metadata is catalog.service_metadata
+    assert generator.sort_field == "temperature"
+    assert generator.sort_index is catalog.sort_index
+    assert [s.name for s in catalog.sorted_services("-temperature")["fischer"]] == ["C1", "P3"]
+
+
+def test_catalog_aload_matches_sync_load(schliffs_dir):
+    async def main():
+        return await Catalog.aload(schliffs_dir, concurrency=2)
+
+    catalog = asyncio.run(main())
+    expected = Catalog(schliffs_dir).load()
+
+    assert catalog.loaded
+    assert catalog.services == expected.services
+    assert catalog.service_metadata == expected.service_metadata
+    assert catalog.name_to_path == expected.name_to_path
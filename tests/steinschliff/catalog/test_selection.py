@@ -1,6 +1,11 @@
 import pytest
 
-from steinschliff.catalog import filter_services_by_condition, select_services
+from steinschliff.catalog import (
+    ServiceIndex,
+    bucket_services_by_condition,
+    filter_services_by_condition,
+    select_services,
+)
 from steinschliff.models import ServiceMetadata, StructureInfo
 
 
@@ -48,3 +53,64 @@ def test_filter_services_by_condition_returns_all_for_blank_key():
     services = {"svc": [StructureInfo(name="A", condition="blue", file_path="a")]}
     filtered = filter_services_by_condition(services=services, condition_key="  ")
     assert list(filtered.keys()) == ["svc"]
+
+
+def test_bucket_services_by_condition_normalizes_once_and_skips_blank():
+    services = {
+        "svc": [
+            StructureInfo(name="A", condition=" Blue ", file_path="a"),
+            StructureInfo(name="B", condition="red", file_path="b"),
+            StructureInfo(name="C", file_path="c"),
+        ],
+        "other": [StructureInfo(name="D", condition="blue", file_path="d")],
+    }
+    buckets = bucket_services_by_condition(services)
+    assert {key: list(bucket) for key, bucket in buckets.items()} == {"blue": ["svc", "other"], "red": ["svc"]}
+    assert [s.name for s in buckets["blue"]["svc"]] == ["A"]
+    with pytest.raises(TypeError):
+        buckets["blue"]["svc"] = ()  # type: ignore[index]
+    # Внутренние списки тоже неизменяемы: корзины разделяются между выборками.
+    assert isinstance(buckets["blue"]["svc"], tuple)
+    services["svc"].append(StructureInfo(name="E", condition="blue", file_path="e"))
+    assert [s.name for s in buckets["blue"]["svc"]] == ["A"]
+
+
+def test_select_services_corrects_typo_and_suggests():
+    services = {"rossignol": [], "ramsau": []}
+    meta = {"rossignol": ServiceMetadata(name="Rossignol")}
+    assert list(select_services(services=services, service_metadata=meta, service_filter="Rosignol")) == ["rossignol"]
+    with pytest.raises(ValueError, match="не найден"):
+        select_services(services=services, service_metadata=meta, service_filter="atomic")
+
+
+def test_select_services_raises_for_metadata_only_service():
+    services = {"svc": [StructureInfo(name="S", file_path="x")]}
+    meta = {"svc": ServiceMetadata(name="Service Visible"), "empty": ServiceMetadata(name="Empty Service")}
+    with pytest.raises(ValueError, match="не найден"):
+        select_services(services=services, service_metadata=meta, service_filter="Empty Servce")
+
+
+def test_service_index_resolves_names_globs_and_countries():
+    services = {"ramsau": [], "rossignol": [], "marsport": [], "mass sport": []}
+    meta = {
+        "ramsau": ServiceMetadata(name="Ramsau", country="Germany"),
+        "rossignol": ServiceMetadata(name="Rossignol", country="France"),
+        "marsport": ServiceMetadata(name="Marsport", country="Россия"),
+        "mass sport": ServiceMetadata(name="Mass Sport", country="Россия"),
+    }
+    index = ServiceIndex(services=services, service_metadata=meta)
+
+    assert index.resolve_many(["Mass Sport", "ramsau", "Ramsau"]) == ("ramsau", "mass sport")
+    assert index.resolve_many(["*sport"]) == ("marsport", "mass sport")
+    assert index.resolve_many(["r*"]) == ("ramsau", "rossignol")
+    assert index.by_country(["russia"]) == ("marsport", "mass sport")
+    assert index.by_country(["Germny", "fr*"]) == ("ramsau", "rossignol")
+    assert dict(index.countries) == {
+        "germany": ("ramsau",),
+        "france": ("rossignol",),
+        "россия": ("marsport", "mass sport"),
+    }
+    with pytest.raises(ValueError, match="ни один сервис"):
+        index.resolve_many(["x*"])
+    with pytest.raises(ValueError, match="Известные"):
+        index.by_country(["Japan"])
@@ -0,0 +1,54 @@
+import gzip
+import hashlib
+import json
+
+from steinschliff.export.artifacts import LATEST_MANIFEST_NAME, publish_artifact
+
+
+def test_publish_artifact_writes_fingerprinted_copy_gzip_and_manifest(tmp_path):
+    src = tmp_path / "structures.json"
+    src.write_text('[{"name": "A"}]', encoding="utf-8")
+    digest = hashlib.sha256(src.read_bytes()).hexdigest()
+
+    artifact = publish_artifact(src)
+
+    assert artifact.file == f"structures.{digest[:12]}.json"
+    assert artifact.gzip_file == f"{artifact.file}.gz"
+    assert not artifact.unchanged
+    assert src.exists()
+    assert (tmp_path / artifact.file).read_bytes() == src.read_bytes()
+    assert gzip.decompress((tmp_path / artifact.gzip_file).read_bytes()) == src.read_bytes()
+
+    latest = json.loads((tmp_path / LATEST_MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert latest["artifacts"]["structures.json"]["file"] == artifact.file
+    assert latest["artifacts"]["structures.json"]["sha256"] == digest
+
+
+def test_publish_artifact_skips_unchanged_content(tmp_path):
+    src = tmp_path / "structures.json"
+    src.write_text("[]", encoding="utf-8")
+    first = publish_artifact(src)
+    gz = tmp_path / str(first.gzip_file)
+    mtime = gz.stat().st_mtime_ns
+
+    second = publish_artifact(src)
+
+    assert second.unchanged
+    assert second.file == first.file
+    assert second.gzip_size == first.gzip_size
+    assert gz.stat().st_mtime_ns == mtime
+
+    src.write_text('[{"name": "B"}]', encoding="utf-8")
+    third = publish_artifact(src)
+    assert not third.unchanged
+    assert third.file != first.file
+
+
+def test_publish_artifact_gzip_only_keeps_plain_name(tmp_path):
+    src = tmp_path / "structures.index.json"
+    src.write_text("{}", encoding="utf-8")
+
+    artifact = publish_artifact(src, fingerprint=False)
+
+    assert artifact.file == "structures.index.json"
+    assert (tmp_path / "structures.index.json.gz").exists()
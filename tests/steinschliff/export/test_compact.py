@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from steinschliff.export.compact import decode_compact, encode_compact, export_structures_compact
+from steinschliff.export.json import iter_structure_records
+from steinschliff.models import Service, StructureInfo
+
+
+def _services():
+    return {
+        "fischer": [
+            StructureInfo(
+                name="C1",
+                snow_type="fresh",
+                temperature=[{"min": -5, "max": -15}],
+                service=Service(name="Fischer"),
+                country="Austria",
+                tags=["cold", "fresh"],
+                file_path="schliffs/fischer/C1.yaml",
+            ),
+            StructureInfo(
+                name="C2",
+                snow_type="fresh",
+                service=Service(name="Fischer"),
+                country="Austria",
+                tags=["cold"],
+                similars=["C1"],
+                file_path="schliffs/fischer/C2.yaml",
+            ),
+        ],
+        "loose": [StructureInfo(name="X", file_path="X.yaml")],
+    }
+
+
+def test_compact_round_trips_flat_records():
+    records = list(iter_structure_records(_services()))
+
+    doc = encode_compact(records)
+
+    assert decode_compact(doc) == records
+    # Повторяющиеся значения хранятся один раз; самые частые — с наименьшими индексами.
+    assert doc["strings"].count("Austria") == 1
+    assert doc["strings"].count("schliffs/fischer") == 1
+    assert doc["strings"].index("cold") < doc["strings"].index("C2")
+
+
+def test_export_structures_compact_is_minified_and_smaller(tmp_path):
+    out = tmp_path / "structures.compact.json"
+
+    export_structures_compact(services=_services(), out_path=str(out))
+
+    text = out.read_text(encoding="utf-8")
+    assert "\n" not in text
+    assert ", " not in text
+    flat = json.dumps(list(iter_structure_records(_services())), ensure_ascii=False, separators=(",", ":"))
+    assert len(text) < len(flat)
+
+
+def test_decode_compact_rejects_unknown_format():
+    with pytest.raises(ValueError, match="Неподдерживаемый"):
+        decode_compact({"format": "other", "version": 1})
@@ -1,4 +1,6 @@
-from steinschliff.export.csv import export_structures_csv_string
+import io
+
+from steinschliff.export.csv import export_structures_csv_string, write_structures_csv
 from steinschliff.models import Service, StructureInfo
 
 
@@ -21,3 +23,30 @@ def test_export_structures_csv_string_contains_header_and_row():
     assert "Сервис,Имя,Тип снега,Условия,Температура,Похожие" in content
     assert "svc" in content
     assert "S1" in content
+
+
+class _CountingSink(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def test_write_structures_csv_streams_rows_and_flushes_in_chunks():
+    services = {
+        "svc": [StructureInfo(name=f"S{i}", file_path=f"s{i}.yaml") for i in range(5)],
+        "other": [StructureInfo(name="B", file_path="b.yaml"), StructureInfo(name="A", file_path="a.yaml")],
+    }
+    sink = _CountingSink()
+
+    rows = write_structures_csv(services=services, sink=sink, sort_key=lambda s: s.name, flush_every=2)
+
+    lines = sink.getvalue().splitlines()
+    assert rows == 7
+    assert len(lines) == 8
+    assert [line.split(",")[1] for line in lines[-2:]] == ["A", "B"]
+    assert sink.flushes == 3 + 1
+    assert sink.getvalue() == export_structures_csv_string(services=services, sort_key=lambda s: s.name)
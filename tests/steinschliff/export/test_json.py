@@ -1,6 +1,7 @@
+import io
 import json
 
-from steinschliff.export.json import export_structures_json
+from steinschliff.export.json import export_structures_json, write_structures_ndjson
 from steinschliff.models import Service, StructureInfo
 
 
@@ -31,3 +32,24 @@ def test_export_structures_json_writes_file(tmp_path):
     assert data[0]["temp_min"] == -5
     assert data[0]["temp_max"] == 0
     assert data[0]["tags"] == ["t1"]
+
+
+def test_write_structures_ndjson_streams_one_record_per_line():
+    services = {
+        "svc": [
+            StructureInfo(name="A", temperature=[{"min": -10, "max": -2}], file_path="a.yaml"),
+            StructureInfo(name="B", service=Service(name="Other"), file_path="b.yaml"),
+        ],
+        "empty": [],
+    }
+
+    stream = io.StringIO()
+    count = write_structures_ndjson(services=services, stream=stream)
+
+    lines = stream.getvalue().splitlines()
+    assert count == len(lines) == 2
+    first, second = (json.loads(line) for line in lines)
+    assert first["name"] == "A"
+    assert first["temp_min"] == -10
+    assert second["service"] == "Other"
+    assert second["temp_min"] is None
@@ -0,0 +1,90 @@
+import bisect
+import json
+
+from steinschliff.catalog import ServiceIndex
+from steinschliff.export.json import iter_structure_records
+from steinschliff.export.search_index import build_search_index, export_search_index
+from steinschliff.models import Service, StructureInfo
+from steinschliff.query import QueryIndex
+
+
+def _services():
+    return {
+        "fischer": [
+            StructureInfo(
+                name="C1-1",
+                snow_type="all, Fresh",
+                condition="Blue",
+                temperature=[{"min": -5, "max": -15}],
+                tags=["cold", ""],
+                file_path="a.yaml",
+            ),
+            StructureInfo(name="P22-6", snow_type="all", temperature=[{"min": -5, "max": 5}], file_path="b.yaml"),
+        ],
+        "uventa": [
+            StructureInfo(
+                name="cold line",
+                service=Service(name="Uventa"),
+                condition="blue",
+                tags=["cold"],
+                file_path="c.yaml",
+            )
+        ],
+    }
+
+
+def test_build_search_index_postings_follow_export_order():
+    services = _services()
+    index = build_search_index(services)
+    names = [r["name"] for r in iter_structure_records(services)]
+
+    postings = index["postings"]
+    assert [names[i] for i in postings["tags"]["cold"]] == ["C1-1", "cold line"]
+    assert postings["snow_type"] == {"all": [0, 1], "fresh": [0]}
+    assert postings["condition"] == {"blue": [0, 2]}
+    assert postings["service"] == {"Uventa": [2], "fischer": [0, 1]}
+    assert index["facets"]["snow_type"] == {"all": 2, "fresh": 1}
+    assert index["count"] == 3
+
+
+def test_build_search_index_temperature_and_name_tables_are_searchable():
+    index = build_search_index(_services())
+
+    # Структуры, чей диапазон покрывает -10°: lo <= -10 и hi >= -10.
+    lo, hi = index["temperature"]["lo"], index["temperature"]["hi"]
+    assert lo == [[-15.0, 0], [-5.0, 1]]
+    below = {i for _, i in lo[: bisect.bisect_right([v for v, _ in lo], -10)]}
+    above = {i for _, i in hi[bisect.bisect_left([v for v, _ in hi], -10) :]}
+    assert below & above == {0}
+
+    keys = [k for k, _ in index["names"]]
+    start = bisect.bisect_left(keys, "c")
+    assert [k for k in keys[start:] if k.startswith("c")] == ["c1-1", "cold line"]
+
+
+def test_build_search_index_temperature_follows_query_rule():
+    services = {
+        "fischer": [
+            StructureInfo(name="open", temperature=[{"min": -3, "max": None}], file_path="a.yaml"),
+            StructureInfo(name="flags", temperature=[{"min": True, "max": False}], file_path="b.yaml"),
+            StructureInfo(
+                name="two",
+                temperature=[{"min": -2, "max": 2}, {"min": -12, "max": -6}],
+                file_path="c.yaml",
+            ),
+        ]
+    }
+    index = build_search_index(services)
+    query = QueryIndex(services, service_index=ServiceIndex(services=services, service_metadata={}))
+
+    assert index["temperature"]["lo"] == [[-12.0, 2], [-3.0, 0]]
+    assert index["temperature"]["hi"] == [[-3.0, 0], [2.0, 2]]
+    assert query.ranges == [((-3.0, -3.0),), (), ((-2.0, 2.0), (-12.0, -6.0))]
+
+
+def test_export_search_index_writes_json(tmp_path):
+    out = tmp_path / "data" / "structures.index.json"
+
+    index = export_search_index(services=_services(), out_path=out, minify=True)
+
+    assert json.loads(out.read_text(encoding="utf-8")) == index
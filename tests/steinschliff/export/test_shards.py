@@ -0,0 +1,102 @@
+import hashlib
+import json
+
+from steinschliff.export.shards import export_structures_sharded, shard_file_stem
+from steinschliff.models import StructureInfo
+
+
+def _structure(name: str, country: str, condition: str, temp: tuple[float, float] | None) -> StructureInfo:
+    return StructureInfo(
+        name=name,
+        country=country,
+        condition=condition,
+        temperature=[{"min": temp[0], "max": temp[1]}] if temp else [],
+        file_path=f"schliffs/{name}.yaml",
+    )
+
+
+def test_export_structures_sharded_writes_shards_and_manifest(tmp_path):
+    services = {
+        "fischer": [_structure("A", "Austria", "blue", (-5, -15)), _structure("B", "Austria", "", None)],
+        "uventa": [_structure("C", "Россия", "Red", (-2, 3))],
+    }
+
+    manifest = export_structures_sharded(services=services, out_dir=tmp_path / "country", shard_by="country")
+
+    on_disk = json.loads((tmp_path / "country" / "manifest.json").read_text(encoding="utf-8"))
+    assert on_disk == manifest
+    assert manifest["shard_by"] == "country"
+    assert manifest["total"] == 3
+
+    shards = {shard["name"]: shard for shard in manifest["shards"]}
+    assert set(shards) == {"Austria", "Россия"}
+    austria = shards["Austria"]
+    assert austria["file"] == "austria.json"
+    assert austria["count"] == 2
+    assert (austria["temp_min"], austria["temp_max"]) == (-15, -5)
+
+    payload = (tmp_path / "country" / shards["Россия"]["file"]).read_bytes()
+    assert shards["Россия"]["file"].isascii()
+    assert hashlib.sha256(payload).hexdigest() == shards["Россия"]["sha256"]
+    assert [r["name"] for r in json.loads(payload)] == ["C"]
+
+
+def test_export_structures_sharded_by_condition_groups_unknown(tmp_path):
+    services = {"svc": [_structure("A", "", "", None), _structure("B", "", "red", (-1, 0))]}
+
+    manifest = export_structures_sharded(services=services, out_dir=tmp_path, shard_by="condition", fmt="ndjson")
+
+    shards = {shard["name"]: shard for shard in manifest["shards"]}
+    assert set(shards) == {"red", "unknown"}
+    assert shards["unknown"]["temp_min"] is None
+    lines = (tmp_path / shards["red"]["file"]).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["B"]
+
+
+def test_shard_file_stem_is_unique_and_url_safe():
+    taken = set[str]()
+    assert shard_file_stem("mass sport", taken) == "mass-sport"
+    assert shard_file_stem("Mass Sport", taken) == "mass-sport-2"
+    assert shard_file_stem("Россия", taken).startswith("x-")
+
+
+def test_export_structures_sharded_does_not_overwrite_manifest(tmp_path):
+    services = {"svc": [_structure("A", "Manifest", "blue", None), _structure("B", "Austria", "red", None)]}
+
+    manifest = export_structures_sharded(services=services, out_dir=tmp_path, shard_by="country")
+
+    shards = {shard["name"]: shard["file"] for shard in manifest["shards"]}
+    assert shards == {"Austria": "austria.json", "Manifest": "manifest-2.json"}
+    assert json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8")) == manifest
+    assert [r["name"] for r in json.loads((tmp_path / "manifest-2.json").read_text(encoding="utf-8"))] == ["A"]
+
+    # Манифест старой версии мог ссылаться на `manifest.json` как на шард.
+    (tmp_path / "manifest.json").write_text(json.dumps({"shards": [{"file": "manifest.json"}]}), encoding="utf-8")
+    assert export_structures_sharded(services=services, out_dir=tmp_path, shard_by="country") == manifest
+    assert (tmp_path / "manifest.json").exists()
+
+
+def test_export_structures_sharded_bounds_cover_all_ranges(tmp_path):
+    structure = _structure("A", "Austria", "blue", (-5, -1))
+    structure.temperature.append({"min": -20, "max": -12})
+    structure.temperature.append({"max": 4})
+
+    manifest = export_structures_sharded(services={"svc": [structure]}, out_dir=tmp_path, shard_by="service")
+
+    (shard,) = manifest["shards"]
+    assert (shard["temp_min"], shard["temp_max"]) == (-20, 4)
+
+
+def test_export_structures_sharded_removes_stale_shards(tmp_path):
+    (tmp_path / "structures.json").write_text("[]", encoding="utf-8")
+    services = {"fischer": [_structure("A", "Austria", "blue", None)], "uventa": [_structure("B", "", "red", None)]}
+    export_structures_sharded(services=services, out_dir=tmp_path, shard_by="service")
+    assert (tmp_path / "uventa.json").exists()
+
+    del services["uventa"]
+    manifest = export_structures_sharded(services=services, out_dir=tmp_path, shard_by="service")
+
+    assert [shard["file"] for shard in manifest["shards"]] == ["fischer.json"]
+    assert not (tmp_path / "uventa.json").exists()
+    assert (tmp_path / "fischer.json").exists()
+    assert (tmp_path / "structures.json").exists()
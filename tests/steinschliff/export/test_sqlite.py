@@ -0,0 +1,95 @@
+import sqlite3
+
+import pytest
+
+from steinschliff.export import sqlite as sqlite_export
+from steinschliff.export.sqlite import export_catalog_sqlite
+from steinschliff.models import ServiceMetadata, StructureInfo
+
+
+def _services():
+    return {
+        "fischer": [
+            StructureInfo(
+                name="C1-1",
+                description="Cold universal structure",
+                description_ru="Холодная универсальная структура",
+                condition="blue",
+                temperature=[{"min": -5, "max": -15}],
+                tags=["cold", None, ""],
+                similars=["P5-9"],
+                file_path="schliffs/fischer/C1-1.yaml",
+            ),
+            StructureInfo(name="P3-3", condition="red", temperature=[{"min": 15, "max": 3}], file_path="p.yaml"),
+        ],
+        "uventa": [StructureInfo(name="U1", tags=["cold"], file_path="u.yaml")],
+    }
+
+
+def test_export_catalog_sqlite_writes_normalized_tables(tmp_path):
+    db = tmp_path / "out" / "catalog.db"
+
+    stats = export_catalog_sqlite(
+        services=_services(),
+        service_metadata={"fischer": ServiceMetadata(name="Fischer", country="Austria")},
+        out_path=db,
+    )
+
+    assert stats.rows["structures"] == 3
+    assert stats.rows["tags"] == 2
+    assert not (tmp_path / "out" / "catalog.db.tmp").exists()
+
+    conn = sqlite3.connect(db)
+    try:
+        rows = conn.execute(
+            "SELECT s.name, sv.name FROM structures s JOIN services sv ON sv.id = s.service_id "
+            "JOIN temperature_ranges t ON t.structure_id = s.id WHERE t.temp_low <= -10 AND t.temp_high >= -10"
+        ).fetchall()
+        assert rows == [("C1-1", "Fischer")]
+
+        tagged = conn.execute(
+            "SELECT s.name FROM tags t JOIN structures s ON s.id = t.structure_id WHERE t.tag = 'cold' ORDER BY s.id"
+        ).fetchall()
+        assert tagged == [("C1-1",), ("U1",)]
+
+        assert conn.execute("SELECT name_ru FROM snow_conditions WHERE key = 'blue'").fetchone()[0]
+        plan = " ".join(
+            str(r[-1]) for r in conn.execute("EXPLAIN QUERY PLAN SELECT * FROM structures WHERE condition = 'red'")
+        )
+        assert "idx_structures_condition" in plan
+
+        if stats.fts:
+            hits = conn.execute(
+                "SELECT rowid FROM structures_fts WHERE structures_fts MATCH 'универсальная'"
+            ).fetchall()
+            assert hits == [(1,)]
+    finally:
+        conn.close()
+
+
+def test_export_catalog_sqlite_overwrites_existing_db(tmp_path):
+    db = tmp_path / "catalog.db"
+    db.write_bytes(b"not a database")
+
+    export_catalog_sqlite(services=_services(), service_metadata={}, out_path=db)
+
+    conn = sqlite3.connect(db)
+    try:
+        assert conn.execute("SELECT count(*) FROM services").fetchone() == (2,)
+    finally:
+        conn.close()
+
+
+def test_export_catalog_sqlite_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    db = tmp_path / "catalog.db"
+    db.write_bytes(b"previous export")
+
+    def broken_fts(_conn):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(sqlite_export, "_create_fts", broken_fts)
+    with pytest.raises(sqlite3.OperationalError):
+        export_catalog_sqlite(services=_services(), service_metadata={}, out_path=db)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["catalog.db"]
+    assert db.read_bytes() == b"previous export"
@@ -0,0 +1,70 @@
+import pytest
+
+from steinschliff.matching import FuzzyMatcher, bounded_levenshtein, normalize_text
+
+
+@pytest.fixture
+def matcher():
+    return FuzzyMatcher(
+        {
+            "fischer": "fischer",
+            "Fischer Ski": "fischer",
+            "rossignol": "rossignol",
+            "ramsau": "ramsau",
+            "Зелёный": "green",
+            "red": "red",
+            "rex": "rex",
+        }
+    )
+
+
+def test_normalize_text():
+    assert normalize_text("  Зелёный_снег-Old ") == "зеленый снег old"
+    assert normalize_text("") == ""
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "bound", "expected"),
+    [
+        ("fischer", "fischer", 1, 0),
+        ("fisher", "fischer", 1, 1),
+        ("rosignoll", "rossignol", 2, 2),
+        ("rosignoll", "rossignol", 1, None),
+        ("abc", "abcdef", 2, None),
+        ("bleu", "blue", 1, 1),
+    ],
+)
+def test_bounded_levenshtein(a, b, bound, expected):
+    assert bounded_levenshtein(a, b, bound) == expected
+
+
+def test_exact_match_after_normalization(matcher):
+    result = matcher.match("FISCHER-ski")
+    assert (result.value, result.exact) == ("fischer", True)
+    assert matcher.match("зеленый").value == "green"
+
+
+def test_typo_resolves_to_unique_closest_value(matcher):
+    result = matcher.match("Fisher")
+    assert (result.value, result.exact) == ("fischer", False)
+    assert matcher.match("rosignol").value == "rossignol"
+    assert matcher.match("ramzau").value == "ramsau"
+
+
+def test_ambiguous_or_unknown_input_returns_suggestions_only(matcher):
+    ambiguous = matcher.match("rez")
+    assert ambiguous.value is None
+    assert ambiguous.suggestions == ("red", "rex")
+
+    unknown = matcher.match("madshus")
+    assert (unknown.value, unknown.suggestions) == (None, ())
+    assert matcher.match("  ").value is None
+
+
+def test_complete_by_prefix_with_fuzzy_fallback(matcher):
+    assert matcher.complete("r") == ["ramsau", "red", "rex", "rossignol"]
+    assert matcher.complete("fischer s") == ["fischer"]
+    assert matcher.complete("fisc") == ["fischer"]
+    assert matcher.complete("rosi") == []
+    assert matcher.complete("rosignol") == ["rossignol"]
+    assert len(matcher.complete("", limit=3)) == 3
@@ -0,0 +1,55 @@
+import sqlite3
+import threading
+
+import pytest
+
+from steinschliff.config import GeneratorConfig
+from steinschliff.generator import ReadmeGenerator
+from steinschliff.models import StructureInfo
+from steinschliff.pipeline.build import BUILD_TARGETS, BuildOutputs, parse_targets, run_build
+from steinschliff.profiling.trace import start_tracing, stop_tracing
+
+
+def test_parse_targets_keeps_order_and_drops_duplicates():
+    assert parse_targets("csv, json,csv") == ["csv", "json"]
+    assert parse_targets("all") == list(BUILD_TARGETS)
+    with pytest.raises(ValueError, match="Неизвестная цель"):
+        parse_targets("readme,pdf")
+    with pytest.raises(ValueError, match="ни одной"):
+        parse_targets(" , ")
+
+
+def test_run_build_exports_from_one_loaded_catalog_in_parallel(tmp_path):
+    generator = ReadmeGenerator(
+        GeneratorConfig(
+            schliffs_dir=tmp_path,
+            readme_file=tmp_path / "README_en.md",
+            readme_ru_file=tmp_path / "README.md",
+            translations_dir=tmp_path,
+        )
+    )
+    generator.services["svc"].append(StructureInfo(name="S1", temperature=[{"min": -5, "max": 0}], file_path="s.yaml"))
+    outputs = BuildOutputs(
+        json_path=tmp_path / "out" / "structures.json",
+        csv_path=tmp_path / "out" / "structures.csv",
+        sqlite_path=tmp_path / "out" / "catalog.db",
+    )
+
+    recorder = start_tracing()
+    try:
+        results = run_build(generator, ["json", "csv", "sqlite"], outputs=outputs)
+    finally:
+        stop_tracing()
+
+    assert [r.target for r in results] == ["json", "csv", "sqlite"]
+    assert outputs.json_path.exists()
+    assert "S1" in outputs.csv_path.read_text(encoding="utf-8")
+    conn = sqlite3.connect(outputs.sqlite_path)
+    try:
+        assert conn.execute("SELECT name FROM structures").fetchall() == [("S1",)]
+    finally:
+        conn.close()
+
+    build_tids = {e["tid"] for e in recorder.events if e["name"].startswith("build:")}
+    assert build_tids
+    assert threading.get_native_id() not in build_tids
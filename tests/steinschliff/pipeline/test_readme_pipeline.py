@@ -1,9 +1,15 @@
+import asyncio
+import threading
+import time
 from pathlib import Path
 
+import pytest
 import yaml
 
 from steinschliff.models import ServiceMetadata, StructureInfo
+from steinschliff.pipeline import readme
 from steinschliff.pipeline.readme import (
+    aload_structures_from_yaml_files,
     get_structure_sort_key,
     load_structures_from_yaml_files,
     prepare_countries_data,
@@ -39,6 +45,70 @@ def test_load_structures_from_yaml_files_collects_services_and_stats(tmp_path: P
     assert "S1" in loaded.name_to_path
 
 
+def test_aload_structures_matches_sync_loader_and_keeps_order(tmp_path: Path):
+    svc = tmp_path / "svc"
+    svc.mkdir()
+    for i in range(12):
+        _write_yaml(svc / f"s{i:02d}.yaml", {"name": f"S{i}", "description": "d", "condition": "blue"})
+    (svc / "bad.yaml").write_text("invalid: [\n", encoding="utf-8")
+    files = [svc / "missing.yaml", svc / "bad.yaml", *sorted(svc.glob("s*.yaml"), reverse=True)]
+
+    expected = load_structures_from_yaml_files(yaml_files=files, schliffs_dir=tmp_path)
+    loaded = asyncio.run(aload_structures_from_yaml_files(yaml_files=files, schliffs_dir=tmp_path, concurrency=3))
+
+    assert loaded == expected
+    assert [s.name for s in loaded.services["svc"]] == [f"S{i}" for i in reversed(range(12))]
+    assert loaded.stats.error_files == 2
+
+
+def test_aload_structures_builds_models_off_the_event_loop(tmp_path: Path, monkeypatch):
+    svc = tmp_path / "svc"
+    svc.mkdir()
+    for i in range(3):
+        _write_yaml(svc / f"s{i}.yaml", {"name": f"S{i}", "description": "d"})
+    threads = []
+    original = readme._build_structure
+
+    def recording_build(*args):
+        threads.append(threading.current_thread())
+        return original(*args)
+
+    monkeypatch.setattr(readme, "_build_structure", recording_build)
+    loaded = asyncio.run(aload_structures_from_yaml_files(yaml_files=sorted(svc.glob("*.yaml")), schliffs_dir=tmp_path))
+
+    assert loaded.stats.processed_structures == 3
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+def test_aload_structures_cancels_without_waiting_for_parser(tmp_path: Path, monkeypatch):
+    svc = tmp_path / "svc"
+    svc.mkdir()
+    for i in range(5):
+        _write_yaml(svc / f"s{i}.yaml", {"name": f"S{i}", "description": "d"})
+    original = readme.read_yaml_file
+
+    def slow_read(*args):
+        time.sleep(0.3)
+        return original(*args)
+
+    monkeypatch.setattr(readme, "read_yaml_file", slow_read)
+
+    async def load_and_cancel() -> float:
+        task = asyncio.create_task(
+            aload_structures_from_yaml_files(yaml_files=sorted(svc.glob("*.yaml")), schliffs_dir=tmp_path)
+        )
+        await asyncio.sleep(0.1)
+        started = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return time.perf_counter() - started
+
+    # Ожидание потока-парсера заняло бы 0.2–1.5 с (текущий и оставшиеся файлы).
+    assert asyncio.run(load_and_cancel()) < 0.15
+
+
 def test_prepare_countries_data_orders_russia_first():
     services = {
         "svc1": [StructureInfo(name="A", file_path="a")],
@@ -0,0 +1,36 @@
+import io
+import pstats
+
+from steinschliff.formatters import format_temperature_range
+from steinschliff.profiling import CommandProfiler
+
+
+def _workload() -> None:
+    for _ in range(50):
+        format_temperature_range([{"min": -5, "max": 0}])
+    sorted(range(1000), key=lambda x: -x)
+
+
+def test_command_profiler_dumps_pstats(tmp_path):
+    out = tmp_path / "prof" / "cli.pstats"
+    profiler = CommandProfiler(out)
+    profiler.start()
+    _workload()
+    profiler.stop()
+
+    assert out.exists()
+    stats = pstats.Stats(str(out))
+    assert any(func[2] == "format_temperature_range" for func in stats.stats)
+
+
+def test_command_profiler_report_is_restricted_to_package(tmp_path):
+    profiler = CommandProfiler(tmp_path / "cli.pstats")
+    profiler.start()
+    _workload()
+    profiler.stop()
+
+    stream = io.StringIO()
+    profiler.report(stream)
+    report = stream.getvalue()
+    assert "format_temperature_range" in report
+    assert "<lambda>" not in report
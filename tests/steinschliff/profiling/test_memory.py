@@ -0,0 +1,97 @@
+import threading
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+from steinschliff.matching import normalize_text
+from steinschliff.pipeline.readme import load_structures_from_yaml_files
+from steinschliff.profiling import MemoryProfiler, memory
+from steinschliff.profiling.trace import span
+
+
+def _write_catalog(root: Path, count: int) -> list[Path]:
+    svc = root / "svc"
+    svc.mkdir()
+    paths = []
+    for i in range(count):
+        path = svc / f"S{i}.yaml"
+        with path.open("w", encoding="utf-8") as f:
+            yaml.safe_dump({"name": f"S{i}", "description": "x" * 200, "tags": ["a", "b"]}, f)
+        paths.append(path)
+    return paths
+
+
+def test_memory_profiler_reports_stages_and_package_sites(tmp_path):
+    yaml_files = _write_catalog(tmp_path, 20)
+
+    profiler = MemoryProfiler()
+    profiler.start()
+    try:
+        with span("run"):
+            with span("load_structures"):
+                loaded = load_structures_from_yaml_files(yaml_files=yaml_files, schliffs_dir=tmp_path)
+            with span("load_file", category="io"):
+                pass
+            with span("render"):
+                rendered = "\n".join(s.description or "" for s in loaded.services["svc"]) * 10
+    finally:
+        profiler.stop()
+
+    assert rendered
+    stages = sorted(profiler.stages, key=lambda s: s.order)
+    assert [(s.name, s.depth) for s in stages] == [("run", 0), ("load_structures", 1), ("render", 1)]
+
+    run, load, render = stages
+    assert load.growth_bytes > 0
+    assert render.growth_bytes >= len(rendered)
+    assert run.peak_bytes >= max(load.peak_bytes, render.peak_bytes)
+
+    modules = dict(profiler.module_totals())
+    assert "steinschliff.pipeline.readme" in modules
+    assert not any(name.startswith("steinschliff.profiling") for name in modules)
+    assert profiler.top_sites()[0].size_bytes >= profiler.top_sites()[-1].size_bytes
+
+
+def test_memory_profiler_keeps_stage_stacks_per_thread():
+    worker_entered = threading.Event()
+    main_closed = threading.Event()
+
+    def worker():
+        with span("worker_outer"), span("worker_inner"):
+            worker_entered.set()
+            main_closed.wait(5)
+
+    profiler = MemoryProfiler()
+    profiler.start()
+    try:
+        with span("main"):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            worker_entered.wait(5)
+        # Главный поток закрыл свою стадию, пока у рабочего открыты две.
+        main_closed.set()
+        thread.join()
+    finally:
+        profiler.stop()
+
+    depths = {s.name: s.depth for s in profiler.stages}
+    assert depths == {"main": 0, "worker_outer": 0, "worker_inner": 1}
+    assert [s.name for s in profiler.stages] == ["main", "worker_inner", "worker_outer"]
+
+
+def test_aggregate_sites_tolerates_frames_outside_project(monkeypatch, tmp_path):
+    # Пакет установлен вне проекта (site-packages): относительный путь не вычисляется.
+    monkeypatch.setattr(memory, "project_root", lambda: tmp_path)
+    assert memory._module_name("<frozen posixpath>", str(tmp_path / "steinschliff")) == "<frozen posixpath>"
+
+    tracemalloc.start(5)
+    try:
+        payload = [normalize_text("Ё-" * 500 + str(i)) for i in range(50)]
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    assert payload
+    sites = {site.module: site for site in memory._aggregate_sites(snapshot)}
+    assert sites["steinschliff.matching"].location.startswith(str(Path(memory.__file__).parents[1] / "matching.py"))
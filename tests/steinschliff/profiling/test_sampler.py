@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from steinschliff.exceptions import SteinschliffUserError
+from steinschliff.formatters import format_temperature_range
+from steinschliff.profiling import StackSampler
+
+
+def _busy_formatting(sampler: StackSampler, deadline: float) -> None:
+    while sampler.samples < 20 and time.perf_counter() < deadline:
+        format_temperature_range([{"min": -12.5, "max": 3}])
+
+
+def test_stack_sampler_writes_collapsed_stacks(tmp_path):
+    out = tmp_path / "flame" / "stacks.folded"
+    sampler = StackSampler(out, rate_hz=1000)
+    sampler.start()
+    try:
+        _busy_formatting(sampler, time.perf_counter() + 5)
+    finally:
+        sampler.stop()
+
+    assert sampler.samples > 0
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert ";" in stack
+    assert int(count) > 0
+    assert any("test_sampler:_busy_formatting" in line for line in lines)
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == sampler.samples
+
+
+def test_stack_sampler_rejects_non_positive_rate(tmp_path):
+    with pytest.raises(SteinschliffUserError, match="положительной"):
+        StackSampler(tmp_path / "x.folded", rate_hz=0)
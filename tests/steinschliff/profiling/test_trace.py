@@ -0,0 +1,43 @@
+import json
+import threading
+
+from steinschliff.profiling.trace import span, start_tracing, stop_tracing
+
+
+def test_span_is_noop_without_tracing():
+    with span("idle"):
+        pass
+    assert stop_tracing() is None
+
+
+def test_trace_records_nested_spans_with_thread_ids(tmp_path):
+    recorder = start_tracing()
+    try:
+        with span("outer", files=2), span("inner", category="io", path="a.yaml"):
+            pass
+
+        def _worker() -> None:
+            with span("threaded"):
+                pass
+
+        thread = threading.Thread(target=_worker, name="exporter-1")
+        thread.start()
+        thread.join()
+    finally:
+        assert stop_tracing() is recorder
+
+    out = recorder.write(tmp_path / "trace" / "out.json")
+    doc = json.loads(out.read_text(encoding="utf-8"))
+    events = {e["name"]: e for e in doc["traceEvents"] if e["ph"] == "X"}
+
+    assert set(events) == {"outer", "inner", "threaded"}
+    outer, inner, threaded = events["outer"], events["inner"], events["threaded"]
+    assert outer["args"] == {"files": 2}
+    assert inner["cat"] == "io"
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert threaded["pid"] == outer["pid"]
+    assert threaded["tid"] != outer["tid"]
+
+    thread_names = {e["args"]["name"] for e in doc["traceEvents"] if e["name"] == "thread_name"}
+    assert "exporter-1" in thread_names
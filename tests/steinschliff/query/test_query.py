@@ -0,0 +1,101 @@
+import pytest
+
+from steinschliff.catalog import ServiceIndex
+from steinschliff.models import ServiceMetadata, StructureInfo
+from steinschliff.query import Predicate, QueryIndex, parse_query, parse_temperature
+
+
+def _structure(name, *, condition=None, low=None, high=None, tags=None, snow_type=None, description=None):
+    temperature = [{"min": high, "max": low}] if low is not None else []
+    return StructureInfo(
+        name=name,
+        condition=condition,
+        temperature=temperature,
+        tags=tags or [],
+        snow_type=snow_type,
+        description=description,
+        file_path=f"{name}.yaml",
+    )
+
+
+@pytest.fixture
+def index():
+    services = {
+        "fischer": [
+            _structure("C1", condition="blue", low=-15, high=-5, tags=["classic"], snow_type="dry, cold"),
+            _structure("P3", condition="red", low=3, high=15, tags=["skate"], description="Wet spring snow"),
+        ],
+        "uventa": [
+            _structure("U1", condition="blue", low=-8, high=0, tags=["classic", "skate"], snow_type="fresh"),
+            _structure("U2", condition="yellow", low=-3, high=3, snow_type="wet"),
+        ],
+    }
+    meta = {
+        "fischer": ServiceMetadata(name="Fischer Ski", country="Austria"),
+        "uventa": ServiceMetadata(name="Uventa", country="Россия"),
+    }
+    return QueryIndex(services, service_index=ServiceIndex(services=services, service_metadata=meta))
+
+
+def _names(index, query):
+    return [index.structures[i].name for i in index.run(query)]
+
+
+def test_parse_query_fields_aliases_and_quotes():
+    predicates = parse_query('s:fisch*,uventa c:blue temp:-2,5 tag:classic "spring snow"')
+    assert predicates == [
+        Predicate("service", ("fisch*", "uventa")),
+        Predicate("condition", ("blue",)),
+        Predicate("temperature", ("-2,5",)),
+        Predicate("tag", ("classic",)),
+        Predicate("text", ("spring snow",)),
+    ]
+    assert parse_temperature("-10..0") == (-10.0, 0.0)
+    assert parse_temperature("5..-5") == (-5.0, 5.0)
+
+
+@pytest.mark.parametrize(
+    ("expression", "message"),
+    [("foo:bar", "Неизвестное поле"), ("temp:warm", "Некорректная температура"), ("tag:", "Пустое"), ('"x', "Некорр")],
+)
+def test_parse_query_rejects_invalid(expression, message):
+    with pytest.raises(ValueError, match=message):
+        parse_query(expression)
+
+
+def test_run_combines_predicates(index):
+    assert _names(index, "") == ["C1", "P3", "U1", "U2"]
+    assert _names(index, "condition:blue temp:-6") == ["C1", "U1"]
+    assert _names(index, "condition:синий temp:-1") == ["U1"]
+    assert _names(index, "country:austria tag:skate") == ["P3"]
+    assert _names(index, "tag:classic tag:skate") == ["U1"]
+    assert _names(index, "c:red,yellow temp:0..5") == ["P3", "U2"]
+    assert _names(index, "snow:wet,fresh") == ["U1", "U2"]
+    assert _names(index, "spring") == ["P3"]
+    assert _names(index, "service:uventa tag:missing") == []
+
+
+def test_plan_orders_by_selectivity(index):
+    steps = index.plan(parse_query("temp:-6 service:* tag:skate c:blue"))
+    assert [(step.predicate.field, step.estimate, step.access) for step in steps] == [
+        ("tag", 2, "postings"),
+        ("condition", 2, "postings"),
+        ("temperature", 2, "filter"),
+        ("service", 4, "postings"),
+    ]
+    assert index.plan(parse_query("spring"))[0].access == "scan"
+
+
+def test_values_are_resolved_with_typos_or_rejected(index):
+    assert _names(index, "condition:bleu") == ["C1", "U1"]
+    with pytest.raises(ValueError, match="Неизвестное условие 'zzz'"):
+        index.run("condition:zzz")
+    with pytest.raises(ValueError, match="не найден"):
+        index.run("service:atomic")
+
+
+def test_select_groups_by_service(index):
+    selected = index.select("tag:classic")
+    assert {key: [s.name for s in items] for key, items in selected.items()} == {"fischer": ["C1"], "uventa": ["U1"]}
+    with pytest.raises(TypeError):
+        selected["x"] = []  # type: ignore[index]
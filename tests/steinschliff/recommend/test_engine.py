@@ -0,0 +1,94 @@
+import pytest
+
+from steinschliff.models import StructureInfo
+from steinschliff.recommend import RecommendIndex, RecommendQuery, recommend, temperature_score
+
+
+def _structure(name, *, low, high, condition, snow_type=None):
+    return StructureInfo(
+        name=name,
+        condition=condition,
+        snow_type=snow_type,
+        temperature=[{"min": high, "max": low}],
+        file_path=f"{name}.yaml",
+    )
+
+
+@pytest.fixture
+def index():
+    services = {
+        "fischer": [
+            _structure("C1", low=-15, high=-5, condition="green", snow_type="dry, cold"),
+            _structure("W1", low=-3, high=5, condition="yellow", snow_type="wet, old, transformed"),
+            _structure("U1", low=-10, high=0, condition="blue", snow_type="all"),
+        ],
+        "uventa": [
+            _structure("S1", low=-12, high=-2, condition="blue", snow_type="fresh"),
+            _structure("X1", condition="red", low=-4, high=2),
+        ],
+    }
+    return RecommendIndex(services)
+
+
+def test_temperature_score_peaks_in_center_and_decays_outside():
+    assert temperature_score(-5, [(-10.0, 0.0)]) == 1.0
+    assert temperature_score(0, [(-10.0, 0.0)]) == 0.5
+    assert temperature_score(2.5, [(-10.0, 0.0)]) == pytest.approx(0.25)
+    assert temperature_score(10, [(-10.0, 0.0)]) == 0.0
+    assert temperature_score(-5, []) == 0.0
+    # Лучший из нескольких диапазонов.
+    assert temperature_score(3, [(-10.0, 0.0), (2.0, 4.0)]) == 1.0
+
+
+def test_cold_dry_weather_prefers_cold_structure(index):
+    results = recommend(index, RecommendQuery(air=-12, humidity="very_dry"), per_service=1)
+    assert results["fischer"][0].structure.name == "C1"
+
+
+def test_wet_old_snow_prefers_wet_structure(index):
+    results = recommend(index, RecommendQuery(air=1, snow=0, humidity="wet", snow_age="old"))
+    fischer = [rec.structure.name for rec in results["fischer"]]
+    assert fischer[0] == "W1"
+    assert fischer[-1] == "C1"
+    assert results["fischer"][0].snow_type == 1.0
+
+
+def test_snow_type_weight_dropped_without_humidity_and_age(index):
+    results = recommend(index, RecommendQuery(air=-5))
+    for items in results.values():
+        for rec in items:
+            assert rec.snow_type is None
+            assert 0.0 <= rec.score <= 1.0
+
+
+def test_universal_snow_type_gets_partial_credit(index):
+    scored = {rec.structure.name: rec for rec in index.score(RecommendQuery(air=-5, snow_age="new"))}
+    assert scored["S1"].snow_type == 1.0
+    assert scored["U1"].snow_type == 0.5
+    assert scored["X1"].snow_type == 0.0
+
+
+def test_recommend_ranks_services_and_respects_limits(index):
+    results = recommend(index, RecommendQuery(air=-7), per_service=2, min_score=0.1)
+    assert all(len(items) <= 2 for items in results.values())
+    best = [items[0].score for items in results.values()]
+    assert best == sorted(best, reverse=True)
+    for items in results.values():
+        assert [rec.score for rec in items] == sorted((rec.score for rec in items), reverse=True)
+        assert all(rec.score >= 0.1 for rec in items)
+
+
+def test_recommend_scores_only_selected_services(index, monkeypatch):
+    scored = []
+    score = RecommendIndex.score
+
+    def spy(self, query, *, positions=None):
+        results = score(self, query, positions=positions)
+        scored.extend(rec.structure.name for rec in results)
+        return results
+
+    monkeypatch.setattr(RecommendIndex, "score", spy)
+    results = recommend(index, RecommendQuery(air=-7), services={"uventa"})
+    assert list(results) == ["uventa"]
+    assert scored == ["S1", "X1"]
+    assert recommend(index, RecommendQuery(air=-7), services=()) == {}
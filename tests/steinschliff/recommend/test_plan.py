@@ -0,0 +1,119 @@
+import heapq
+
+import pytest
+
+from steinschliff.models import StructureInfo
+from steinschliff.recommend import (
+    RecommendIndex,
+    RecommendQuery,
+    greedy_cover,
+    plan_forecast,
+    read_forecast_csv,
+    slot_windows,
+    temperature_score,
+)
+
+
+def _structure(name, *, low, high, condition):
+    return StructureInfo(
+        name=name, condition=condition, temperature=[{"min": high, "max": low}], file_path=f"{name}.yaml"
+    )
+
+
+@pytest.fixture
+def index():
+    return RecommendIndex(
+        {
+            "fischer": [
+                _structure("COLD", low=-20, high=-10, condition="green"),
+                _structure("MID", low=-10, high=-2, condition="blue"),
+            ],
+            "uventa": [_structure("WARM", low=-2, high=6, condition="red")],
+        }
+    )
+
+
+def test_read_forecast_csv_accepts_aliases_and_optional_columns(tmp_path):
+    path = tmp_path / "forecast.csv"
+    path.write_text(
+        'Timestamp,Air_Temperature,snow_temp,humidity\n10:00,-5,"-7,5",wet\n11:00,-4,,\n',
+        encoding="utf-8",
+    )
+    slots = read_forecast_csv(path)
+    assert [slot.timestamp for slot in slots] == ["10:00", "11:00"]
+    assert slots[0].query == RecommendQuery(air=-5.0, snow=-7.5, humidity="wet")
+    assert slots[1].query == RecommendQuery(air=-4.0)
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("time,snow\n10:00,-5\n", "air"),
+        ("time,air\n10:00,cold\n", "Строка 2"),
+        ("time,air,humidity\n10:00,-5,soggy\n", "humidity"),
+    ],
+)
+def test_read_forecast_csv_rejects_bad_input(tmp_path, content, message):
+    path = tmp_path / "forecast.csv"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError, match=message):
+        read_forecast_csv(path)
+
+
+def test_score_batch_matches_single_scoring(index):
+    queries = [RecommendQuery(air=-5), RecommendQuery(air=-5, humidity="dry"), RecommendQuery(air=-5)]
+    batch = index.score_batch(queries)
+    assert batch[0] is batch[2]
+    for query, row in zip(queries, batch, strict=True):
+        assert [round(score, 4) for score in row] == [rec.score for rec in index.score(query)]
+
+
+def test_top_batch_matches_full_ranking(index):
+    queries = [
+        RecommendQuery(air=air, snow=snow, humidity=humidity)
+        for air in (-30, -15, -6, -2.5, 1, 9, 40)
+        for snow in (None, -8)
+        for humidity in (None, "wet")
+    ]
+    for positions in (None, [0, 2]):
+        for top in (1, 2, 3):
+            picks = index.top_batch(queries, top, positions=positions)
+            for query, best in zip(queries, picks, strict=True):
+                (row,) = index.score_batch([query])
+                pool = range(len(index)) if positions is None else positions
+                expected = heapq.nlargest(top, pool, key=lambda i, row=row: (row[i], -i))
+                assert [i for i, _ in best] == expected
+                assert [score for _, score in best] == [row[i] for i in expected]
+
+
+def test_temperature_candidates_cover_nonzero_scores(index):
+    for t in (-25.5, -15, -7.2, 0, 4.9, 11.5, 30):
+        candidates = index.temperature_candidates(t)
+        nonzero = {i for i, ranges in enumerate(index.ranges) if temperature_score(t, ranges) > 0}
+        assert nonzero <= candidates
+    assert not index.temperature_candidates(40)
+
+
+def test_greedy_cover_prefers_largest_then_weight():
+    chosen = greedy_cover([{0, 1}, {1}, {1, 2}, {2}], weights={0: 5.0, 2: 1.0})
+    assert chosen == [(1, (0, 1, 2)), (2, (3,))]
+    assert greedy_cover([{0}, {1}, {1}], weights={0: 1.0, 1: 2.0}) == [(1, (1, 2)), (0, (0,))]
+
+
+def test_plan_forecast_covers_every_slot(index, tmp_path):
+    path = tmp_path / "forecast.csv"
+    rows = ["timestamp,air"] + [f"{hour:02d}:00,{temp}" for hour, temp in enumerate([-15, -14, -6, -5, 2, 3, -6])]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    slots = read_forecast_csv(path)
+
+    plan = plan_forecast(index, slots, top=1)
+    assert [picks[0].structure.name for picks in plan.top] == ["COLD", "COLD", "MID", "MID", "WARM", "WARM", "MID"]
+    assert [(pick.structure.name, pick.slots) for pick in plan.cover] == [
+        ("MID", (2, 3, 6)),
+        ("WARM", (4, 5)),
+        ("COLD", (0, 1)),
+    ]
+    assert slot_windows(plan.slots, plan.cover[0].slots) == [("02:00", "03:00"), ("06:00", "06:00")]
+
+    only_fischer = plan_forecast(index, slots, top=2, services={"fischer"})
+    assert {pick.service for picks in only_fischer.top for pick in picks} == {"fischer"}
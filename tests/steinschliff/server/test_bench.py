@@ -0,0 +1,83 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from steinschliff.catalog import Catalog
+from steinschliff.server import CatalogHTTPServer
+from steinschliff.server.bench import build_query_mix, fetch_records, percentile, run_load, synthetic_snapshot
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+def test_synthetic_snapshot_is_deterministic():
+    snapshot = synthetic_snapshot(services=3, per_service=4, seed=7)
+    assert snapshot == synthetic_snapshot(services=3, per_service=4, seed=7)
+    catalog = Catalog.from_snapshot("synthetic", snapshot)
+    assert len(catalog.structures) == 12
+    assert all(s.temperature[0]["min"] > s.temperature[0]["max"] for s in catalog.structures)
+
+
+@pytest.fixture
+def synthetic_server():
+    catalog = Catalog.from_snapshot("synthetic", synthetic_snapshot(services=3, per_service=10))
+    server = CatalogHTTPServer(("127.0.0.1", 0), catalog)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_run_load_reports_latency_percentiles(synthetic_server):
+    records = fetch_records(synthetic_server)
+    paths = build_query_mix(records, size=50)
+    assert len(records) == 30
+    assert any(p.startswith("/structures?condition=") for p in paths)
+
+    result = run_load(synthetic_server, paths, qps=200, duration=0.25, concurrency=4)
+
+    assert result.requests == 50
+    assert result.errors == 0
+    assert set(result.statuses) <= {"200", "404"}
+    assert (
+        0 < result.latency_ms["p50"] <= result.latency_ms["p95"] <= result.latency_ms["p99"] <= result.latency_ms["max"]
+    )
+    assert result.to_dict()["throughput_qps"] > 0
+
+
+@pytest.mark.parametrize(
+    ("status", "body", "message"),
+    [
+        (200, b"<html>catalog</html>", "не JSON"),
+        (200, b"[1, 2]", "items"),
+        (200, b'{"items": [1]}', "items"),
+        (404, b'{"error": "not found"}', "HTTP 404"),
+    ],
+)
+def test_fetch_records_rejects_non_api_responses(status, body, message):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        host, port = server.server_address[:2]
+        with pytest.raises(ValueError, match=message):
+            fetch_records(f"http://{host}:{port}")
+    finally:
+        server.shutdown()
+        server.server_close()
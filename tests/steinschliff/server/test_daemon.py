@@ -0,0 +1,159 @@
+import contextlib
+import socket
+import threading
+import time
+
+import pytest
+
+from steinschliff.catalog import Catalog
+from steinschliff.server import CatalogReloader, DaemonServer, fetch_catalog
+from steinschliff.server.daemon import MAX_REQUEST_SIZE, SOCKET_ENV, check_socket_dir, daemon_supported, request
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="нет Unix domain sockets")
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    path = tmp_path / "d.sock"
+    monkeypatch.setenv(SOCKET_ENV, str(path))
+    return path
+
+
+def test_fetch_catalog_falls_back_without_daemon(schliffs_dir, socket_path):
+    assert not socket_path.exists()
+    assert fetch_catalog(schliffs_dir) is None
+
+
+def test_daemon_serves_catalog_snapshot(schliffs_dir, socket_path):
+    catalog = Catalog(schliffs_dir).load()
+    server = DaemonServer(socket_path, catalog)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert request(socket_path, "ping")["structures"] == 3
+
+        remote = fetch_catalog(schliffs_dir)
+        assert remote is not None
+        assert remote.loaded
+        assert remote.services == catalog.services
+        assert remote.service_metadata == catalog.service_metadata
+        assert remote.condition_counts == catalog.condition_counts
+        assert list(remote.select(service="Fischer Ski")) == ["fischer"]
+
+        with pytest.raises(ValueError, match="Неизвестная операция"):
+            request(socket_path, "reindex")
+
+        request(socket_path, "shutdown")
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    finally:
+        server.server_close()
+    assert not socket_path.exists()
+    assert fetch_catalog(schliffs_dir) is None
+
+
+def test_fetch_catalog_ignores_stale_daemon_catalog(schliffs_dir, socket_path, write_schliffs):
+    server = DaemonServer(socket_path, Catalog(schliffs_dir).load())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert fetch_catalog(schliffs_dir) is not None
+
+        # Демон без перезагрузки не видит новый файл — клиент грузит каталог сам.
+        write_schliffs(schliffs_dir, {"uventa/u2.yaml": {"name": "U2", "description": "New"}})
+        assert fetch_catalog(schliffs_dir) is None
+
+        server.swap_catalog(Catalog(schliffs_dir).load())
+        remote = fetch_catalog(schliffs_dir)
+        assert remote is not None
+        assert len(remote.structures) == 4
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_request_bounds_response_size_and_time(socket_path):
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen()
+    replies = [b"x" * 100 + b"\n", b'{"ok": true']
+
+    def serve():
+        for reply in replies:
+            conn, _ = listener.accept()
+            # Клиент может закрыть соединение, не дочитав ответ.
+            with conn, contextlib.suppress(OSError):
+                conn.recv(MAX_REQUEST_SIZE)
+                conn.sendall(reply)
+                # Вторая строка не завершена: клиент должен сдаться по таймауту.
+                time.sleep(0.5)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(ValueError, match="больше 64 байт"):
+            request(socket_path, "snapshot", max_size=64)
+        with pytest.raises(TimeoutError):
+            request(socket_path, "snapshot", timeout=0.2)
+    finally:
+        thread.join(timeout=5)
+        listener.close()
+
+
+def test_untrusted_socket_dir_is_refused(schliffs_dir, tmp_path, monkeypatch):
+    run_dir = tmp_path / "run"
+    run_dir.mkdir(mode=0o700)
+    path = run_dir / "d.sock"
+    monkeypatch.setenv(SOCKET_ENV, str(path))
+    server = DaemonServer(path, Catalog(schliffs_dir).load())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert fetch_catalog(schliffs_dir) is not None
+
+        # Директорию могли создать открытой для всех — снимку из неё доверять нельзя.
+        run_dir.chmod(0o733)
+        assert fetch_catalog(schliffs_dir) is None
+        with pytest.raises(PermissionError, match="доступна другим"):
+            check_socket_dir(run_dir)
+
+        link = tmp_path / "link"
+        link.symlink_to(run_dir, target_is_directory=True)
+        run_dir.chmod(0o700)
+        monkeypatch.setenv(SOCKET_ENV, str(link / "d.sock"))
+        assert fetch_catalog(schliffs_dir) is None
+        with pytest.raises(PermissionError, match="symlink"):
+            DaemonServer(link / "other.sock", Catalog(schliffs_dir).load())
+    finally:
+        run_dir.chmod(0o700)
+        server.shutdown()
+        server.server_close()
+
+
+def test_reload_advertises_files_seen_before_load(schliffs_dir, socket_path, monkeypatch, write_schliffs):
+    server = DaemonServer(socket_path, Catalog(schliffs_dir).load())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    reloader = CatalogReloader(schliffs_dir, server.swap_catalog)
+    original = Catalog.load
+
+    def load_then_edit(self):
+        loaded = original(self)
+        # Файл меняется, когда каталог уже прочитан, но ещё не подменён.
+        write_schliffs(schliffs_dir, {"uventa/u3.yaml": {"name": "U3", "description": "Late"}})
+        return loaded
+
+    try:
+        write_schliffs(schliffs_dir, {"uventa/u2.yaml": {"name": "U2", "description": "New"}})
+        monkeypatch.setattr(Catalog, "load", load_then_edit)
+        assert reloader.check() is True
+        monkeypatch.setattr(Catalog, "load", original)
+        assert fetch_catalog(schliffs_dir) is None
+
+        assert reloader.check() is True
+        remote = fetch_catalog(schliffs_dir)
+        assert remote is not None
+        assert {s.name for s in remote.services["uventa"]} == {"C1", "U2", "U3"}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,133 @@
+import gzip
+import json
+import threading
+import urllib.request
+from urllib.error import HTTPError
+
+import pytest
+
+from steinschliff.catalog import Catalog
+from steinschliff.server import CatalogAPI, CatalogHTTPServer, CatalogReloader
+from steinschliff.server.http import _accepts_gzip
+
+
+def _payload(response):
+    return json.loads(response.body)
+
+
+def test_api_filters_and_lookup(schliffs_dir):
+    api = CatalogAPI(Catalog(schliffs_dir))
+
+    assert _payload(api.handle("/structures"))["count"] == 3
+    assert _payload(api.handle("/structures", {"service": ["Fischer Ski"]}))["count"] == 2
+    assert [r["name"] for r in _payload(api.handle("/structures", {"condition": ["синий"]}))["items"]] == ["C1", "C1"]
+    assert [r["name"] for r in _payload(api.handle("/structures", {"temperature": ["-7"]}))["items"]] == ["C1"]
+    tagged = _payload(api.handle("/structures", {"tag": ["Холодный", "универсальный"]}))
+    assert [(r["name"], r["service"]) for r in tagged["items"]] == [("C1", "fischer")]
+
+    assert _payload(api.handle("/structures/c1"))["count"] == 2
+    assert _payload(api.handle("/structures/C1", {"service": ["uventa"]}))["count"] == 1
+    assert _payload(api.handle("/stats"))["services"] == {"Fischer Ski": 2, "uventa": 1}
+    blue = next(c for c in _payload(api.handle("/conditions"))["items"] if c["key"] == "blue")
+    assert blue["count"] == 2
+
+    assert api.handle("/structures/X1").status == 404
+    assert api.handle("/structures", {"service": ["nope"]}).status == 404
+    assert _payload(api.handle("/structures", {"service": ["uventa", "fischer"]}))["count"] == 3
+    assert _payload(api.handle("/structures", {"country": ["austria"]}))["count"] == 2
+    assert _payload(api.handle("/structures", {"service": ["fisch*"], "condition": ["bleu"]}))["count"] == 1
+    assert api.handle("/structures", {"condition": ["purple-ish"]}).status == 400
+    assert api.handle("/structures", {"temperature": ["cold"]}).status == 400
+    assert api.handle("/stats") is api.handle("/stats/")
+
+
+@pytest.fixture
+def server(schliffs_dir):
+    server = CatalogHTTPServer(("127.0.0.1", 0), Catalog(schliffs_dir))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _get(server, path, headers=None):
+    host, port = server.server_address[:2]
+    request = urllib.request.Request(f"http://{host}:{port}{path}", headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except HTTPError as err:
+        return err.code, err.headers, err.read()
+
+
+def test_http_etag_and_gzip(server, monkeypatch):
+    monkeypatch.setattr("steinschliff.server.http.GZIP_MIN_SIZE", 1)
+
+    status, headers, body = _get(server, "/structures?condition=blue", {"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body))["count"] == 2
+
+    status, _, body = _get(server, "/structures?condition=blue", {"If-None-Match": headers["ETag"]})
+    assert (status, body) == (304, b"")
+
+    status, headers, body = _get(server, "/structures/P3")
+    assert status == 200
+    assert "Content-Encoding" not in headers
+    assert json.loads(body)["items"][0]["temp_min"] == 15
+
+    assert _get(server, "/nope")[0] == 404
+
+
+@pytest.mark.parametrize(
+    ("header", "accepted"),
+    [
+        ("gzip", True),
+        ("br, GZIP;q=0.5", True),
+        ("gzip; level=1; q=1", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0.00", False),
+        ("gzip; Q=0.", False),
+        ("gzip;q=abc", False),
+        ("deflate, identity", False),
+        (None, False),
+    ],
+)
+def test_accepts_gzip_parses_quality(header, accepted):
+    assert _accepts_gzip(header) is accepted
+
+
+def test_reload_swaps_catalog_on_file_change(server, schliffs_dir, write_schliffs):
+    reloader = CatalogReloader(schliffs_dir, lambda catalog, _tree: server.swap_catalog(catalog))
+    assert reloader.check() is False
+    _, headers, _ = _get(server, "/stats")
+
+    write_schliffs(schliffs_dir, {"uventa/u2.yaml": {"name": "U2", "description": "Warm", "condition": "red"}})
+    assert reloader.check() is True
+
+    status, _, body = _get(server, "/stats", {"If-None-Match": headers["ETag"]})
+    assert status == 200
+    assert json.loads(body)["structures"] == 4
+
+
+def test_reload_retries_after_failed_load(server, schliffs_dir, monkeypatch, write_schliffs):
+    reloader = CatalogReloader(schliffs_dir, lambda catalog, _tree: server.swap_catalog(catalog))
+    write_schliffs(schliffs_dir, {"uventa/u2.yaml": {"name": "U2", "description": "Warm", "condition": "red"}})
+
+    def broken_load(_self):
+        msg = "half-written file"
+        raise OSError(msg)
+
+    original = Catalog.load
+    monkeypatch.setattr(Catalog, "load", broken_load)
+    with pytest.raises(OSError, match="half-written"):
+        reloader.check()
+
+    # Файлы больше не менялись, но следующий опрос должен повторить загрузку.
+    monkeypatch.setattr(Catalog, "load", original)
+    assert reloader.check() is True
+    assert reloader.check() is False
+    status, _, body = _get(server, "/stats")
+    assert status == 200
+    assert json.loads(body)["structures"] == 4
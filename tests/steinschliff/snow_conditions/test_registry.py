@@ -1,4 +1,12 @@
-from steinschliff.snow_conditions import get_name_ru, get_valid_keys, normalize_condition_input
+from steinschliff.snow_conditions import (
+    DEFAULT_SNOW_CONDITION_KEYS,
+    compile_registry,
+    get_name_ru,
+    get_registry,
+    get_valid_keys,
+    normalize_condition_input,
+    temperature_ranges,
+)
 
 
 def test_get_valid_keys_contains_known_keys():
@@ -19,3 +27,61 @@ def test_normalize_condition_input_supports_ru_color_names():
 
 def test_normalize_condition_input_falls_back_to_lower():
     assert normalize_condition_input("UnknownValue") == "unknownvalue"
+
+
+def test_registry_is_compiled_once_with_frozen_tables():
+    registry = get_registry()
+    assert get_registry() is registry
+    assert isinstance(registry.key_set, frozenset)
+    assert registry.keys == tuple(sorted(registry.key_set))
+    assert registry.temperatures["blue"] == ((-12.0, 0.0),)
+    assert registry.temperatures["brown"] == ()
+    assert get_valid_keys() == list(registry.keys)
+    assert get_valid_keys() is not get_valid_keys()
+
+
+def test_compile_registry_normalizes_ranges_and_synonyms():
+    registry = compile_registry(
+        {
+            "blue": {"name": "Blue", "synonyms": ["Powdery"], "temperature": [{"min": 0, "max": -12}]},
+            "red": {"name_ru": "Мокрый", "temperature": [{"min": 0, "max": None}, {"min": True, "max": None}]},
+        }
+    )
+    assert registry.keys == ("blue", "red")
+    assert registry.temperatures == {"blue": ((-12.0, 0.0),), "red": ((0.0, 0.0),)}
+    assert registry.normalize(" powdery ") == "blue"
+    assert registry.normalize("мокрый") == "red"
+    assert registry.normalize("красный") == "red"
+    assert compile_registry({}).keys == tuple(DEFAULT_SNOW_CONDITION_KEYS)
+
+
+def test_registry_corrects_typos_and_suggests():
+    registry = compile_registry({"blue": {"name_ru": "Синий", "synonyms": ["powdery"]}, "brown": {}, "red": {}})
+    assert registry.normalize("bleu", fuzzy=True) == "blue"
+    assert registry.normalize("powdry", fuzzy=True) == "blue"
+    assert registry.normalize("синй", fuzzy=True) == "blue"
+    assert registry.match("bleu").exact is False
+    assert registry.match("brwn").value == "brown"
+    assert registry.normalize("purple", fuzzy=True) == "purple"
+
+
+def test_normalize_is_exact_by_default():
+    registry = compile_registry({"blue": {"synonyms": ["powdery"]}, "red": {}})
+    assert registry.normalize("Powdery") == "blue"
+    assert registry.normalize("bleu") == "bleu"
+    assert normalize_condition_input("bleu") == "bleu"
+    assert normalize_condition_input("bleu", fuzzy=True) == "blue"
+
+
+def test_temperature_ranges_single_end_is_a_point_and_bool_is_ignored():
+    assert temperature_ranges(
+        [
+            {"min": 0, "max": -12},
+            {"min": 5, "max": None},
+            {"max": -3},
+            {"min": True, "max": False},
+            {"min": None, "max": None},
+            "warm",
+        ]
+    ) == ((-12.0, 0.0), (5.0, 5.0), (-3.0, -3.0))
+    assert temperature_ranges(None) == ()
@@ -0,0 +1,78 @@
+import pytest
+
+from steinschliff.models import StructureInfo
+from steinschliff.sorting import SortIndex, collation_key, parse_sort_spec, structure_sort_key
+
+
+def _structure(name, *, high=None, country=""):
+    temperature = [{"min": -20, "max": high}] if high is not None else []
+    return StructureInfo(name=name, temperature=temperature, country=country, file_path=f"{name}.yaml")
+
+
+@pytest.fixture
+def structures():
+    return [
+        _structure("ёлка", high=-5, country="Россия"),
+        _structure("Beta", high=5, country="Austria"),
+        _structure("alpha", country="Austria"),
+        _structure("Éclair", high=-5, country="Россия"),
+        _structure("елка", high=0, country="Россия"),
+    ]
+
+
+def _names(items):
+    return [s.name for s in items]
+
+
+def test_collation_key_ignores_case_and_diacritics():
+    assert collation_key("Ёлка") == collation_key("елка") == "елка"
+    assert collation_key("Éclair") == "eclair"
+    assert structure_sort_key("name", _structure("a2")) < structure_sort_key("name", _structure("B"))
+    assert structure_sort_key("temperature", _structure("X")) == float("inf")
+
+
+def test_parse_sort_spec():
+    assert parse_sort_spec("country,-name") == (("country", False), ("name", True))
+    assert parse_sort_spec(["-temperature"]) == (("temperature", True),)
+    with pytest.raises(ValueError, match="Некорректная сортировка"):
+        parse_sort_spec(" , -")
+
+
+def test_sort_single_multi_and_reverse(structures):
+    index = SortIndex(structures)
+
+    assert _names(index.sort(structures, "name")) == ["alpha", "Beta", "Éclair", "елка", "ёлка"]
+    assert _names(index.sort(structures, "temperature")) == ["Beta", "елка", "ёлка", "Éclair", "alpha"]
+    assert _names(index.sort(structures, "-temperature")) == ["alpha", "ёлка", "Éclair", "елка", "Beta"]
+    assert _names(index.sort(structures, ("country", "-temperature"))) == [
+        "alpha",
+        "Beta",
+        "ёлка",
+        "Éclair",
+        "елка",
+    ]
+    assert [index.structures[i].name for i in index.order("name")] == _names(index.sort(structures, "name"))
+
+
+def test_ranks_and_orders_are_computed_once(structures, monkeypatch):
+    index = SortIndex(structures)
+    calls = []
+    original = structure_sort_key
+    monkeypatch.setattr("steinschliff.sorting.structure_sort_key", lambda f, s: calls.append(f) or original(f, s))
+
+    index.sort(structures, "country,name")
+    index.sort(structures[:2], "name,country")
+    index.sort(structures, "-country,-name")
+    assert len(calls) == 2 * len(structures)
+    assert index.ranks("country") == [1, 0, 0, 1, 1]
+
+
+def test_sort_falls_back_for_foreign_structures(structures):
+    index = SortIndex(structures)
+    foreign = _structure("Aardvark", high=10)
+
+    assert _names(index.sort([structures[1], foreign], "name")) == ["Aardvark", "Beta"]
+    assert index.key("name")(foreign) == len(structures)
+    assert foreign not in index
+    assert structures[0] in index
+    assert list(index.sort_services({"svc": structures[:3]}, "temperature")) == ["svc"]